@@ -0,0 +1,162 @@
+/**
+ * Answer-analysis microbenchmark.
+ *
+ * Compares the Admin dashboard's original analysis, three separate passes
+ * that each resolve every answer with `questions.find` (and `modules.find`),
+ * against `summarizeAttempts`, which builds all three tallies in one walk
+ * through `questionIndex`. Both are fed the same synthetic attempts.
+ *
+ *   npm run bench:analytics -- [attempts=50000] [rounds=5]
+ */
+import { questions, modules } from '@/data/questions-updated';
+import {
+  summarizeAttempts,
+  toQuestionAnalysis,
+  toTopicAnalysis,
+  toCategoryAnalysis,
+} from '@/lib/attemptAnalytics';
+
+type Attempt = { qualified: boolean; percentage: number; answers: Record<number, string> };
+
+const OPTIONS = ['A', 'B', 'C', 'D'] as const;
+
+// Small deterministic PRNG so every run measures the same data
+const mulberry32 = (seed: number) => () => {
+  seed |= 0;
+  seed = (seed + 0x6d2b79f5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+const syntheticAttempts = (count: number, perAttempt = 20): Attempt[] => {
+  const random = mulberry32(20260112);
+  return Array.from({ length: count }, () => {
+    const answers: Record<number, string> = {};
+    let correct = 0;
+    while (Object.keys(answers).length < perAttempt) {
+      const q = questions[Math.floor(random() * questions.length)];
+      if (answers[q.id]) continue;
+      // Roughly 70% right, like the real attempt history
+      const option = random() < 0.7 ? q.correct_option : OPTIONS[Math.floor(random() * 4)];
+      answers[q.id] = option;
+      if (option === q.correct_option) correct++;
+    }
+    const percentage = Math.round((correct / perAttempt) * 100);
+    return { qualified: percentage >= 60, percentage, answers };
+  });
+};
+
+// The three useMemo bodies Admin.tsx used before the shared aggregator
+const legacyAnalysis = (attempts: Attempt[]) => {
+  const analysis: Record<number, { question: string; correct: number; wrong: number; total: number; options: Record<string, number> }> = {};
+  attempts.forEach(attempt => {
+    Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
+      const questionId = parseInt(qId);
+      const question = questions.find(q => q.id === questionId);
+      if (!question) return;
+      if (!analysis[questionId]) {
+        analysis[questionId] = { question: question.question_text, correct: 0, wrong: 0, total: 0, options: { 'A': 0, 'B': 0, 'C': 0, 'D': 0 } };
+      }
+      analysis[questionId].total++;
+      analysis[questionId].options[selectedOption]++;
+      if (selectedOption === question.correct_option) analysis[questionId].correct++;
+      else analysis[questionId].wrong++;
+    });
+  });
+  const questionData = Object.entries(analysis).map(([id, data]) => ({
+    id: parseInt(id),
+    ...data,
+    compliance: Math.round((data.correct / data.total) * 100) || 0,
+    wrong_percentage: -Math.round((data.wrong / data.total) * 100) || 0,
+  })).sort((a, b) => a.id - b.id);
+
+  const topicStats: Record<string, { moduleName: string; correct: number; total: number }> = {};
+  attempts.forEach(attempt => {
+    Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
+      const questionId = parseInt(qId);
+      const question = questions.find(q => q.id === questionId);
+      if (!question) return;
+      const moduleData = modules.find(m => m.id === question.module);
+      if (!topicStats[question.module]) {
+        topicStats[question.module] = { moduleName: moduleData ? moduleData.name : question.module, correct: 0, total: 0 };
+      }
+      topicStats[question.module].total++;
+      if (selectedOption === question.correct_option) topicStats[question.module].correct++;
+    });
+  });
+  const topicData = Object.entries(topicStats).map(([id, data]) => ({
+    id,
+    name: data.moduleName,
+    compliance: Math.round((data.correct / data.total) * 100) || 0,
+    total: data.total,
+  })).sort((a, b) => a.compliance - b.compliance);
+
+  const categories: Record<string, { correct: number; total: number }> = {};
+  attempts.forEach(attempt => {
+    Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
+      const questionId = parseInt(qId);
+      const question = questions.find(q => q.id === questionId);
+      if (!question) return;
+      if (!categories[question.category]) categories[question.category] = { correct: 0, total: 0 };
+      categories[question.category].total++;
+      if (selectedOption === question.correct_option) categories[question.category].correct++;
+    });
+  });
+  const categoryData = Object.entries(categories).map(([name, data]) => ({
+    name,
+    value: Math.round((data.correct / data.total) * 100) || 0,
+    count: data.total,
+  })).sort((a, b) => b.value - a.value);
+
+  return { questionData, topicData, categoryData };
+};
+
+const singlePassAnalysis = (attempts: Attempt[]) => {
+  const summary = summarizeAttempts(attempts);
+  return {
+    questionData: toQuestionAnalysis(summary),
+    topicData: toTopicAnalysis(summary),
+    categoryData: toCategoryAnalysis(summary),
+  };
+};
+
+const time = (fn: () => unknown, rounds: number) => {
+  const samples: number[] = [];
+  for (let i = 0; i < rounds; i++) {
+    const started = performance.now();
+    fn();
+    samples.push(performance.now() - started);
+  }
+  samples.sort((a, b) => a - b);
+  return { median: samples[Math.floor(samples.length / 2)], min: samples[0] };
+};
+
+export default (args: string[]) => {
+  const count = Number(args[0] ?? 50000);
+  const rounds = Number(args[1] ?? 5);
+  const attempts = syntheticAttempts(count);
+
+  // Same numbers either way before anything is timed
+  const legacy = legacyAnalysis(attempts);
+  const single = singlePassAnalysis(attempts);
+  const comparable = (result: typeof legacy) => JSON.stringify([
+    result.questionData.map(q => [q.id, q.correct, q.total, q.options, q.compliance]),
+    [...result.topicData].sort((a, b) => a.id.localeCompare(b.id)),
+    [...result.categoryData].sort((a, b) => a.name.localeCompare(b.name)),
+  ]);
+  if (comparable(legacy) !== comparable(single)) {
+    throw new Error('Single-pass analysis does not match the original three-pass analysis');
+  }
+
+  const before = time(() => legacyAnalysis(attempts), rounds);
+  const after = time(() => singlePassAnalysis(attempts), rounds);
+  const row = (name: string, t: { median: number; min: number }) =>
+    `${name.padEnd(34)}${t.median.toFixed(1).padStart(10)} ms${t.min.toFixed(1).padStart(10)} ms`;
+
+  console.log(`Answer analysis, ${count} attempts x 20 answers, ${rounds} rounds`);
+  console.log(`${''.padEnd(34)}${'median'.padStart(13)}${'min'.padStart(13)}`);
+  console.log(row('three passes + questions.find', before));
+  console.log(row('single pass + questionIndex', after));
+  console.log(`speed-up: ${(before.median / after.median).toFixed(1)}x`);
+};
@@ -0,0 +1,89 @@
+/**
+ * Question-paper sampler benchmark.
+ *
+ * Compares the original getRandomQuestions, which re-filters the bank per
+ * category and shuffles with `sort(() => Math.random() - 0.5)` three times,
+ * against the seeded sampler over precomputed buckets:
+ *
+ * - speed: papers drawn per second;
+ * - uniformity: within each category every question should be picked equally
+ *   often. Reported as chi-square / degrees of freedom over all categories,
+ *   which stays near 1 for a uniform draw and grows with bias;
+ * - reproducibility: the same seed must give the same paper.
+ *
+ *   npm run bench:sampler -- [papers=200000] [count=20]
+ */
+import { questions, getRandomQuestions, type Question } from '@/data/questions-updated';
+import { createQuestionSampler } from '@/lib/questionSampler';
+
+// getRandomQuestions before the sampler
+const legacyRandomQuestions = (count: number): Question[] => {
+  const categories = [...new Set(questions.map(q => q.category))];
+  const questionsPerCategory = Math.floor(count / categories.length);
+  const remainder = count % categories.length;
+  let selectedQuestions: Question[] = [];
+  const shuffledCategories = [...categories].sort(() => Math.random() - 0.5);
+  shuffledCategories.forEach((category, index) => {
+    const categoryQuestions = questions.filter(q => q.category === category);
+    const shuffledCategoryQuestions = [...categoryQuestions].sort(() => Math.random() - 0.5);
+    let questionsToTake = questionsPerCategory;
+    if (index < remainder) questionsToTake += 1;
+    selectedQuestions = [...selectedQuestions, ...shuffledCategoryQuestions.slice(0, Math.min(questionsToTake, categoryQuestions.length))];
+  });
+  return selectedQuestions.sort(() => Math.random() - 0.5).slice(0, count);
+};
+
+const time = (papers: number, draw: (i: number) => Question[]) => {
+  const started = performance.now();
+  for (let i = 0; i < papers; i++) draw(i);
+  return performance.now() - started;
+};
+
+const uniformity = (papers: number, draw: (i: number) => Question[]) => {
+  const picks = new Map<number, number>();
+  for (let i = 0; i < papers; i++) {
+    draw(i).forEach(q => picks.set(q.id, (picks.get(q.id) ?? 0) + 1));
+  }
+  const { byCategory } = createQuestionSampler(questions);
+  let chiSquare = 0;
+  let degrees = 0;
+  byCategory.forEach(list => {
+    if (list.length < 2) return;
+    const counts = list.map(q => picks.get(q.id) ?? 0);
+    const expected = counts.reduce((sum, n) => sum + n, 0) / list.length;
+    if (expected === 0) return;
+    counts.forEach(n => { chiSquare += (n - expected) ** 2 / expected; });
+    degrees += list.length - 1;
+  });
+  return chiSquare / Math.max(degrees, 1);
+};
+
+export default (args: string[]) => {
+  const papers = Number(args[0] ?? 200000);
+  const count = Number(args[1] ?? 20);
+
+  // Warm up both paths before timing
+  time(2000, () => legacyRandomQuestions(count));
+  time(2000, i => getRandomQuestions(count, i));
+
+  const legacyMs = time(papers, () => legacyRandomQuestions(count));
+  const sampledMs = time(papers, i => getRandomQuestions(count, i));
+
+  const samples = Math.min(papers, 100000);
+  const legacyChi = uniformity(samples, () => legacyRandomQuestions(count));
+  const sampledChi = uniformity(samples, i => getRandomQuestions(count, 0x9e3779b9 ^ i));
+
+  // An audit rebuilds the paper from the stored seed; it must come out identical
+  for (let seed = 0; seed < 1000; seed++) {
+    const first = getRandomQuestions(count, seed).map(q => q.id).join(',');
+    const again = getRandomQuestions(count, seed).map(q => q.id).join(',');
+    if (first !== again) throw new Error(`Seed ${seed} gave two different papers`);
+  }
+
+  console.log(`${questions.length} questions, ${count} per paper, ${papers} papers`);
+  console.table({
+    legacy: { 'papers/s': Math.round(papers / (legacyMs / 1000)), 'us/paper': +(legacyMs * 1000 / papers).toFixed(2), 'chi2/df': +legacyChi.toFixed(2) },
+    sampler: { 'papers/s': Math.round(papers / (sampledMs / 1000)), 'us/paper': +(sampledMs * 1000 / papers).toFixed(2), 'chi2/df': +sampledChi.toFixed(2) },
+  });
+  console.log(`speed-up: ${(legacyMs / sampledMs).toFixed(1)}x`);
+};
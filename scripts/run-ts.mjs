@@ -0,0 +1,31 @@
+// Runs a TypeScript module from this repo under Node, resolved and
+// transformed by Vite so `@/` imports and TS syntax work as in the app.
+//
+//   node scripts/run-ts.mjs scripts/bench/attemptAnalytics.bench.ts [args...]
+import { createServer } from 'vite';
+import path from 'node:path';
+
+const [entry, ...args] = process.argv.slice(2);
+if (!entry) {
+  console.error('Usage: node scripts/run-ts.mjs <file.ts> [args...]');
+  process.exit(1);
+}
+
+const server = await createServer({
+  mode: 'test',
+  logLevel: 'error',
+  server: { middlewareMode: true, hmr: false },
+  appType: 'custom',
+  optimizeDeps: { noDiscovery: true, include: [] },
+});
+
+try {
+  const mod = await server.ssrLoadModule(path.resolve(entry));
+  if (typeof mod.default === 'function') await mod.default(args);
+} catch (error) {
+  server.ssrFixStacktrace(error);
+  console.error(error);
+  process.exitCode = 1;
+} finally {
+  await server.close();
+}
@@ -3,27 +3,35 @@ import { Toaster as Sonner } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
 import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
 import { BrowserRouter, Routes, Route } from "react-router-dom";
+import { lazy, Suspense } from "react";
+import { Loader2 } from "lucide-react";
 import { AuthProvider } from "@/hooks/useAuth";
 import Index from "./pages/Index";
-import Auth from "./pages/Auth";
-
-
 import NotFound from "./pages/NotFound";
-import { UserPage } from "./components/User";
-import Admin from "./components/Admin";
 import Analytics from "./components/Analytics";
-
-import Presence from "./Presence/Presence";
-import About from "./About/About";
-import Contact from "./components/contact";
-import FeedbackForm from "./components/FeedbackForm";
-import Grievance from "./components/Grievance";
 import ProtectedRoute from "./components/ProtectedRoute";
 
-import Privacy from "./components/Privacy";
-import Engagement from "./components/Endorsment/Endorsment";
-import Assesement from "./components/Endorsment/components/Assesement";
+// Everything but the landing page is its own chunk, fetched on first visit,
+// so a candidate does not download the admin dashboard to see the home page
+const Auth = lazy(() => import("./pages/Auth"));
+const UserPage = lazy(() => import("./components/User").then(m => ({ default: m.UserPage })));
+const Admin = lazy(() => import("./components/Admin"));
 
+const Presence = lazy(() => import("./Presence/Presence"));
+const About = lazy(() => import("./About/About"));
+const Contact = lazy(() => import("./components/contact"));
+const FeedbackForm = lazy(() => import("./components/FeedbackForm"));
+const Grievance = lazy(() => import("./components/Grievance"));
+
+const Privacy = lazy(() => import("./components/Privacy"));
+const Engagement = lazy(() => import("./components/Endorsment/Endorsment"));
+const Assesement = lazy(() => import("./components/Endorsment/components/Assesement"));
+
+const RouteFallback = () => (
+  <div className="min-h-screen flex items-center justify-center">
+    <Loader2 className="h-10 w-10 text-teal-500 animate-spin" />
+  </div>
+);
 
 const queryClient = new QueryClient();
 
@@ -35,59 +43,61 @@ const App = () => (
         <Sonner />
         <BrowserRouter future={{ v7_startTransition: true, v7_relativeSplatPath: true }}>
            <Analytics />
-          <Routes>
-            <Route path="/" element={<Index />} />
-            <Route path="/auth" element={<Auth />} />
-            <Route 
-              path="/admin" 
-              element={
-                <ProtectedRoute>
-                  <Admin />
-                </ProtectedRoute>
-              } 
-            />
-            <Route 
-              path="/user" 
-              element={
-                <ProtectedRoute>
-                  <UserPage />
-                </ProtectedRoute>
-              } 
-            />
-            <Route path="/about" element={<About />} />
-            <Route path="/presence" element={<Presence />} />
-            <Route path="/contact" element={<Contact />} />
-            <Route path="/feedback" element={<FeedbackForm />} />
-            <Route path="/grievance" element={<Grievance />} />
-            <Route 
-              path="/engagement" 
-              element={
-                <ProtectedRoute>
-                  <Engagement />
-                </ProtectedRoute>
-              } 
-            />
-            <Route 
-              path="/engagement/assesement" 
-              element={
-                <ProtectedRoute>
-                  <Assesement/>
-                </ProtectedRoute>
-              } 
-            />
-            <Route 
-              path="/user" 
-              element={
-                <ProtectedRoute>
-                  <UserPage/>
-                </ProtectedRoute>
-              } 
-            />
-            <Route path="/privacy" element={<Privacy />} />
+          <Suspense fallback={<RouteFallback />}>
+            <Routes>
+              <Route path="/" element={<Index />} />
+              <Route path="/auth" element={<Auth />} />
+              <Route 
+                path="/admin" 
+                element={
+                  <ProtectedRoute>
+                    <Admin />
+                  </ProtectedRoute>
+                } 
+              />
+              <Route 
+                path="/user" 
+                element={
+                  <ProtectedRoute>
+                    <UserPage />
+                  </ProtectedRoute>
+                } 
+              />
+              <Route path="/about" element={<About />} />
+              <Route path="/presence" element={<Presence />} />
+              <Route path="/contact" element={<Contact />} />
+              <Route path="/feedback" element={<FeedbackForm />} />
+              <Route path="/grievance" element={<Grievance />} />
+              <Route 
+                path="/engagement" 
+                element={
+                  <ProtectedRoute>
+                    <Engagement />
+                  </ProtectedRoute>
+                } 
+              />
+              <Route 
+                path="/engagement/assesement" 
+                element={
+                  <ProtectedRoute>
+                    <Assesement/>
+                  </ProtectedRoute>
+                } 
+              />
+              <Route 
+                path="/user" 
+                element={
+                  <ProtectedRoute>
+                    <UserPage/>
+                  </ProtectedRoute>
+                } 
+              />
+              <Route path="/privacy" element={<Privacy />} />
 
-            {/* ADD ALL CUSTOM ROUTES ABOVE THE CATCH-ALL "*" ROUTE */}
-            <Route path="*" element={<NotFound />} />
-          </Routes>
+              {/* ADD ALL CUSTOM ROUTES ABOVE THE CATCH-ALL "*" ROUTE */}
+              <Route path="*" element={<NotFound />} />
+            </Routes>
+          </Suspense>
         </BrowserRouter>
       </TooltipProvider>
     </AuthProvider>
@@ -1,6 +1,8 @@
 import { useState, useEffect, useMemo, useCallback, lazy, Suspense, memo, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '@/hooks/useAuth';
+import { useAdminAttempts, type AttemptStatusFilter } from '@/hooks/useAdminAttempts';
+import { useAttemptRollup } from '@/hooks/useAttemptRollup';
 import { supabase } from '@/integrations/supabase/client';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
@@ -20,7 +22,25 @@ import {
   AlertDialogTitle,
 } from "@/components/ui/alert-dialog";
 import { useToast } from '@/hooks/use-toast';
-import { questions, modules } from '@/data/questions';
+import { questionIndex } from '@/data/questions-updated';
+import {
+  applyAttempt,
+  summarizeAttempts,
+  toAdminStats,
+  toCategoryAnalysis,
+  toQuestionAnalysis,
+  toTopicAnalysis,
+  toDemographicAnalysis,
+  type AdminStats,
+  type CategoryAnalysis,
+  type DashboardAnalytics,
+  type DemographicAnalysis,
+  type QuestionAnalysis,
+  type RollupDimension,
+  type RollupTotal,
+  type TopicAnalysis,
+} from '@/lib/attemptAnalytics';
+import { downloadAttemptsCsv } from '@/lib/attemptExport';
 import ErrorBoundary from './ErrorBoundary';
 import {
   BarChart,
@@ -95,54 +115,6 @@ interface TestAttemptWithProfile {
   userDetails?: UserDetails | null;
 }
 
-/**
- * @interface AdminStats
- * Aggregate statistics for the admin dashboard.
- */
-interface AdminStats {
-  total: number;
-  qualified: number;
-  notQualified: number;
-  averageScore: number;
-}
-
-/**
- * @interface QuestionAnalysis
- * Detailed performance metrics for an individual question.
- */
-interface QuestionAnalysis {
-  id: number;
-  question: string;
-  correct: number;
-  wrong: number;
-  total: number;
-  options: Record<string, number>;
-  compliance: number;
-  wrong_percentage: number;
-  difficulty?: number;
-}
-
-/**
- * @interface TopicAnalysis
- * Aggregated performance metrics for a specific training module/topic.
- */
-interface TopicAnalysis {
-  id: string;
-  name: string;
-  compliance: number;
-  total: number;
-}
-
-/**
- * @interface CategoryAnalysis
- * Aggregated performance metrics for a specific category.
- */
-interface CategoryAnalysis {
-  name: string;
-  value: number;
-  count: number;
-}
-
 /**
  * @interface Suggestion
  * Training recommendation based on performance analysis.
@@ -193,6 +165,12 @@ const StatCard = memo(({ label, value, icon: Icon, colorClass, bgImage }: {
 
 StatCard.displayName = 'StatCard';
 
+const DEMOGRAPHIC_LABELS: Record<RollupDimension, string> = {
+  state: 'State',
+  city: 'City',
+  process_allocated: 'Process',
+};
+
 /**
  * ChartsSection component wraps all the analysis charts.
  * This is intended to be used within a Suspense boundary if lazy loaded.
@@ -208,7 +186,8 @@ const ChartsSection = memo(({
   currentPage,
   setCurrentPage,
   itemsPerPage,
-  setItemsPerPage
+  setItemsPerPage,
+  demographicRows
 }: {
   chartType: 'bar' | 'pie' | 'line';
   setChartType: (type: 'bar' | 'pie' | 'line') => void;
@@ -221,7 +200,14 @@ const ChartsSection = memo(({
   setCurrentPage: (page: number) => void;
   itemsPerPage: number;
   setItemsPerPage: (count: number) => void;
+  demographicRows: Record<RollupDimension, RollupTotal[]>;
 }) => {
+  const [demographic, setDemographic] = useState<RollupDimension>('state');
+  const demographicData = useMemo(
+    () => toDemographicAnalysis(demographicRows[demographic]),
+    [demographicRows, demographic]
+  );
+
   const paginatedData = useMemo(() => {
     const startIndex = (currentPage - 1) * itemsPerPage;
     return questionAnalysisData.slice(startIndex, startIndex + itemsPerPage);
@@ -495,6 +481,57 @@ const ChartsSection = memo(({
           </div>
         </CardContent>
       </Card>
+
+      <Card className="border-none shadow-xl bg-white overflow-hidden lg:col-span-2">
+        <CardHeader className="bg-gray-50/50 border-b border-gray-100 flex flex-row items-center justify-between space-y-0">
+          <CardTitle className="text-lg flex items-center gap-2">
+            <Users className="w-5 h-5 text-cyan-600" aria-hidden="true" />
+            Candidates by {DEMOGRAPHIC_LABELS[demographic]}
+          </CardTitle>
+          <div className="flex bg-gray-100 p-1 rounded-lg border border-gray-200" role="tablist" aria-label="Demographic breakdown">
+            {(Object.keys(DEMOGRAPHIC_LABELS) as RollupDimension[]).map(dimension => (
+              <Button
+                key={dimension}
+                variant={demographic === dimension ? 'default' : 'ghost'}
+                size="sm"
+                onClick={() => setDemographic(dimension)}
+                className="h-8 px-3"
+                role="tab"
+                aria-selected={demographic === dimension}
+              >
+                {DEMOGRAPHIC_LABELS[dimension]}
+              </Button>
+            ))}
+          </div>
+        </CardHeader>
+        <CardContent className="pt-6">
+          <div className="h-[400px] w-full">
+            {demographicData.length > 0 ? (
+              <ResponsiveContainer width="100%" height="100%">
+                <BarChart data={demographicData} margin={{ top: 20, right: 30, left: 20, bottom: 60 }}>
+                  <CartesianGrid strokeDasharray="3 3" vertical={false} stroke="#f0f0f0" />
+                  <XAxis dataKey="name" interval={0} angle={-30} textAnchor="end" tick={{ fontSize: 11 }} />
+                  <YAxis allowDecimals={false} tick={{ fontSize: 12 }} />
+                  <Tooltip
+                    labelFormatter={(label, payload) => {
+                      const data = payload?.[0]?.payload as DemographicAnalysis | undefined;
+                      return data ? `${label} (avg. score ${data.averageScore}%)` : label;
+                    }}
+                  />
+                  <Legend verticalAlign="top" height={36} />
+                  <Bar dataKey="qualified" stackId="a" fill="#14b8a6" name="Qualified" />
+                  <Bar dataKey="notQualified" stackId="a" fill="#f87171" name="Not Qualified" radius={[4, 4, 0, 0]} />
+                </BarChart>
+              </ResponsiveContainer>
+            ) : (
+              <div className="h-full flex flex-col items-center justify-center text-gray-400">
+                <Users className="w-12 h-12 mb-4 opacity-10" />
+                <p className="text-sm font-medium">No candidate data available yet.</p>
+              </div>
+            )}
+          </div>
+        </CardContent>
+      </Card>
     </div>
 
     {/* Detailed Question Table */}
@@ -516,7 +553,7 @@ const ChartsSection = memo(({
                 <div className="space-y-1">
                   <p className="font-medium text-gray-900 leading-relaxed">{q.question}</p>
                   <div className="flex gap-4 ">
-                    <span className="text-[10px] bg-teal-50 text-teal-700 px-2 py-0.5 rounded-full font-bold uppercase tracking-wider">Correct: {questions.find(ques => ques.id === q.id)?.correct_option}</span>
+                    <span className="text-[10px] bg-teal-50 text-teal-700 px-2 py-0.5 rounded-full font-bold uppercase tracking-wider">Correct: {q.correct_option}</span>
                     <span className="text-[10px] bg-gray-100 text-gray-600 px-2 py-0.5 rounded-full font-bold uppercase tracking-wider">Total Attempts: {q.total}</span>
                   </div>
                 </div>
@@ -538,9 +575,9 @@ const ChartsSection = memo(({
               <TableCell className="border-b border-gray-100">
                 <div className="grid grid-cols-2 gap-1 min-w-[120px]">
                   {Object.entries(q.options).map(([opt, count]) => (
-                    <div key={opt} className={`flex items-center gap-1.5 px-2 py-1 rounded border ${questions.find(ques => ques.id === q.id)?.correct_option === opt ? 'bg-teal-100 border-teal-200' : 'bg-gray-50 border-gray-100'}`}>
-                      <div className={questions.find(ques => ques.id === q.id)?.correct_option === opt ? 'text-teal-700' : 'text-gray-400'}>
-                        <span className={`text-[10px] font-black ${questions.find(ques => ques.id === q.id)?.correct_option === opt ? 'text-teal-700' : 'text-gray-400'}`}>{opt}:</span>
+                    <div key={opt} className={`flex items-center gap-1.5 px-2 py-1 rounded border ${q.correct_option === opt ? 'bg-teal-100 border-teal-200' : 'bg-gray-50 border-gray-100'}`}>
+                      <div className={q.correct_option === opt ? 'text-teal-700' : 'text-gray-400'}>
+                        <span className={`text-[10px] font-black ${q.correct_option === opt ? 'text-teal-700' : 'text-gray-400'}`}>{opt}:</span>
                         <span className="text-xs font-bold text-gray-700 ml-1">{count}</span>
                       </div>
                     </div>
@@ -1113,6 +1150,37 @@ const CandidateResultsTable = memo(({
 
 CandidateResultsTable.displayName = 'CandidateResultsTable';
 
+/**
+ * Loads the entire attempt history with profiles and user details.
+ * Only used as the analytics fallback; the table pages through
+ * `useAdminAttempts` and the CSV export streams from `export-attempts`.
+ */
+const fetchAllAttempts = async (): Promise<TestAttemptWithProfile[]> => {
+  // Attempts, profiles and user details joined in the database (admin_attempt_rows)
+  const { data, error } = await supabase
+    .from('admin_attempt_rows')
+    .select('*')
+    .order('completed_at', { ascending: false })
+    .order('id', { ascending: false });
+
+  if (error) throw error;
+
+  return (data ?? []).map(({
+    email, full_name, emp_id,
+    details_id, first_name, last_name, phone_number, gender, state, city, process_allocated,
+    designation, father_name, address, qualification, date_of_birth,
+    ...attempt
+  }) => ({
+    ...attempt,
+    answers: attempt.answers as Record<number, string> | null,
+    profiles: { email, full_name, emp_id },
+    userDetails: details_id ? {
+      id: details_id, user_id: attempt.user_id, first_name, last_name, phone_number, gender, state, city,
+      process_allocated, designation, father_name, address, qualification, date_of_birth,
+    } : null,
+  })) as TestAttemptWithProfile[];
+};
+
 function Admin() {
   const navigate = useNavigate();
   const { toast } = useToast();
@@ -1121,22 +1189,22 @@ function Admin() {
   // console.log("Admin Component - User:", user);
   console.log("user admin", user?.user_metadata?.full_name)
   // console.log("Admin Component - isAdmin:", isAdmin);
-  const [attempts, setAttempts] = useState<TestAttemptWithProfile[]>([]);
-  const [loadingData, setLoadingData] = useState(true);
-  const [stats, setStats] = useState<AdminStats>({
+  const [analytics, setAnalytics] = useState<DashboardAnalytics | null>(null);
+  const stats = useMemo((): AdminStats => analytics ? toAdminStats(analytics) : {
     total: 0,
     qualified: 0,
     notQualified: 0,
     averageScore: 0,
-  });
+  }, [analytics]);
   const [selectedAttempt, setSelectedAttempt] = useState<TestAttemptWithProfile | null>(null);
   const [openDialog, setOpenDialog] = useState(false);
   const [activeTab, setActiveTab] = useState<'table' | 'analysis'>('table');
   const [chartType, setChartType] = useState<'bar' | 'pie' | 'line'>('bar');
-  const [filterStatus, setFilterStatus] = useState<'all' | 'qualified' | 'not_qualified'>('all');
+  const [filterStatus, setFilterStatus] = useState<AttemptStatusFilter>('all');
   const [searchQuery, setSearchQuery] = useState('');
-  const [currentPage, setCurrentPage] = useState(1);
   const [itemsPerPage, setItemsPerPage] = useState(10);
+  const [exporting, setExporting] = useState(false);
+  const [exportProgress, setExportProgress] = useState<number | null>(null);
 
   // Pagination for question analysis table
   const [qCurrentPage, setQCurrentPage] = useState(1);
@@ -1147,167 +1215,61 @@ function Admin() {
   const [attemptToReset, setAttemptToReset] = useState<string | null>(null);
 
   /**
-   * Filtered attempts based on status and search query.
+   * The visible page of candidates. Status filter, search and pagination all
+   * run on the server, so only `itemsPerPage` rows are ever loaded.
    */
-  const filteredAttempts = useMemo(() => {
-    return attempts.filter(attempt => {
-      const matchesStatus = 
-        filterStatus === 'all' || 
-        (filterStatus === 'qualified' && attempt.qualified) || 
-        (filterStatus === 'not_qualified' && !attempt.qualified);
-      
-      const searchLower = searchQuery.toLowerCase();
-      const matchesSearch = 
-        !searchQuery || 
-        (attempt.profiles?.full_name?.toLowerCase().includes(searchLower)) ||
-        (attempt.profiles?.email?.toLowerCase().includes(searchLower)) ||
-        (attempt.profiles?.emp_id?.toLowerCase().includes(searchLower)) ||
-        (attempt.userDetails?.phone_number?.includes(searchQuery));
-
-      return matchesStatus && matchesSearch;
-    });
-  }, [attempts, filterStatus, searchQuery]);
+  const {
+    attempts,
+    total: totalResults,
+    totalPages,
+    currentPage,
+    loading: loadingPage,
+    goToPage,
+    refetch: refetchPage,
+    applyInsert,
+    applyDelete,
+  } = useAdminAttempts<TestAttemptWithProfile>({
+    enabled: Boolean(user && isAdmin),
+    status: filterStatus,
+    search: searchQuery,
+    pageSize: itemsPerPage,
+  });
 
-  /**
-   * Paginated attempts based on filtered results.
-   */
-  const paginatedAttempts = useMemo(() => {
-    const startIndex = (currentPage - 1) * itemsPerPage;
-    return filteredAttempts.slice(startIndex, startIndex + itemsPerPage);
-  }, [filteredAttempts, currentPage, itemsPerPage]);
+  // Largest states, cities and processes, summed from trigger-kept buckets
+  const { totals: demographicRows, refetch: refetchRollup } = useAttemptRollup(Boolean(user && isAdmin));
 
-  const totalPages = Math.ceil(filteredAttempts.length / itemsPerPage);
+  // Attempts this admin already removed locally; their realtime DELETE is a no-op
+  const removedAttemptIds = useRef(new Set<string>());
 
-  // Reset to first page when filters change
-  useEffect(() => {
-    setCurrentPage(1);
-  }, [filterStatus, searchQuery, itemsPerPage]);
+  // Set while the counters load; a realtime change arriving meanwhile marks
+  // them stale, since the snapshot may or may not include it
+  const analyticsLoading = useRef(false);
+  const analyticsStale = useRef(false);
 
   /**
-   * Memoized computation for detailed question-by-question performance analysis.
-   * Calculates correct/wrong counts and compliance percentages for each question.
+   * Question-by-question correct/wrong counts and compliance percentages,
+   * derived from the aggregated dashboard counts.
    */
-  const questionAnalysisData = useMemo((): QuestionAnalysis[] => {
-    const analysis: Record<number, {
-      question: string;
-      correct: number;
-      wrong: number;
-      total: number;
-      options: Record<string, number>;
-    }> = {};
-
-    attempts.forEach(attempt => {
-      if (attempt.answers) {
-        Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
-          const questionId = parseInt(qId);
-          const question = questions.find(q => q.id === questionId);
-          if (!question) return;
-
-          if (!analysis[questionId]) {
-            analysis[questionId] = {
-              question: question.question_text,
-              correct: 0,
-              wrong: 0,
-              total: 0,
-              options: { 'A': 0, 'B': 0, 'C': 0, 'D': 0 }
-            };
-          }
-
-          analysis[questionId].total++;
-          analysis[questionId].options[selectedOption as string]++;
-
-          if (selectedOption === question.correct_option) {
-            analysis[questionId].correct++;
-          } else {
-            analysis[questionId].wrong++;
-          }
-        });
-      }
-    });
-
-    return Object.entries(analysis).map(([id, data]) => ({
-      id: parseInt(id),
-      ...data,
-      compliance: Math.round((data.correct / data.total) * 100) || 0,
-      wrong_percentage: -Math.round((data.wrong / data.total) * 100) || 0
-    })).sort((a, b) => a.id - b.id);
-  }, [attempts]);
+  const questionAnalysisData = useMemo(
+    (): QuestionAnalysis[] => (analytics ? toQuestionAnalysis(analytics) : []),
+    [analytics]
+  );
 
   /**
-   * Memoized computation for module-level performance analysis.
-   * Groups questions by their respective training modules.
+   * Module-level performance, grouped by training module.
    */
-  const topicAnalysisData = useMemo((): TopicAnalysis[] => {
-    const topicStats: Record<string, {
-      moduleName: string;
-      correct: number;
-      total: number;
-    }> = {};
-
-    attempts.forEach(attempt => {
-      if (attempt.answers) {
-        Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
-          const questionId = parseInt(qId);
-          const question = questions.find(q => q.id === questionId);
-          if (!question) return;
-
-          const moduleData = modules.find(m => m.id === question.module);
-          const moduleName = moduleData ? moduleData.name : question.module;
-
-          if (!topicStats[question.module]) {
-            topicStats[question.module] = {
-              moduleName: moduleName,
-              correct: 0,
-              total: 0,
-            };
-          }
-
-          topicStats[question.module].total++;
-          if (selectedOption === question.correct_option) {
-            topicStats[question.module].correct++;
-          }
-        });
-      }
-    });
-
-    return Object.entries(topicStats).map(([id, data]) => ({
-      id,
-      name: data.moduleName,
-      compliance: Math.round((data.correct / data.total) * 100) || 0,
-      total: data.total
-    })).sort((a, b) => a.compliance - b.compliance);
-  }, [attempts]);
+  const topicAnalysisData = useMemo(
+    (): TopicAnalysis[] => (analytics ? toTopicAnalysis(analytics) : []),
+    [analytics]
+  );
 
   /**
-   * Memoized computation for category-level performance analysis.
+   * Category-level performance.
    */
-  const categoryAnalysisData = useMemo((): CategoryAnalysis[] => {
-    const categories: Record<string, { correct: number; total: number }> = {};
-    
-    attempts.forEach(attempt => {
-      if (attempt.answers) {
-        Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
-          const questionId = parseInt(qId);
-          const question = questions.find(q => q.id === questionId);
-          if (!question) return;
-
-          if (!categories[question.category]) {
-            categories[question.category] = { correct: 0, total: 0 };
-          }
-          categories[question.category].total++;
-          if (selectedOption === question.correct_option) {
-            categories[question.category].correct++;
-          }
-        });
-      }
-    });
-
-    return Object.entries(categories).map(([name, data]) => ({
-      name,
-      value: Math.round((data.correct / data.total) * 100) || 0,
-      count: data.total
-    })).sort((a, b) => b.value - a.value);
-  }, [attempts]);
+  const categoryAnalysisData = useMemo(
+    (): CategoryAnalysis[] => (analytics ? toCategoryAnalysis(analytics) : []),
+    [analytics]
+  );
 
   /**
    * Memoized computation for overall qualification distribution.
@@ -1358,77 +1320,110 @@ function Admin() {
 
   useEffect(() => {
     if (user && isAdmin) {
-      fetchAttempts();
+      fetchAnalytics();
     }
   }, [user, isAdmin]);
 
-  const fetchAttempts = async () => {
-    setLoadingData(true);
-
+  /**
+   * Loads the dashboard counters. A call made while a load is running joins
+   * it, and a load that saw realtime changes arrive is repeated, so the
+   * counters end up on a snapshot taken after those changes.
+   */
+  const fetchAnalytics = async () => {
+    if (analyticsLoading.current) {
+      analyticsStale.current = true;
+      return;
+    }
+    analyticsLoading.current = true;
     try {
-      // 1. Fetch test attempts with profiles
-      const { data: attemptsData, error: attemptsError } = await supabase
-        .from('test_attempts')
-        .select(`
-          *,
-          profiles (email, full_name, emp_id)
-        `)
-        .order('completed_at', { ascending: false })
-        .returns<any>();
-
-      if (attemptsError) throw attemptsError;
-
-      // 2. Fetch user details for these users
-      const userIds = attemptsData.map(a => a.user_id);
-      const uniqueUserIds = [...new Set(userIds)];
-
-      // console.log('Admin: Fetching details for User IDs:', uniqueUserIds);
-
-      let userDetailsMap: Record<string, any> = {};
-
-      if (uniqueUserIds.length > 0) {
-        const { data: detailsData, error: detailsError } = await supabase
-          .from('user_details')
-          .select('*')
-          .in('user_id', uniqueUserIds as string[]);
-
-        // console.log('Admin: User Details Response:', { data: detailsData, error: detailsError });
-
-        if (detailsError) {
-          // console.error('Error fetching user details (check RLS policies):', detailsError);
-        } else if (detailsData) {
-          detailsData.forEach((detail) => {
-            userDetailsMap[detail.user_id] = detail;
-          });
-        }
-      }
-
-      // 3. Merge data
-      const mergedData = attemptsData.map(attempt => ({
-        ...attempt,
-        userDetails: userDetailsMap[attempt.user_id] || null
-      }));
+      let dashboard: DashboardAnalytics;
+      do {
+        analyticsStale.current = false;
+        // Dashboard aggregates are computed server-side
+        const { data: analyticsData, error: analyticsError } = await supabase.rpc('admin_dashboard_analytics');
+
+        // Tally locally if the RPC is not deployed yet
+        dashboard = !analyticsError && analyticsData
+          ? (analyticsData as unknown as DashboardAnalytics)
+          : summarizeAttempts(await fetchAllAttempts());
+      } while (analyticsStale.current);
+
+      setAnalytics(dashboard);
+    } catch (error) {
+      // console.error('Error fetching analytics:', error);
+      // Fallback or empty state could be handled here
+    } finally {
+      analyticsLoading.current = false;
+    }
+  };
 
-      setAttempts(mergedData);
+  /** Adds (`sign` 1) or removes (-1) an attempt from the loaded counters. */
+  const countAttempt = (row: TestAttemptWithProfile, sign: 1 | -1) => {
+    if (analyticsLoading.current) {
+      analyticsStale.current = true;
+      return;
+    }
+    setAnalytics(current => current && applyAttempt(current, row, sign));
+  };
 
-      const qualified = mergedData.filter(a => a.qualified).length;
-      const totalPercentage = mergedData.reduce((sum, a) => sum + Number(a.percentage), 0);
+  /**
+   * A candidate submitted an attempt: fold it into the counters, then add it
+   * to the table once its profile and details are loaded.
+   */
+  const handleAttemptInserted = async (row: TestAttemptWithProfile) => {
+    countAttempt(row, 1);
+    refetchRollup();
 
-      setStats({
-        total: mergedData.length,
-        qualified,
-        notQualified: mergedData.length - qualified,
-        averageScore: mergedData.length > 0 ? Math.round(totalPercentage / mergedData.length) : 0
-      });
+    const [{ data: profile }, { data: details }] = await Promise.all([
+      supabase.from('profiles').select('email, full_name, emp_id').eq('user_id', row.user_id).maybeSingle(),
+      supabase.from('user_details').select('*').eq('user_id', row.user_id).maybeSingle(),
+    ]);
+    applyInsert({
+      ...row,
+      profiles: profile as UserProfile,
+      userDetails: details ? { ...details, process_allocated: details.product_process } as UserDetails : null,
+    });
+  };
 
-    } catch (error) {
-      // console.error('Error fetching attempts:', error);
-      // Fallback or empty state could be handled here
+  /**
+   * An attempt was deleted elsewhere. Realtime only sends its id, so the
+   * counters are updated from the copy on screen, or re-read when there is none.
+   */
+  const handleAttemptDeleted = (id: string) => {
+    if (removedAttemptIds.current.delete(id)) return;
+    refetchRollup();
+    const row = attempts.find(a => a.id === id);
+    if (row) {
+      countAttempt(row, -1);
+    } else {
+      fetchAnalytics();
     }
-
-    setLoadingData(false);
+    applyDelete(id);
   };
 
+  // Subscribe once; the handlers change every render, so read them through a ref
+  const realtimeHandlers = useRef({ handleAttemptInserted, handleAttemptDeleted });
+  realtimeHandlers.current = { handleAttemptInserted, handleAttemptDeleted };
+
+  useEffect(() => {
+    if (!user || !isAdmin) return;
+
+    const channel = supabase
+      .channel('admin-test-attempts')
+      .on('postgres_changes', { event: 'INSERT', schema: 'public', table: 'test_attempts' }, payload => {
+        realtimeHandlers.current.handleAttemptInserted(payload.new as TestAttemptWithProfile);
+      })
+      .on('postgres_changes', { event: 'DELETE', schema: 'public', table: 'test_attempts' }, payload => {
+        const id = (payload.old as { id?: string }).id;
+        if (id) realtimeHandlers.current.handleAttemptDeleted(id);
+      })
+      .subscribe();
+
+    return () => {
+      supabase.removeChannel(channel);
+    };
+  }, [user, isAdmin]);
+
   /**
    * Initiates the re-exam process by opening the confirmation dialog.
    */
@@ -1444,6 +1439,8 @@ function Admin() {
   const handleResetAttempt = async () => {
     if (!attemptToReset) return;
 
+    // Registered before the delete, since its realtime DELETE can arrive first
+    removedAttemptIds.current.add(attemptToReset);
     try {
       const { error } = await supabase
         .from('test_attempts')
@@ -1459,9 +1456,18 @@ function Admin() {
 
       setIsResetDialogOpen(false);
       setAttemptToReset(null);
-      // Refresh the list
-      await fetchAttempts();
+      // The row is on screen, so take it out of the page and the counters directly
+      refetchRollup();
+      const row = attempts.find(a => a.id === attemptToReset);
+      if (row) {
+        countAttempt(row, -1);
+        applyDelete(attemptToReset);
+      } else {
+        refetchPage();
+        await fetchAnalytics();
+      }
     } catch (error: any) {
+      removedAttemptIds.current.delete(attemptToReset);
       console.error('Error resetting attempt:', error);
       toast({
         title: "Action Failed",
@@ -1471,78 +1477,34 @@ function Admin() {
     }
   };
 
-  const exportToCsv = useCallback(() => {
-    if (attempts.length === 0) return;
-
-    const headers = [
-      "Name",
-      "Employee ID",
-      "Email",
-      "First Name",
-      "Last Name",
-      "Phone Number",
-      "Gender",
-      "State",
-      "City",
-      "Process Allocated",
-      "Designation",
-      "Father Name",
-      "Address",
-      "Qualification",
-      "Date of Birth",
-      "Score",
-      "Percentage",
-      "Status",
-      "Date"
-    ];
-
-    const rows = attempts.map(attempt => [
-      `"${attempt.profiles?.full_name || 'N/A'}"`,
-      `"${attempt.profiles?.emp_id || 'N/A'}"`,
-      `"${attempt.profiles?.email || 'N/A'}"`,
-      `"${attempt.userDetails?.first_name || 'N/A'}"`,
-      `"${attempt.userDetails?.last_name || 'N/A'}"`,
-      `"${attempt.userDetails?.phone_number || 'N/A'}"`,
-      `"${attempt.userDetails?.gender || 'N/A'}"`,
-      `"${attempt.userDetails?.state || 'N/A'}"`,
-      `"${attempt.userDetails?.city || 'N/A'}"`,
-      `"${attempt.userDetails?.process_allocated || 'N/A'}"`,
-      `"${attempt.userDetails?.designation || 'N/A'}"`,
-      `"${attempt.userDetails?.father_name || 'N/A'}"`,
-      `"${attempt.userDetails?.address || 'N/A'}"`,
-      `"${attempt.userDetails?.qualification || 'N/A'}"`,
-      `"${attempt.userDetails?.date_of_birth || 'N/A'}"`,
-      attempt.score,
-      attempt.percentage,
-      attempt.qualified ? "Qualified" : "Not Qualified",
-      `"${new Date(attempt.completed_at).toLocaleString()}"`
-    ]);
+  const exportToCsv = useCallback(async () => {
+    if (stats.total === 0 || exporting) return;
 
-    const csvContent = [
-      headers.join(","),
-      ...rows.map(e => e.join(","))
-    ].join("\n");
-
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-    const link = document.createElement("a");
-    if (link.download !== undefined) { // feature detection
-      const url = URL.createObjectURL(blob);
-      link.setAttribute("href", url);
-      link.setAttribute("download", "test_attempts.csv");
-      link.style.visibility = 'hidden';
-      document.body.appendChild(link);
-      link.click();
-      document.body.removeChild(link);
+    setExporting(true);
+    setExportProgress(0);
+    try {
+      // Streamed by the export-attempts edge function, page by page
+      await downloadAttemptsCsv(({ rows, total }) => {
+        setExportProgress(total > 0 ? Math.min(100, Math.round((rows / total) * 100)) : 0);
+      });
+    } catch (error: any) {
+      console.error('Error exporting attempts:', error);
+      toast({
+        title: "Export Failed",
+        description: error.message || "Could not load the results. Please try again.",
+        variant: "destructive",
+      });
+    } finally {
+      setExporting(false);
+      setExportProgress(null);
     }
-  }, [attempts]);
+  }, [stats.total, exporting, toast]);
 
   const buildAnswerRows = useCallback((attempt: TestAttemptWithProfile) => {
     const ans = attempt.answers || {};
     const ids = Object.keys(ans).map(k => Number(k));
-    const questionMap = new Map<number, typeof questions[number]>();
-    questions.forEach(q => questionMap.set(q.id, q));
     return ids.map(id => {
-      const q = questionMap.get(id);
+      const q = questionIndex.get(id)?.question;
       if (!q) return null;
       const selected = ans[id];
       const correctLabel = q.correct_option;
@@ -1697,10 +1659,11 @@ function Admin() {
           <Button
             variant="outline"
             onClick={exportToCsv}
+            disabled={exporting}
             className="flex items-center gap-2 text-gray-700 hover:text-gray-900 hover:bg-red-300 border border-gray-300 rounded-md px-2 py-1"
           >
             <Download className="h-4 w-4" />
-            Download Excel
+            {exportProgress === null ? 'Download Excel' : `Exporting... ${exportProgress}%`}
           </Button>
         </div>
 
@@ -1784,8 +1747,8 @@ function Admin() {
           <Suspense fallback={<div className="py-20 text-center text-gray-500">Loading component...</div>}>
             {activeTab === 'table' ? (
               <CandidateResultsTable
-                attempts={paginatedAttempts}
-                loadingData={loadingData}
+                attempts={attempts}
+                loadingData={loadingPage}
                 openDialog={openDialog}
                 setOpenDialog={setOpenDialog}
                 selectedAttempt={selectedAttempt}
@@ -1797,11 +1760,11 @@ function Admin() {
                 searchQuery={searchQuery}
                 setSearchQuery={setSearchQuery}
                 currentPage={currentPage}
-                setCurrentPage={setCurrentPage}
+                setCurrentPage={goToPage}
                 totalPages={totalPages}
                 itemsPerPage={itemsPerPage}
                 setItemsPerPage={setItemsPerPage}
-                totalResults={filteredAttempts.length}
+                totalResults={totalResults}
                 onResetAttempt={initiateResetAttempt}
               />
             ) : (
@@ -1817,6 +1780,7 @@ function Admin() {
                 setCurrentPage={setQCurrentPage}
                 itemsPerPage={qItemsPerPage}
                 setItemsPerPage={setQItemsPerPage}
+                demographicRows={demographicRows}
               />
             )}
           </Suspense>
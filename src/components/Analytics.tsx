@@ -1,8 +1,7 @@
 // src/components/Analytics.tsx
 import { useEffect } from 'react';
 import { useLocation } from 'react-router-dom';
-
-const ENDPOINT = 'https://chelqujdhnjboeeamxtu.supabase.co/functions/v1/track-pageview';
+import { enqueuePageView, startPageViewQueue } from '@/lib/pageviewQueue';
 
 function generateId(): string {
   return 'xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'.replace(/[xy]/g, (c) => {
@@ -33,27 +32,19 @@ function getSessionId(): string {
 export function Analytics() {
   const location = useLocation();
 
+  useEffect(() => startPageViewQueue(), []);
+
   useEffect(() => {
-    const trackPageView = async () => {
-      try {
-        await fetch(ENDPOINT, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            hostname: window.location.hostname,
-            path: location.pathname,
-            pageTitle: document.title,
-            referrer: document.referrer,
-            visitorId: getVisitorId(),
-            sessionId: getSessionId(),
-          }),
-        });
-      } catch (err) {
-        console.log('Analytics error:', err);
-      }
-    };
-
-    trackPageView();
+    enqueuePageView({
+      eventId: generateId(),
+      hostname: window.location.hostname,
+      path: location.pathname,
+      pageTitle: document.title,
+      referrer: document.referrer,
+      visitorId: getVisitorId(),
+      sessionId: getSessionId(),
+      timestamp: new Date().toISOString(),
+    });
   }, [location.pathname]);
 
   return null;
@@ -4,14 +4,15 @@ import { useAuth } from '@/hooks/useAuth';
 import EnhancedFooter from '../EnhaceFooter';
 import FoundationTraining from './components/FoundationTraining';
 
-import { User, Mail, BadgeCheck, Sparkles, BookOpen, Clock, ChevronRight, ClipboardCheck, FileQuestion } from 'lucide-react';
+import { User, Mail, BadgeCheck, Sparkles, BookOpen, Clock, ChevronRight, ClipboardCheck, FileQuestion, Loader2 } from 'lucide-react';
 import Refresher from './components/[Refresh]/Refresher';
 import TNI from './components/TNI/TNI';
 import { TestInterface } from '../TestInterface';
 import { UserDetailsForm } from '../UserDetailsForm';
 import { Certification } from './components/Certification';
 import { Award, BarChart3, ShieldCheck } from 'lucide-react';
-import { questions as testQuestions } from '@/data/questions-updated';
+import { loadQuestionBank } from '@/data/questionShards';
+import type { Question } from '@/data/questions-updated';
 import { supabase } from "@/integrations/supabase/client";
 import { useToast } from '@/hooks/use-toast';
 import { Button } from '@/components/ui/button';
@@ -135,6 +136,15 @@ const navigate = useNavigate();
     return () => window.removeEventListener('scroll', handleScroll);
   }, [activeModule]);
 
+  // The embedded test uses the whole bank; fetch its shards once it is shown
+  const [testQuestions, setTestQuestions] = React.useState<Question[]>([]);
+  React.useEffect(() => {
+    if (!isDetailsSubmitted || testQuestions.length > 0) return;
+    loadQuestionBank()
+      .then(setTestQuestions)
+      .catch(error => console.error('Error loading questions:', error));
+  }, [isDetailsSubmitted, testQuestions.length]);
+
   // Scroll to top when module changes
   React.useEffect(() => {
     window.scrollTo({ top: 0, behavior: 'smooth' });
@@ -522,12 +532,18 @@ this the qualified or not  */}
                           </Button>
                         </div>
                       ) : isDetailsSubmitted ? (
-                         <TestInterface 
-                           questions={testQuestions} 
-                           onSubmit={handleTestSubmit} 
-                           hasAttempted={false} 
-                           isEmbedded={true}
-                         />
+                         testQuestions.length > 0 ? (
+                           <TestInterface 
+                             questions={testQuestions} 
+                             onSubmit={handleTestSubmit} 
+                             hasAttempted={false} 
+                             isEmbedded={true}
+                           />
+                         ) : (
+                           <div className="flex items-center justify-center py-20">
+                             <Loader2 className="h-10 w-10 text-teal-500 animate-spin" />
+                           </div>
+                         )
                        ) : (
                         <div className="flex flex-col items-center justify-center py-20 text-center bg-white rounded-3xl shadow-sm border border-slate-100">
                           <div className="bg-teal-50 p-6 rounded-full mb-6">
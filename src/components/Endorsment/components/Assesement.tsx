@@ -1,58 +1,67 @@
-import React, { useState } from 'react'
+import React from 'react'
 import Header from '@/components/Header'
 import EnhancedFooter from '@/components/EnhaceFooter'
 import { UserDetailsForm } from '@/components/UserDetailsForm'
 import { TestInterface } from '@/components/TestInterface'
-import { getRandomQuestions, Question } from '@/data/questions'
 import { useAuth } from '@/hooks/useAuth'
 import { useTestAttempts } from '@/hooks/useTestAttempts'
+import { useAssessmentSession } from '@/hooks/useAssessmentSession'
+import { useToast } from '@/hooks/use-toast'
+import { ToastAction } from '@/components/ui/toast'
 import { useNavigate } from 'react-router-dom'
 import { CheckCircle, Loader2 } from 'lucide-react'
 
 const QUESTIONS_PER_TEST = 20;
 
 function Assesement() {
-  const [isTestActive, setIsTestActive] = useState(false);
-  const [testQuestions, setTestQuestions] = useState<Question[]>([]);
-  const [testStartTime, setTestStartTime] = useState<Date | null>(null);
-  
   const { user, loading: authLoading, isAdmin } = useAuth();
   const { hasAttempted, loading: attemptsLoading, saveAttempt } = useTestAttempts();
   const navigate = useNavigate();
+  const { toast } = useToast();
+  const {
+    questions: testQuestions,
+    isTestActive,
+    resumed,
+    expiresAt,
+    resuming,
+    starting,
+    startTest,
+    recordProgress,
+    submitTest,
+  } = useAssessmentSession({ userId: user?.id, ready: !attemptsLoading, hasAttempted, saveAttempt });
 
-  const handleStartTest = () => {
+  const handleStartTest = async () => {
     if (!user) {
       navigate('/auth');
       return;
     }
     
-    const randomQuestions = getRandomQuestions(QUESTIONS_PER_TEST);
-    setTestQuestions(randomQuestions);
-    setTestStartTime(new Date());
-    setIsTestActive(true);
-  };
-
-  const handleSubmitTest = async (
-    score: number,
-    totalQuestions: number,
-    answers: Record<number, string>
-  ): Promise<{ error: Error | null; qualified: boolean; percentage: number }> => {
-    if (testStartTime) {
-      const result = await saveAttempt(score, totalQuestions, answers, testStartTime);
-      return { 
-        error: result.error || null, 
-        qualified: result.qualified ?? false, 
-        percentage: result.percentage ?? 0 
-      };
+    try {
+      await startTest(QUESTIONS_PER_TEST);
+    } catch (error) {
+      console.error('Error loading questions:', error);
+      toast({
+        title: "Could not start the assessment",
+        description: "The questions could not be loaded. Check your connection and try again.",
+        variant: "destructive",
+        action: (
+          <ToastAction altText="Try again" onClick={() => void handleStartTest()}>
+            Try again
+          </ToastAction>
+        ),
+      });
     }
-    return { error: new Error('Test start time not set'), qualified: false, percentage: 0 };
   };
 
   if (isTestActive && testQuestions.length > 0) {
     return (
       <TestInterface 
         questions={testQuestions} 
-        onSubmit={handleSubmitTest}
+        initialAnswers={resumed?.answers}
+        initialIndex={resumed?.currentIndex}
+        onProgress={recordProgress}
+        expiresAt={expiresAt}
+        onSubmit={submitTest}
         hasAttempted={hasAttempted}
       />
     );
@@ -64,7 +73,7 @@ function Assesement() {
       
       <main className="flex-grow flex items-center justify-center p-4">
         <div className="w-full max-w-4xl mx-auto">
-          {authLoading || attemptsLoading ? (
+          {authLoading || attemptsLoading || resuming ? (
             <div className="flex flex-col items-center justify-center p-12 bg-white rounded-3xl shadow-xl border border-slate-100">
               <Loader2 className="h-12 w-12 text-teal-500 animate-spin mb-4" />
               <p className="text-slate-600 font-medium">Preparing your assessment...</p>
@@ -93,10 +102,9 @@ function Assesement() {
               </div>
               <div className="p-8">
                 <UserDetailsForm
-                  onSubmit={(details) => {
-                    handleStartTest();
-                  }}
+                  onSubmit={handleStartTest}
                   onCancel={() => navigate('/engagement')}
+                  busy={starting}
                 />
               </div>
             </div>
@@ -1,12 +1,14 @@
 import React, { useState, useEffect } from 'react';
 import { Heart, Phone, Users, Clock, Mail, MapPin, ExternalLink, ShieldCheck, BarChart3, User, IdCard } from 'lucide-react';
 import { useAuth } from '@/hooks/useAuth';
+import { useAnalyticsMetrics } from '@/hooks/useAnalyticsMetrics';
 
 export default function EnhancedFooter() {
-  const [totalPageViews, setTotalPageViews] = useState<number | string>('...');
-  const [totalVisitors, setTotalVisitors] = useState<number | string>('...');
-  const [activeVisitors, setActiveVisitors] = useState<number | string>('...');
-  const [timeUpdated, setTimeUpdated] = useState<number | string>('...');
+  const metrics = useAnalyticsMetrics();
+  const totalPageViews = metrics?.total_page_views ?? '...';
+  const totalVisitors = metrics?.total_visitors ?? '...';
+  const activeVisitors = metrics?.active_page_views ?? '...';
+  const timeUpdated = metrics?.generated_at ? new Date(metrics.generated_at).toLocaleString() : '...';
   const pageLink = {
     home: '/',
     about: '/about',
@@ -24,54 +26,6 @@ export default function EnhancedFooter() {
   }, [user])
   // console.log(user?.user?.user_metadata?.full_name);
 
-  useEffect(() => {
-    let ws: WebSocket | null = null;
-    let reconnectTimeout: NodeJS.Timeout;
-
-    const connect = () => {
-      ws = new WebSocket('wss://chelqujdhnjboeeamxtu.supabase.co/functions/v1/public-analytics?share_token=5fa72a22c2b0434f');
-
-      ws.onmessage = (event) => {
-        try {
-          const message = JSON.parse(event.data);
-          if (message.data?.generated_at) {
-            setTimeUpdated(new Date(message.data.generated_at).toLocaleDateString());
-          }
-
-          if (message.type === 'initial' || message.type === 'metrics_update') {
-            const metrics = message.data?.metrics;
-            if (metrics) {
-              if (metrics.total_page_views !== undefined) setTotalPageViews(metrics.total_page_views);
-              if (metrics.total_visitors !== undefined) setTotalVisitors(metrics.total_visitors);
-              if (metrics.active_page_views !== undefined) setActiveVisitors(metrics.active_page_views);
-              if (metrics.generated_at !== undefined) setTimeUpdated(new Date(metrics.generated_at).toLocaleString());
-            }
-          }
-        } catch (err) {
-          // Silent error
-        }
-      };
-
-      ws.onclose = () => {
-        reconnectTimeout = setTimeout(connect, 5000); // Reconnect after 5 seconds
-      };
-
-      ws.onerror = () => {
-        if (ws) ws.close();
-      };
-    };
-
-    connect();
-
-    return () => {
-      if (ws) {
-        ws.onclose = null; // Prevent reconnection on unmount
-        ws.close();
-      }
-      clearTimeout(reconnectTimeout);
-    };
-  }, []);
-
   return (
     <footer className="relative bg-gradient-to-b from-gray-50 to-gray-100 text-gray-800 overflow-hidden">
       {/* Decorative Background Elements */}
@@ -16,15 +16,17 @@ import { FAQsSection, StatisticsSection, TestimonialsSection } from "./comp";
 
 
 interface LandingPageProps {
-  onStartTest: () => void;
+  onStartTest: () => Promise<void>;
   totalQuestions: number;
   user: User | null;
   hasAttempted: boolean;
   loading: boolean;
+  /** A test is being loaded after the details form was submitted. */
+  starting?: boolean;
 }
 
 export const LandingPage = (
-  { onStartTest, totalQuestions, user, hasAttempted, loading }: LandingPageProps) => {
+  { onStartTest, totalQuestions, user, hasAttempted, loading, starting = false }: LandingPageProps) => {
   const [showUserDetailsForm, setShowUserDetailsForm] = useState(false);
   const navigate = useNavigate();
   const { signOut, isAdmin } = useAuth();
@@ -70,13 +72,14 @@ export const LandingPage = (
 
       {showUserDetailsForm && (
         <UserDetailsForm
-          onSubmit={(details) => {
+          onSubmit={async (details) => {
             // console.log('User details submitted:', details);
 
+            await onStartTest(); // Proceed to start the test after form submission
             setShowUserDetailsForm(false);
-            onStartTest(); // Proceed to start the test after form submission
           }}
           onCancel={() => setShowUserDetailsForm(false)}
+          busy={starting}
         />
       )}
 
@@ -1,4 +1,4 @@
-import { Question } from "@/data/questions";
+import type { Question } from "@/data/questions-updated";
 import { Button } from "@/components/ui/button";
 import { cn } from "@/lib/utils";
 
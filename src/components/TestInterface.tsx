@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from "react";
-import { ArrowLeft, ArrowRight, CheckCircle, AlertCircle } from "lucide-react";
+import { ArrowLeft, ArrowRight, CheckCircle, AlertCircle, WifiOff } from "lucide-react";
 import { useNavigate } from "react-router-dom";
 
 import { Button } from "@/components/ui/button";
@@ -8,9 +8,9 @@ import { QuestionCard } from "./QuestionCard";
 import { ResultCard } from "./ResultCard";
 import { TestTimer } from "./TestTimer";
 import { useToast } from "@/hooks/use-toast";
-import { calculateScore, Question } from "@/data/questions-updated";
-
-const TEST_DURATION_MINUTES = 20; // 20 minutes for 20 questions
+import { calculateScore } from "@/data/scoring";
+import type { Question } from "@/data/questions-updated";
+import { TEST_DURATION_MINUTES } from "@/lib/testClock";
 
 interface TestInterfaceProps {
   questions: Question[];
@@ -18,15 +18,35 @@ interface TestInterfaceProps {
     error: Error | null;
     qualified: boolean;
     percentage: number;
+    /** Saved on this device and waiting for the connection to be sent. */
+    queued?: boolean;
   }>;
   hasAttempted: boolean;
   isEmbedded?: boolean;
+  /** Answers and position of a journaled paper being resumed. */
+  initialAnswers?: Record<number, string>;
+  initialIndex?: number;
+  /** Called with every change, so the paper can be journaled. */
+  onProgress?: (answers: Record<number, string>, currentIndex: number) => void;
+  /** The paper's deadline as a `performance.now()` value; defaults to the full duration from mount. */
+  expiresAt?: number;
 }
 
-export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded = false }: TestInterfaceProps) => {
+export const TestInterface = ({
+  questions,
+  onSubmit,
+  hasAttempted,
+  isEmbedded = false,
+  initialAnswers,
+  initialIndex = 0,
+  onProgress,
+  expiresAt,
+}: TestInterfaceProps) => {
   const navigate = useNavigate();
-  const [currentIndex, setCurrentIndex] = useState(0);
-  const [answers, setAnswers] = useState<Record<number, string>>({});
+  const [currentIndex, setCurrentIndex] = useState(Math.max(0, Math.min(initialIndex, questions.length - 1)));
+  const [answers, setAnswers] = useState<Record<number, string>>(initialAnswers ?? {});
+  const [localExpiresAt] = useState(() => performance.now() + TEST_DURATION_MINUTES * 60_000);
+  const [isOffline, setIsOffline] = useState(() => typeof navigator !== 'undefined' && !navigator.onLine);
   const [isSubmitted, setIsSubmitted] = useState(false);
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [result, setResult] = useState<{
@@ -56,6 +76,21 @@ export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded =
     return () => window.removeEventListener('beforeunload', handleBeforeUnload);
   }, [isSubmitted, answeredCount]);
 
+  useEffect(() => {
+    onProgress?.(answers, currentIndex);
+  }, [answers, currentIndex, onProgress]);
+
+  useEffect(() => {
+    const goOffline = () => setIsOffline(true);
+    const goOnline = () => setIsOffline(false);
+    window.addEventListener('offline', goOffline);
+    window.addEventListener('online', goOnline);
+    return () => {
+      window.removeEventListener('offline', goOffline);
+      window.removeEventListener('online', goOnline);
+    };
+  }, []);
+
   // Handle test submission and exit
   useEffect(() => {
     if (isSubmitted && result) {
@@ -116,7 +151,7 @@ export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded =
     const testResult = calculateScore(answers, questions);
     
     // Save to database
-    const { error, qualified, percentage } = await onSubmit(
+    const { error, qualified, percentage, queued } = await onSubmit(
       testResult.score,
       testResult.total,
       answers
@@ -132,6 +167,13 @@ export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded =
       return;
     }
 
+    if (queued) {
+      toast({
+        title: "Saved on this device",
+        description: "Your answers will be submitted automatically when the connection is back.",
+      });
+    }
+
     setResult({
       ...testResult,
       qualified,
@@ -167,7 +209,7 @@ export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded =
               </div>
               <div className="flex items-center gap-4">
                 <TestTimer 
-                  durationMinutes={TEST_DURATION_MINUTES} 
+                  expiresAt={expiresAt ?? localExpiresAt}
                   onTimeExpired={handleTimeExpired}
                   isPaused={isSubmitted}
                 />
@@ -188,6 +230,14 @@ export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded =
 
       {/* Main Content */}
       <main className={`${isEmbedded ? 'w-full py-4' : 'max-w-4xl mx-auto px-4 py-8'}`}>
+        {isOffline && (
+          <div className="mb-4 flex items-center justify-center gap-2 text-sm text-amber-700 bg-amber-50 p-3 rounded-lg">
+            <WifiOff className="w-4 h-4" />
+            <span>
+              Network connection lost during timed assessment. Your answers are saved on this device.
+            </span>
+          </div>
+        )}
         {isEmbedded && (
           <div className="flex items-center justify-between mb-8 pb-4 border-b border-slate-100">
             <div className="flex items-center gap-4">
@@ -200,7 +250,7 @@ export const TestInterface = ({ questions, onSubmit, hasAttempted, isEmbedded =
             </div>
             <div className="flex items-center gap-6">
               <TestTimer 
-                durationMinutes={TEST_DURATION_MINUTES} 
+                expiresAt={expiresAt ?? localExpiresAt}
                 onTimeExpired={handleTimeExpired}
                 isPaused={isSubmitted}
               />
@@ -1,59 +1,80 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useRef } from "react";
 import { Clock, AlertTriangle } from "lucide-react";
+import { startTestClock } from "@/lib/testClock";
 
 interface TestTimerProps {
-  durationMinutes: number;
+  /** When time runs out, as a `performance.now()` value. */
+  expiresAt: number;
   onTimeExpired: () => void;
   isPaused?: boolean;
 }
 
-export const TestTimer = ({ durationMinutes, onTimeExpired, isPaused = false }: TestTimerProps) => {
-  const [timeRemaining, setTimeRemaining] = useState(durationMinutes * 60);
-  const [hasExpired, setHasExpired] = useState(false);
+type Phase = "normal" | "low" | "critical";
 
-  const formatTime = useCallback((seconds: number) => {
-    const mins = Math.floor(seconds / 60);
-    const secs = seconds % 60;
-    return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
-  }, []);
+const formatTime = (seconds: number) => {
+  const mins = Math.floor(seconds / 60);
+  const secs = seconds % 60;
+  return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+};
+
+const phaseOf = (seconds: number): Phase =>
+  seconds <= 30 ? "critical" : seconds <= 60 ? "low" : "normal"; // Last 30 seconds / last minute
+
+/**
+ * The countdown. The readout is written straight to its DOM node every
+ * second, so ticking re-renders nothing; this component re-renders only when
+ * the warning phase changes, and its parent never does.
+ */
+export const TestTimer = ({ expiresAt, onTimeExpired, isPaused = false }: TestTimerProps) => {
+  const readout = useRef<HTMLSpanElement>(null);
+  const container = useRef<HTMLDivElement>(null);
+  const onExpiredRef = useRef(onTimeExpired);
+  const hasExpired = useRef(false);
+  const [phase, setPhase] = useState<Phase>(() =>
+    phaseOf(Math.max(0, Math.ceil((expiresAt - performance.now()) / 1000)))
+  );
 
   useEffect(() => {
-    if (isPaused || hasExpired) return;
-
-    const interval = setInterval(() => {
-      setTimeRemaining(prev => {
-        if (prev <= 1) {
-          clearInterval(interval);
-          setHasExpired(true);
-          onTimeExpired();
-          return 0;
-        }
-        return prev - 1;
-      });
-    }, 1000);
-
-    return () => clearInterval(interval);
-  }, [isPaused, hasExpired, onTimeExpired]);
-
-  const isLowTime = timeRemaining <= 60; // Last minute warning
-  const isCriticalTime = timeRemaining <= 30; // Last 30 seconds
+    onExpiredRef.current = onTimeExpired;
+  }, [onTimeExpired]);
+
+  useEffect(() => {
+    if (isPaused || hasExpired.current) return;
+
+    return startTestClock(expiresAt, {
+      onTick: seconds => {
+        if (readout.current) readout.current.textContent = formatTime(seconds);
+        container.current?.setAttribute('data-remaining-seconds', String(seconds));
+        setPhase(phaseOf(seconds));
+      },
+      onExpire: () => {
+        if (hasExpired.current) return;
+        hasExpired.current = true;
+        container.current?.setAttribute('data-expired', 'true');
+        onExpiredRef.current();
+      },
+    });
+  }, [expiresAt, isPaused]);
 
   return (
     <div
+      ref={container}
+      data-testid="test-timer"
+      role="timer"
       className={`flex items-center gap-2 px-3 py-1.5 rounded-full text-sm font-medium transition-all ${
-        isCriticalTime
+        phase === "critical"
           ? "bg-destructive/10 text-destructive animate-pulse"
-          : isLowTime
+          : phase === "low"
           ? "bg-amber-100 text-amber-700"
           : "bg-secondary text-secondary-foreground"
       }`}
     >
-      {isLowTime ? (
+      {phase !== "normal" ? (
         <AlertTriangle className="w-4 h-4" />
       ) : (
         <Clock className="w-4 h-4" />
       )}
-      <span className="font-mono">{formatTime(timeRemaining)}</span>
+      <span ref={readout} data-testid="test-timer-readout" className="font-mono" />
     </div>
   );
 };
@@ -5,13 +5,17 @@ import { Label } from '@/components/ui/label';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { supabase } from "@/integrations/supabase/client";
 import { RadioGroup, RadioGroupItem } from './ui/radio-group';
+import { Loader2 } from 'lucide-react';
 
 interface UserDetailsFormProps {
-  onSubmit: (details: { firstName: string; lastName: string; phoneNumber: string; gender: string; state: string; city: string; designation: string; processAllocated: string; qualification: string;fatherName: string; }) => void;
+  onSubmit: (details: { firstName: string; lastName: string; phoneNumber: string; gender: string; state: string; city: string; designation: string; processAllocated: string; qualification: string;fatherName: string; }) => void | Promise<void>;
   onCancel: () => void;
+  /** The parent is still acting on the submission, e.g. loading the test. */
+  busy?: boolean;
 }
 
-export const UserDetailsForm: React.FC<UserDetailsFormProps> = ({ onSubmit, onCancel }) => {
+export const UserDetailsForm: React.FC<UserDetailsFormProps> = ({ onSubmit, onCancel, busy = false }) => {
+  const [submitting, setSubmitting] = useState(false);
   const [firstName, setFirstName] = useState('');
   const [lastName, setLastName] = useState('');
   const [phoneNumber, setPhoneNumber] = useState('');
@@ -100,6 +104,16 @@ export const UserDetailsForm: React.FC<UserDetailsFormProps> = ({ onSubmit, onCa
       return;
     }
 
+    if (submitting || busy) return;
+    setSubmitting(true);
+    try {
+      await saveDetails();
+    } finally {
+      setSubmitting(false);
+    }
+  };
+
+  const saveDetails = async () => {
     console.log('Attempting to upsert data for user:', userId);
     const payload: any = {
       user_id: userId,
@@ -129,7 +143,7 @@ export const UserDetailsForm: React.FC<UserDetailsFormProps> = ({ onSubmit, onCa
       alert(`Failed to save details: ${error.message}. If this persists, please ensure your database has the required columns (father_name, address, designation, qualification, process_allocated).`);
     } else {
       console.log('User details saved:', data);
-      onSubmit({ firstName, lastName, phoneNumber, gender, state, city, designation, processAllocated, qualification,fatherName });
+      await onSubmit({ firstName, lastName, phoneNumber, gender, state, city, designation, processAllocated, qualification,fatherName });
     }
   };
 
@@ -252,7 +266,14 @@ export const UserDetailsForm: React.FC<UserDetailsFormProps> = ({ onSubmit, onCa
           </div>
           <div className="flex justify-end gap-4 pt-4 border-t border-gray-100">
             <Button type="button" variant="outline" onClick={onCancel} className="px-6 border-gray-200 hover:bg-gray-50">Cancel</Button>
-            <Button type="submit" className="px-8 bg-green-600 hover:bg-green-700 text-white shadow-lg transition-all active:scale-95">Submit</Button>
+            <Button type="submit" disabled={submitting || busy} className="px-8 bg-green-600 hover:bg-green-700 text-white shadow-lg transition-all active:scale-95">
+              {submitting || busy ? (
+                <>
+                  <Loader2 className="mr-2 h-4 w-4 animate-spin" />
+                  Starting...
+                </>
+              ) : 'Submit'}
+            </Button>
           </div>
         </form>
       </div>
@@ -0,0 +1,116 @@
+import manifest from 'virtual:question-shards';
+import type { Module, Question } from './questions-updated';
+import { createQuestionSampler, drawQuestions, newPaperSeed, type QuestionSampler } from '@/lib/questionSampler';
+import { idbGet, idbPut } from '@/lib/idb';
+
+/**
+ * The question bank as loaded at run time. The build emits it as
+ * content-hashed JSON shards, one per module and one per role (see
+ * `questionShards` in vite.config.ts), and this module fetches only the
+ * shards a call needs. A fetched shard is kept in memory and in IndexedDB
+ * under its content hash, so a returning candidate reads it from disk until
+ * the bank changes; the hashed URL is also safe to cache forever over HTTP.
+ *
+ * The helpers mirror `@/data/questions-updated`, returning promises. Draws
+ * use the same seeded sampler over the same question order, so a seed gives
+ * the same paper here as there.
+ */
+
+interface CachedShard {
+  hash: string;
+  questions: Question[];
+}
+
+export const modules: Module[] = manifest.modules;
+
+const loaded = new Map<string, Promise<Question[]>>();
+
+const fetchShard = async (key: string): Promise<Question[]> => {
+  const shard = manifest.shards[key];
+  if (!shard) return [];
+
+  const cached = await idbGet<CachedShard>('question-shards', key).catch(() => undefined);
+  if (cached?.hash === shard.hash) return cached.questions;
+
+  const response = await fetch(shard.url);
+  if (!response.ok) throw new Error(`Failed to load questions (${key}): HTTP ${response.status}`);
+  const questions: Question[] = await response.json();
+  idbPut('question-shards', key, { hash: shard.hash, questions } satisfies CachedShard).catch(() => {
+    // Private mode or storage full; the HTTP cache still has it
+  });
+  return questions;
+};
+
+const loadShard = (key: string) => {
+  let pending = loaded.get(key);
+  if (!pending) {
+    pending = fetchShard(key);
+    // A failed fetch is retried on the next call
+    pending.catch(() => loaded.delete(key));
+    loaded.set(key, pending);
+  }
+  return pending;
+};
+
+const bankOrder = new Map(manifest.order.map((id, index) => [id, index]));
+let bankSampler: Promise<QuestionSampler> | null = null;
+
+/** The whole bank, in its original order: every module shard, merged. */
+export const loadQuestionBank = async (): Promise<Question[]> => {
+  const shards = await Promise.all(
+    Object.keys(manifest.shards).filter(key => key.startsWith('module:')).map(loadShard)
+  );
+  return shards.flat().sort((a, b) => bankOrder.get(a.id)! - bankOrder.get(b.id)!);
+};
+
+const loadSampler = () => {
+  if (!bankSampler) {
+    bankSampler = loadQuestionBank().then(createQuestionSampler);
+    bankSampler.catch(() => {
+      bankSampler = null;
+    });
+  }
+  return bankSampler;
+};
+
+// Get all unique categories
+export const getCategories = async (): Promise<string[]> => {
+  return [...(await loadSampler()).categories];
+};
+
+// Get questions by category
+export const getQuestionsByCategory = async (category: string): Promise<Question[]> => {
+  return [...((await loadSampler()).byCategory.get(category) ?? [])];
+};
+
+// Get questions by module; loads only that module's shard
+export const getQuestionsByModule = async (moduleId: string): Promise<Question[]> => {
+  return [...(await loadShard(`module:${moduleId}`))];
+};
+
+// Get questions by role; loads only that role's shard
+export const getQuestionsByRole = async (role: 'CO' | 'FRO'): Promise<Question[]> => {
+  return [...(await loadShard(`role:${role}`))];
+};
+
+// Get random questions with balanced category distribution
+export const getRandomQuestions = async (count: number = 20, seed: number = newPaperSeed()): Promise<Question[]> => {
+  return (await loadSampler()).balanced(count, seed);
+};
+
+// Get random questions from a specific module
+export const getRandomQuestionsFromModule = async (moduleId: string, count?: number, seed: number = newPaperSeed()): Promise<Question[]> => {
+  const moduleQuestions = await loadShard(`module:${moduleId}`);
+  return drawQuestions(moduleQuestions, count ?? moduleQuestions.length, seed);
+};
+
+// Alternative: Get completely random questions (original behavior)
+export const getCompletelyRandomQuestions = async (count: number = 20, seed: number = newPaperSeed()): Promise<Question[]> => {
+  return drawQuestions(await loadQuestionBank(), count, seed);
+};
+
+// Get random questions from specific categories
+export const getRandomQuestionsFromCategories = async (categories: string[], count: number = 20, seed: number = newPaperSeed()): Promise<Question[]> => {
+  const pool = (await loadQuestionBank()).filter(q => categories.includes(q.category));
+  return drawQuestions(pool, count, seed);
+};
@@ -1,3 +1,5 @@
+import { createQuestionSampler, newPaperSeed } from '@/lib/questionSampler';
+
 export interface Question {
   id: number;
   question_text: string;
@@ -823,105 +825,71 @@ export const questions: Question[] = [
   }
 ];
 
+export interface QuestionIndexEntry {
+  question: Question;
+  module: Module | undefined;
+  category: string;
+  correct_option: Question['correct_option'];
+}
+
+// Question id -> question, module, category and answer key, built once so
+// per-answer lookups while scoring or analysing attempts are O(1)
+export const questionIndex: ReadonlyMap<number, QuestionIndexEntry> = new Map(
+  questions.map(q => [q.id, {
+    question: q,
+    module: modules.find(m => m.id === q.module),
+    category: q.category,
+    correct_option: q.correct_option,
+  }])
+);
+
+// Category, module and role buckets, built once; every draw below is a
+// seeded partial Fisher-Yates over them
+const sampler = createQuestionSampler(questions);
+
 // Get all unique categories
 export const getCategories = (): string[] => {
-  const categories = [...new Set(questions.map(q => q.category))];
-  return categories;
+  return [...sampler.categories];
 };
 
 // Get questions by category
 export const getQuestionsByCategory = (category: string): Question[] => {
-  return questions.filter(q => q.category === category);
+  return [...(sampler.byCategory.get(category) ?? [])];
 };
 
 // Get questions by module
 export const getQuestionsByModule = (moduleId: string): Question[] => {
-  return questions.filter(q => q.module === moduleId);
+  return [...(sampler.byModule.get(moduleId) ?? [])];
 };
 
 // Get questions by role
 export const getQuestionsByRole = (role: 'CO' | 'FRO'): Question[] => {
-  return questions.filter(q => q.role === role || q.role === 'BOTH');
+  return [...sampler.byRole[role]];
 };
 
-// Get random questions with balanced category distribution
-export const getRandomQuestions = (count: number = 20): Question[] => {
-  const categories = getCategories();
-  const questionsPerCategory = Math.floor(count / categories.length);
-  const remainder = count % categories.length;
-  
-  let selectedQuestions: Question[] = [];
-  
-  // Shuffle categories to randomize which ones get extra questions
-  const shuffledCategories = [...categories].sort(() => Math.random() - 0.5);
-  
-  shuffledCategories.forEach((category, index) => {
-    const categoryQuestions = getQuestionsByCategory(category);
-    // Shuffle questions within each category
-    const shuffledCategoryQuestions = [...categoryQuestions].sort(() => Math.random() - 0.5);
-    
-    // Determine how many questions to take from this category
-    let questionsToTake = questionsPerCategory;
-    if (index < remainder) {
-      questionsToTake += 1; // Give extra question to first few categories
-    }
-    
-    // Take the required number of questions from this category
-    const selectedFromCategory = shuffledCategoryQuestions.slice(0, Math.min(questionsToTake, categoryQuestions.length));
-    selectedQuestions = [...selectedQuestions, ...selectedFromCategory];
-  });
-  
-  // Final shuffle to randomize the order of questions across categories
-  return selectedQuestions.sort(() => Math.random() - 0.5).slice(0, count);
+// Get random questions with balanced category distribution. The same seed
+// always gives the same paper, so storing the seed is enough to rebuild it
+export const getRandomQuestions = (count: number = 20, seed: number = newPaperSeed()): Question[] => {
+  return sampler.balanced(count, seed);
 };
 
 // Get random questions from a specific module
-export const getRandomQuestionsFromModule = (moduleId: string, count?: number): Question[] => {
-  const moduleQuestions = getQuestionsByModule(moduleId);
-  const shuffled = [...moduleQuestions].sort(() => Math.random() - 0.5);
-  return count ? shuffled.slice(0, Math.min(count, moduleQuestions.length)) : shuffled;
+export const getRandomQuestionsFromModule = (moduleId: string, count?: number, seed: number = newPaperSeed()): Question[] => {
+  const moduleQuestions = sampler.byModule.get(moduleId) ?? [];
+  return sampler.draw(moduleQuestions, count ?? moduleQuestions.length, seed);
 };
 
 // Alternative: Get completely random questions (original behavior)
-export const getCompletelyRandomQuestions = (count: number = 20): Question[] => {
-  const shuffled = [...questions].sort(() => Math.random() - 0.5);
-  return shuffled.slice(0, Math.min(count, questions.length));
+export const getCompletelyRandomQuestions = (count: number = 20, seed: number = newPaperSeed()): Question[] => {
+  return sampler.draw(questions, count, seed);
 };
 
 // Get random questions from specific categories
-export const getRandomQuestionsFromCategories = (categories: string[], count: number = 20): Question[] => {
-  const filteredQuestions = questions.filter(q => categories.includes(q.category));
-  const shuffled = [...filteredQuestions].sort(() => Math.random() - 0.5);
-  return shuffled.slice(0, Math.min(count, filteredQuestions.length));
-};
-
-export const calculateScore = (answers: Record<number, string>, questionSet: Question[]): TestResult => {
-  let correct = 0;
-  const correctAnswers: Record<number, string> = {};
-  
-  questionSet.forEach((q) => {
-    correctAnswers[q.id] = q.correct_option;
-    if (answers[q.id] === q.correct_option) {
-      correct++;
-    }
-  });
-  
-  const percentage = Math.round((correct / questionSet.length) * 100);
-  return {
-    score: correct,
-    total: questionSet.length,
-    percentage,
-    qualified: percentage >= 60,
-    answers,
-    correctAnswers
-  };
+export const getRandomQuestionsFromCategories = (categories: string[], count: number = 20, seed: number = newPaperSeed()): Question[] => {
+  const pool = questions.filter(q => categories.includes(q.category));
+  return sampler.draw(pool, count, seed);
 };
 
-// Utility function to analyze category distribution in a question set
-export const getCategoryDistribution = (questionSet: Question[]): Record<string, number> => {
-  const distribution: Record<string, number> = {};
-  questionSet.forEach(q => {
-    distribution[q.category] = (distribution[q.category] || 0) + 1;
-  });
-  return distribution;
-};
\ No newline at end of file
+// Scoring lives with no question data attached, so the test screen can
+// import it without bundling the bank
+export { calculateScore, getCategoryDistribution } from './scoring';
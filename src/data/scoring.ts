@@ -0,0 +1,32 @@
+import type { Question, TestResult } from './questions-updated';
+
+export const calculateScore = (answers: Record<number, string>, questionSet: Question[]): TestResult => {
+  let correct = 0;
+  const correctAnswers: Record<number, string> = {};
+  
+  questionSet.forEach((q) => {
+    correctAnswers[q.id] = q.correct_option;
+    if (answers[q.id] === q.correct_option) {
+      correct++;
+    }
+  });
+  
+  const percentage = Math.round((correct / questionSet.length) * 100);
+  return {
+    score: correct,
+    total: questionSet.length,
+    percentage,
+    qualified: percentage >= 60,
+    answers,
+    correctAnswers
+  };
+};
+
+// Utility function to analyze category distribution in a question set
+export const getCategoryDistribution = (questionSet: Question[]): Record<string, number> => {
+  const distribution: Record<string, number> = {};
+  questionSet.forEach(q => {
+    distribution[q.category] = (distribution[q.category] || 0) + 1;
+  });
+  return distribution;
+};
@@ -0,0 +1,158 @@
+import { useState, useEffect, useCallback, useRef } from 'react';
+import { supabase } from '@/integrations/supabase/client';
+
+export type AttemptStatusFilter = 'all' | 'qualified' | 'not_qualified';
+
+interface PageRequest {
+  page: number;
+  cursor: { completed_at: string; id: string } | null;
+  direction: 'next' | 'prev';
+  /** Rows to fetch when it differs from the page size (a short last page). */
+  limit?: number;
+}
+
+interface UseAdminAttemptsOptions {
+  enabled: boolean;
+  status: AttemptStatusFilter;
+  search: string;
+  pageSize: number;
+  /** Delay before a new search is sent, so typing does not fire a query per keystroke. */
+  searchDelayMs?: number;
+}
+
+const FIRST_PAGE: PageRequest = { page: 1, cursor: null, direction: 'next' };
+
+/**
+ * One page of the Admin candidate table, filtered, searched and keyset-paginated
+ * on the server (`admin_list_attempts` / `admin_count_attempts`). Only the rows
+ * on screen are ever downloaded; moving between pages sends the first or last
+ * row of the current page as the cursor.
+ */
+export const useAdminAttempts = <T extends { id: string; completed_at: string; qualified: boolean }>({
+  enabled,
+  status,
+  search,
+  pageSize,
+  searchDelayMs = 300,
+}: UseAdminAttemptsOptions) => {
+  const [rows, setRows] = useState<T[]>([]);
+  const [total, setTotal] = useState(0);
+  const [loading, setLoading] = useState(true);
+  const [request, setRequest] = useState<PageRequest>(FIRST_PAGE);
+  const [debouncedSearch, setDebouncedSearch] = useState(search);
+  const [reloadKey, setReloadKey] = useState(0);
+  const [countKey, setCountKey] = useState(0);
+  const latestRequest = useRef(0);
+
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedSearch(search.trim()), searchDelayMs);
+    return () => clearTimeout(timeout);
+  }, [search, searchDelayMs]);
+
+  // Filters or page size changed: back to the first page
+  useEffect(() => {
+    setRequest(FIRST_PAGE);
+  }, [status, debouncedSearch, pageSize]);
+
+  useEffect(() => {
+    if (!enabled) return;
+    supabase
+      .rpc('admin_count_attempts', { _status: status, _search: debouncedSearch || null })
+      .then(({ data, error }) => {
+        if (!error) setTotal(data ?? 0);
+      });
+  }, [enabled, status, debouncedSearch, reloadKey, countKey]);
+
+  useEffect(() => {
+    if (!enabled) return;
+    const requestId = ++latestRequest.current;
+    setLoading(true);
+
+    supabase
+      .rpc('admin_list_attempts', {
+        _status: status,
+        _search: debouncedSearch || null,
+        _limit: request.limit ?? pageSize,
+        _cursor_completed_at: request.cursor?.completed_at ?? null,
+        _cursor_id: request.cursor?.id ?? null,
+        _direction: request.direction,
+      })
+      .then(({ data, error }) => {
+        // A newer page was requested while this one was in flight
+        if (requestId !== latestRequest.current) return;
+        if (error) {
+          console.error('Error fetching attempts page:', error);
+          setRows([]);
+        } else {
+          setRows((data ?? []) as unknown as T[]);
+        }
+        setLoading(false);
+      });
+  }, [enabled, status, debouncedSearch, pageSize, request, reloadKey]);
+
+  const totalPages = Math.max(1, Math.ceil(total / pageSize));
+
+  /**
+   * Keyset pagination moves relative to the rows on screen, so the reachable
+   * pages are the first, previous, next and last ones.
+   */
+  const goToPage = useCallback((target: number) => {
+    if (target <= 1) {
+      setRequest(FIRST_PAGE);
+    } else if (target >= totalPages) {
+      // Walk back from the oldest row, taking only what the last page holds
+      const lastPageSize = total - (totalPages - 1) * pageSize;
+      setRequest({ page: totalPages, cursor: null, direction: 'prev', limit: lastPageSize || pageSize });
+    } else if (target > request.page && rows.length > 0) {
+      const last = rows[rows.length - 1];
+      setRequest({ page: request.page + 1, cursor: { completed_at: last.completed_at, id: last.id }, direction: 'next' });
+    } else if (target < request.page && rows.length > 0) {
+      const first = rows[0];
+      setRequest({ page: request.page - 1, cursor: { completed_at: first.completed_at, id: first.id }, direction: 'prev' });
+    }
+  }, [request.page, rows, total, totalPages, pageSize]);
+
+  /** Re-read the current page and the total, e.g. after a row was deleted. */
+  const refetch = useCallback(() => setReloadKey(key => key + 1), []);
+
+  const onFirstPage = request.page === 1 && request.cursor === null && request.direction === 'next';
+
+  /**
+   * Shows a newly submitted attempt without reloading. It is the newest row,
+   * so only the first page changes; with a search active the server decides
+   * whether it matches.
+   */
+  const applyInsert = useCallback((row: T) => {
+    if (debouncedSearch) {
+      refetch();
+      return;
+    }
+    if (status !== 'all' && row.qualified !== (status === 'qualified')) return;
+    setTotal(count => count + 1);
+    if (onFirstPage) {
+      setRows(current => current.some(r => r.id === row.id) ? current : [row, ...current].slice(0, pageSize));
+    }
+  }, [debouncedSearch, status, onFirstPage, pageSize, refetch]);
+
+  /** Drops a deleted attempt from the page; re-counts when it was not on screen. */
+  const applyDelete = useCallback((id: string) => {
+    if (rows.some(r => r.id === id)) {
+      setRows(current => current.filter(r => r.id !== id));
+      setTotal(count => Math.max(0, count - 1));
+    } else {
+      setCountKey(key => key + 1);
+    }
+  }, [rows]);
+
+  return {
+    attempts: rows,
+    total,
+    totalPages,
+    currentPage: request.page,
+    loading,
+    goToPage,
+    refetch,
+    applyInsert,
+    applyDelete,
+  };
+};
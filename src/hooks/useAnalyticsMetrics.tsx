@@ -0,0 +1,14 @@
+import { useState, useEffect } from 'react';
+import { subscribeAnalytics, type PublicMetrics } from '@/lib/analyticsSocket';
+
+/**
+ * Live site counters from the `public-analytics` socket. Every component and
+ * tab reads the same browser-wide connection; `null` until the first message.
+ */
+export const useAnalyticsMetrics = () => {
+  const [metrics, setMetrics] = useState<PublicMetrics | null>(null);
+
+  useEffect(() => subscribeAnalytics(setMetrics), []);
+
+  return metrics;
+};
@@ -0,0 +1,184 @@
+import { useState, useEffect, useCallback, useRef } from 'react';
+import type { Question } from '@/data/questions-updated';
+import {
+  clearJournal,
+  newAttemptId,
+  readJournal,
+  writeJournal,
+  type JournalEntry,
+} from '@/lib/attemptOutbox';
+import { beginAssessment, localDeadline } from '@/lib/testClock';
+import { toast } from '@/hooks/use-toast';
+import { ToastAction } from '@/components/ui/toast';
+
+type SaveAttempt = (
+  score: number,
+  totalQuestions: number,
+  answers: Record<number, string>,
+  startedAt: Date,
+  paperSeed: number | null,
+  clientAttemptId: string
+) => Promise<{ error?: Error | null; qualified?: boolean; percentage?: number; queued?: boolean }>;
+
+interface UseAssessmentSessionOptions {
+  userId: string | undefined;
+  /** Wait until the user's attempts are known before resuming anything. */
+  ready: boolean;
+  hasAttempted: boolean;
+  saveAttempt: SaveAttempt;
+}
+
+/**
+ * Anchors a journaled paper to its server-side session: the journal takes the
+ * server's start time and deadline, and the returned `expiresAt` drives the
+ * timer. A paper that was already started gets its original deadline back.
+ */
+const anchor = async (entry: JournalEntry) => {
+  const { startedAt, deadline, expiresAt } = await beginAssessment(entry.clientAttemptId, {
+    startedAt: entry.startedAt,
+    deadline: entry.deadline ?? localDeadline(new Date(entry.startedAt)),
+  });
+  return { entry: { ...entry, startedAt, deadline }, expiresAt };
+};
+
+/**
+ * The paper a candidate is taking, journaled to IndexedDB on every answer.
+ * After a reload or crash the journaled paper comes back with its answers,
+ * question position and deadline; it is cleared once the submission is
+ * accepted or safely queued in the outbox.
+ */
+export const useAssessmentSession = ({ userId, ready, hasAttempted, saveAttempt }: UseAssessmentSessionOptions) => {
+  const [questions, setQuestions] = useState<Question[]>([]);
+  const [resumed, setResumed] = useState<JournalEntry | null>(null);
+  const [expiresAt, setExpiresAt] = useState<number | undefined>(undefined);
+  // A journaled paper is being restored; nothing new should start meanwhile
+  const [resuming, setResuming] = useState(false);
+  const [resumeTries, setResumeTries] = useState(0);
+  const [starting, setStarting] = useState(false);
+  const journal = useRef<JournalEntry | null>(null);
+
+  useEffect(() => {
+    if (!userId || !ready) return;
+    let cancelled = false;
+
+    readJournal(userId).then(async entry => {
+      if (!entry || cancelled) return;
+      if (hasAttempted) {
+        // Submitted from another tab or device since it was written
+        void clearJournal(userId);
+        return;
+      }
+      setResuming(true);
+      const { loadQuestionBank } = await import('@/data/questionShards');
+      const byId = new Map((await loadQuestionBank()).map(q => [q.id, q]));
+      const paper = entry.questionIds.map(id => byId.get(id)).filter((q): q is Question => !!q);
+      if (cancelled || paper.length !== entry.questionIds.length) return;
+      const anchored = await anchor(entry);
+      if (cancelled) return;
+      journal.current = anchored.entry;
+      void writeJournal(journal.current);
+      setResumed(entry);
+      setExpiresAt(anchored.expiresAt);
+      setQuestions(paper);
+    }).catch(error => {
+      console.error('Error resuming assessment:', error);
+      if (cancelled) return;
+      toast({
+        title: "Could not resume your assessment",
+        description: "Your answers are saved on this device. Check your connection and try again.",
+        variant: "destructive",
+        action: (
+          <ToastAction altText="Try again" onClick={() => setResumeTries(tries => tries + 1)}>
+            Try again
+          </ToastAction>
+        ),
+      });
+    }).finally(() => {
+      if (!cancelled) setResuming(false);
+    });
+
+    return () => {
+      cancelled = true;
+      setResuming(false);
+    };
+  }, [userId, ready, hasAttempted, resumeTries]);
+
+  /** Draws a new seeded paper and starts its journal. Throws when the questions cannot be loaded. */
+  const startTest = useCallback(async (count: number) => {
+    if (!userId) return;
+    setStarting(true);
+    try {
+      const [{ getRandomQuestions }, { newPaperSeed }] = await Promise.all([
+        import('@/data/questionShards'),
+        import('@/lib/questionSampler'),
+      ]);
+      const seed = newPaperSeed();
+      const paper = await getRandomQuestions(count, seed);
+      const startedAt = new Date();
+      const { entry, expiresAt: paperExpiresAt } = await anchor({
+        userId,
+        clientAttemptId: newAttemptId(),
+        questionIds: paper.map(q => q.id),
+        paperSeed: seed,
+        startedAt: startedAt.toISOString(),
+        deadline: localDeadline(startedAt),
+        answers: {},
+        currentIndex: 0,
+      });
+      journal.current = entry;
+      void writeJournal(entry);
+      setResumed(null);
+      setExpiresAt(paperExpiresAt);
+      setQuestions(paper);
+    } finally {
+      setStarting(false);
+    }
+  }, [userId]);
+
+  /** Journals the answers given so far; called by TestInterface on every change. */
+  const recordProgress = useCallback((answers: Record<number, string>, currentIndex: number) => {
+    if (!journal.current) return;
+    journal.current = { ...journal.current, answers, currentIndex };
+    void writeJournal(journal.current);
+  }, []);
+
+  const submitTest = useCallback(async (
+    score: number,
+    totalQuestions: number,
+    answers: Record<number, string>
+  ): Promise<{ error: Error | null; qualified: boolean; percentage: number; queued: boolean }> => {
+    const entry = journal.current;
+    if (!entry) {
+      return { error: new Error('Test start time not set'), qualified: false, percentage: 0, queued: false };
+    }
+    const result = await saveAttempt(
+      score, totalQuestions, answers, new Date(entry.startedAt), entry.paperSeed, entry.clientAttemptId
+    );
+    if (!result.error) {
+      journal.current = null;
+      void clearJournal(entry.userId);
+    }
+    return {
+      error: result.error || null,
+      qualified: result.qualified ?? false,
+      percentage: result.percentage ?? 0,
+      queued: result.queued ?? false,
+    };
+  }, [saveAttempt]);
+
+  return {
+    questions,
+    isTestActive: questions.length > 0,
+    /** Answers and position to restore, when the paper came from the journal. */
+    resumed,
+    /** The paper's deadline on the `performance.now()` timeline, for TestTimer. */
+    expiresAt,
+    /** A journaled paper is being restored. */
+    resuming,
+    /** `startTest` is loading a new paper. */
+    starting,
+    startTest,
+    recordProgress,
+    submitTest,
+  };
+};
@@ -0,0 +1,53 @@
+import { useState, useEffect, useCallback } from 'react';
+import { supabase } from '@/integrations/supabase/client';
+import type { RollupDimension, RollupTotal } from '@/lib/attemptAnalytics';
+
+const DIMENSIONS: RollupDimension[] = ['state', 'city', 'process_allocated'];
+
+// The chart shows this many groups per dimension
+const ROLLUP_LIMIT = 15;
+
+const EMPTY: Record<RollupDimension, RollupTotal[]> = { state: [], city: [], process_allocated: [] };
+
+/**
+ * The largest states, cities and processes by attempts. `attempt_rollup_daily`
+ * has a bucket per day and (state, city, process), so it grows without bound
+ * and is summed on the server by `admin_attempt_rollup()`, one call per
+ * dimension, rather than read whole.
+ */
+export const useAttemptRollup = (enabled: boolean) => {
+  const [totals, setTotals] = useState(EMPTY);
+  const [loading, setLoading] = useState(true);
+  const [reloadKey, setReloadKey] = useState(0);
+
+  useEffect(() => {
+    if (!enabled) return;
+    let cancelled = false;
+
+    Promise.all(
+      DIMENSIONS.map(dimension =>
+        supabase.rpc('admin_attempt_rollup', { _dimension: dimension, _limit: ROLLUP_LIMIT })
+      )
+    ).then(results => {
+      if (cancelled) return;
+      const failed = results.find(({ error }) => error);
+      if (failed) {
+        console.error('Error fetching attempt rollup:', failed.error);
+      } else {
+        setTotals(Object.fromEntries(
+          DIMENSIONS.map((dimension, index) => [dimension, (results[index].data ?? []) as RollupTotal[]])
+        ) as Record<RollupDimension, RollupTotal[]>);
+      }
+      setLoading(false);
+    });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [enabled, reloadKey]);
+
+  /** Re-read the totals, e.g. after the triggers changed them. */
+  const refetch = useCallback(() => setReloadKey(key => key + 1), []);
+
+  return { totals, loading, refetch };
+};
@@ -1,6 +1,8 @@
 import { useState, useEffect } from 'react';
 import { supabase } from '@/integrations/supabase/client';
 import { useAuth } from './useAuth';
+import { toast } from './use-toast';
+import { hasPendingAttempt, newAttemptId, startOutbox, submitAttempt } from '@/lib/attemptOutbox';
 
 interface TestAttempt {
   id: string;
@@ -12,6 +14,8 @@ interface TestAttempt {
   answers: Record<number, string> | null;
   started_at: string;
   completed_at: string;
+  paper_seed: number | null;
+  client_attempt_id: string | null;
 }
 
 export const useTestAttempts = () => {
@@ -20,6 +24,20 @@ export const useTestAttempts = () => {
   const [loading, setLoading] = useState(true);
   const [hasAttempted, setHasAttempted] = useState(false);
 
+  // Papers a dropped connection left in the outbox are sent from here on
+  useEffect(() => {
+    if (!user) return;
+    return startOutbox(user.id, rejected => {
+      toast({
+        title: "Saved test could not be submitted",
+        description: `${rejected.error}. Your answers are kept on this device; please contact your administrator.`,
+        variant: "destructive",
+      });
+      // It no longer counts as an attempt on its way to the server
+      fetchAttempts();
+    });
+  }, [user]);
+
   useEffect(() => {
     if (user) {
       fetchAttempts();
@@ -42,7 +60,8 @@ export const useTestAttempts = () => {
 
     if (!error && data) {
       setAttempts(data as TestAttempt[]);
-      setHasAttempted(data.length > 0);
+      // A paper still in the outbox counts; it will reach the server
+      setHasAttempted(data.length > 0 || await hasPendingAttempt(user.id));
     }
     setLoading(false);
   };
@@ -51,7 +70,9 @@ export const useTestAttempts = () => {
     score: number,
     totalQuestions: number,
     answers: Record<number, string>,
-    startedAt: Date
+    startedAt: Date,
+    paperSeed: number | null = null,
+    clientAttemptId: string = newAttemptId()
   ) => {
     if (!user) {
       console.log("saveAttempt: User not authenticated.");
@@ -63,27 +84,32 @@ export const useTestAttempts = () => {
     const percentage = Math.round((score / totalQuestions) * 100);
     const qualified = percentage >= 60;
 
-    const { error } = await supabase
-      .from('test_attempts')
-      .insert({
-        user_id: user.id,
-        score,
-        total_questions: totalQuestions,
-        percentage,
-        qualified,
-        answers,
-        started_at: startedAt.toISOString(),
-        completed_at: new Date().toISOString()
-      });
+    // Sent through the outbox: retried until it arrives, and at most once
+    const { error, queued } = await submitAttempt({
+      user_id: user.id,
+      score,
+      total_questions: totalQuestions,
+      percentage,
+      qualified,
+      answers,
+      started_at: startedAt.toISOString(),
+      completed_at: new Date().toISOString(),
+      // getRandomQuestions(total_questions, paper_seed) rebuilds the paper
+      paper_seed: paperSeed,
+      client_attempt_id: clientAttemptId
+    });
 
     if (error) {
       console.error("saveAttempt: Error inserting test attempt:", error);
+    } else if (queued) {
+      console.log("saveAttempt: Offline, test attempt queued for retry.");
+      setHasAttempted(true);
     } else {
       console.log("saveAttempt: Test attempt inserted successfully.");
       await fetchAttempts();
     }
 
-    return { error, qualified, percentage };
+    return { error, qualified, percentage, queued };
   };
 
   return { attempts, loading, hasAttempted, saveAttempt, refetch: fetchAttempts };
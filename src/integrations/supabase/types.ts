@@ -14,6 +14,95 @@ export type Database = {
   }
   public: {
     Tables: {
+      assessment_sessions: {
+        Row: {
+          client_attempt_id: string
+          deadline: string
+          started_at: string
+          user_id: string
+        }
+        Insert: {
+          client_attempt_id: string
+          deadline: string
+          started_at?: string
+          user_id: string
+        }
+        Update: {
+          client_attempt_id?: string
+          deadline?: string
+          started_at?: string
+          user_id?: string
+        }
+        Relationships: []
+      }
+      attempt_answers: {
+        Row: {
+          attempt_id: string
+          category: string
+          is_correct: boolean
+          module: string
+          question_id: number
+          selected_option: string
+          user_id: string
+        }
+        Insert: {
+          attempt_id: string
+          category: string
+          is_correct: boolean
+          module: string
+          question_id: number
+          selected_option: string
+          user_id: string
+        }
+        Update: {
+          attempt_id?: string
+          category?: string
+          is_correct?: boolean
+          module?: string
+          question_id?: number
+          selected_option?: string
+          user_id?: string
+        }
+        Relationships: [
+          {
+            foreignKeyName: "attempt_answers_attempt_id_fkey"
+            columns: ["attempt_id"]
+            isOneToOne: false
+            referencedRelation: "test_attempts"
+            referencedColumns: ["id"]
+          },
+        ]
+      }
+      attempt_rollup_daily: {
+        Row: {
+          attempts: number
+          city: string
+          day: string
+          percentage_sum: number
+          process_allocated: string
+          qualified: number
+          state: string
+        }
+        Insert: {
+          attempts?: number
+          city: string
+          day: string
+          percentage_sum?: number
+          process_allocated: string
+          qualified?: number
+          state: string
+        }
+        Update: {
+          attempts?: number
+          city?: string
+          day?: string
+          percentage_sum?: number
+          process_allocated?: string
+          qualified?: number
+          state?: string
+        }
+        Relationships: []
+      }
       profiles: {
         Row: {
           created_at: string
@@ -41,11 +130,37 @@ export type Database = {
         }
         Relationships: []
       }
+      question_bank: {
+        Row: {
+          id: number
+          module: string
+          category: string
+          role: string
+          correct_option: string
+        }
+        Insert: {
+          id: number
+          module: string
+          category: string
+          role: string
+          correct_option: string
+        }
+        Update: {
+          id?: number
+          module?: string
+          category?: string
+          role?: string
+          correct_option?: string
+        }
+        Relationships: []
+      }
       test_attempts: {
         Row: {
           answers: Json | null
+          client_attempt_id: string | null
           completed_at: string
           id: string
+          paper_seed: number | null
           percentage: number
           qualified: boolean
           score: number
@@ -55,8 +170,10 @@ export type Database = {
         }
         Insert: {
           answers?: Json | null
+          client_attempt_id?: string | null
           completed_at?: string
           id?: string
+          paper_seed?: number | null
           percentage: number
           qualified: boolean
           score: number
@@ -66,8 +183,10 @@ export type Database = {
         }
         Update: {
           answers?: Json | null
+          client_attempt_id?: string | null
           completed_at?: string
           id?: string
+          paper_seed?: number | null
           percentage?: number
           qualified?: boolean
           score?: number
@@ -152,9 +271,94 @@ export type Database = {
       }
     }
     Views: {
-      [_ in never]: never
+      admin_attempt_rows: {
+        Row: {
+          address: string | null
+          answers: Json | null
+          city: string | null
+          completed_at: string
+          date_of_birth: string | null
+          designation: string | null
+          details_id: string | null
+          email: string | null
+          emp_id: string | null
+          father_name: string | null
+          first_name: string | null
+          full_name: string | null
+          gender: string | null
+          id: string
+          last_name: string | null
+          percentage: number
+          phone_number: string | null
+          process_allocated: string | null
+          qualification: string | null
+          qualified: boolean
+          score: number
+          state: string | null
+          total_questions: number
+          user_id: string
+        }
+        Relationships: []
+      }
     }
     Functions: {
+      admin_attempt_rollup: {
+        Args: {
+          _dimension: string
+          _limit?: number
+        }
+        Returns: {
+          name: string
+          attempts: number
+          qualified: number
+          percentage_sum: number
+        }[]
+      }
+      admin_count_attempts: {
+        Args: {
+          _search?: string | null
+          _status?: string
+        }
+        Returns: number
+      }
+      admin_dashboard_analytics: {
+        Args: Record<PropertyKey, never>
+        Returns: Json
+      }
+      admin_list_attempts: {
+        Args: {
+          _cursor_completed_at?: string | null
+          _cursor_id?: string | null
+          _direction?: string
+          _limit?: number
+          _search?: string | null
+          _status?: string
+        }
+        Returns: Json
+      }
+      admin_question_responses: {
+        Args: {
+          _is_correct?: boolean
+          _limit?: number
+          _question_id: number
+        }
+        Returns: {
+          attempt_id: string
+          user_id: string
+          full_name: string | null
+          emp_id: string | null
+          selected_option: string
+          is_correct: boolean
+          completed_at: string
+        }[]
+      }
+      begin_assessment: {
+        Args: {
+          _client_attempt_id: string
+          _duration_minutes: number
+        }
+        Returns: Json
+      }
       has_role: {
         Args: {
           _role: Database["public"]["Enums"]["app_role"]
@@ -162,6 +366,19 @@ export type Database = {
         }
         Returns: boolean
       }
+      search_candidates: {
+        Args: {
+          _limit?: number
+          _search: string
+        }
+        Returns: {
+          user_id: string
+          full_name: string | null
+          email: string | null
+          emp_id: string | null
+          phone_number: string | null
+        }[]
+      }
     }
     Enums: {
       app_role: "admin" | "user"
@@ -0,0 +1,169 @@
+const SOCKET_URL = 'wss://chelqujdhnjboeeamxtu.supabase.co/functions/v1/public-analytics?share_token=5fa72a22c2b0434f';
+
+/** Web Lock held by the one tab that owns the socket; the others queue on it. */
+const LOCK_NAME = 'public-analytics-socket';
+const CHANNEL_NAME = 'public-analytics';
+
+const BACKOFF_BASE_MS = 1_000;
+const BACKOFF_MAX_MS = 60_000;
+
+/**
+ * @interface PublicMetrics
+ * Site-wide counters pushed by `public-analytics`. An `initial` message has
+ * all of them; a `metrics_update` may carry only the ones that changed.
+ */
+export interface PublicMetrics {
+  total_page_views?: number;
+  total_visitors?: number;
+  active_page_views?: number;
+  generated_at?: string;
+}
+
+type Listener = (metrics: PublicMetrics) => void;
+
+type ChannelMessage =
+  | { type: 'metrics'; metrics: PublicMetrics }
+  | { type: 'snapshot-request' };
+
+const listeners = new Set<Listener>();
+let snapshot: PublicMetrics | null = null;
+let channel: BroadcastChannel | null = null;
+let stopLeading: (() => void) | null = null;
+let abortElection: AbortController | null = null;
+
+const publish = (metrics: PublicMetrics) => {
+  snapshot = metrics;
+  listeners.forEach(listener => listener(metrics));
+};
+
+/**
+ * Folds one socket message into the snapshot. Only the fields present are
+ * replaced, so a delta update costs a shallow merge rather than a rebuild.
+ */
+const applyMessage = (message: any): PublicMetrics | null => {
+  if (message?.type !== 'initial' && message?.type !== 'metrics_update') return null;
+  const incoming = message.data?.metrics;
+  if (!incoming) return null;
+  const base = message.type === 'initial' ? {} : snapshot ?? {};
+  return {
+    ...base,
+    ...incoming,
+    generated_at: incoming.generated_at ?? message.data?.generated_at ?? base.generated_at,
+  };
+};
+
+/**
+ * Keeps the socket open for as long as this tab leads, reconnecting with
+ * full-jitter exponential backoff so clients spread out after an outage
+ * instead of all reconnecting on the same tick. Every parsed update goes to
+ * this tab's listeners and, already parsed, to the other tabs.
+ */
+const lead = () => {
+  let ws: WebSocket | null = null;
+  let retryTimeout: ReturnType<typeof setTimeout> | undefined;
+  let failures = 0;
+  let stopped = false;
+
+  const connect = () => {
+    ws = new WebSocket(SOCKET_URL);
+
+    ws.onmessage = (event) => {
+      let metrics: PublicMetrics | null = null;
+      try {
+        metrics = applyMessage(JSON.parse(event.data));
+      } catch (err) {
+        // Silent error
+      }
+      if (!metrics) return;
+      failures = 0;
+      publish(metrics);
+      channel?.postMessage({ type: 'metrics', metrics } satisfies ChannelMessage);
+    };
+
+    ws.onclose = () => {
+      if (stopped) return;
+      const ceiling = Math.min(BACKOFF_MAX_MS, BACKOFF_BASE_MS * 2 ** failures);
+      failures += 1;
+      retryTimeout = setTimeout(connect, Math.random() * ceiling);
+    };
+
+    ws.onerror = () => {
+      if (ws) ws.close();
+    };
+  };
+
+  connect();
+
+  return () => {
+    stopped = true;
+    clearTimeout(retryTimeout);
+    if (ws) {
+      ws.onclose = null;
+      ws.close();
+    }
+  };
+};
+
+const onChannelMessage = (event: MessageEvent<ChannelMessage>) => {
+  if (event.data.type === 'metrics') {
+    publish(event.data.metrics);
+  } else if (event.data.type === 'snapshot-request' && stopLeading && snapshot) {
+    channel?.postMessage({ type: 'metrics', metrics: snapshot } satisfies ChannelMessage);
+  }
+};
+
+/**
+ * Joins the election for the socket. With Web Locks the lock goes to one tab
+ * at a time and passes to a waiting tab when the leader closes; without
+ * them (or without BroadcastChannel) every tab leads on its own.
+ */
+const start = () => {
+  if (typeof BroadcastChannel === 'undefined' || !navigator.locks) {
+    stopLeading = lead();
+    return;
+  }
+
+  channel = new BroadcastChannel(CHANNEL_NAME);
+  channel.onmessage = onChannelMessage;
+  // A tab joining late asks the leader for what it already has
+  channel.postMessage({ type: 'snapshot-request' } satisfies ChannelMessage);
+
+  const election = new AbortController();
+  abortElection = election;
+  navigator.locks
+    .request(LOCK_NAME, { signal: election.signal }, () => new Promise<void>(release => {
+      const stop = lead();
+      stopLeading = () => {
+        stop();
+        release();
+      };
+    }))
+    .catch(() => {
+      // Aborted while waiting for the lock
+    });
+};
+
+const stop = () => {
+  abortElection?.abort();
+  abortElection = null;
+  stopLeading?.();
+  stopLeading = null;
+  channel?.close();
+  channel = null;
+};
+
+/**
+ * Calls `listener` with the latest metrics now (when known) and on every
+ * update. The connection is shared by every subscriber in every tab of the
+ * browser, and closes when this tab's last subscriber leaves.
+ */
+export const subscribeAnalytics = (listener: Listener) => {
+  listeners.add(listener);
+  if (listeners.size === 1) start();
+  if (snapshot) listener(snapshot);
+
+  return () => {
+    listeners.delete(listener);
+    if (listeners.size === 0) stop();
+  };
+};
@@ -0,0 +1,281 @@
+import { questionIndex, modules } from '@/data/questions-updated';
+
+/**
+ * @interface AdminStats
+ * Aggregate statistics for the admin dashboard.
+ */
+export interface AdminStats {
+  total: number;
+  qualified: number;
+  notQualified: number;
+  averageScore: number;
+}
+
+/**
+ * @interface QuestionAnalysis
+ * Detailed performance metrics for an individual question.
+ */
+export interface QuestionAnalysis {
+  id: number;
+  question: string;
+  correct: number;
+  wrong: number;
+  total: number;
+  options: Record<string, number>;
+  correct_option?: string;
+  compliance: number;
+  wrong_percentage: number;
+  difficulty?: number;
+}
+
+/**
+ * @interface TopicAnalysis
+ * Aggregated performance metrics for a specific training module/topic.
+ */
+export interface TopicAnalysis {
+  id: string;
+  name: string;
+  compliance: number;
+  total: number;
+}
+
+/**
+ * @interface CategoryAnalysis
+ * Aggregated performance metrics for a specific category.
+ */
+export interface CategoryAnalysis {
+  name: string;
+  value: number;
+  count: number;
+}
+
+/**
+ * @interface DashboardAnalytics
+ * Raw correct/total counts as returned by the `admin_dashboard_analytics` RPC.
+ * `summarizeAttempts` produces the same shape from attempts already in memory
+ * and `applyAttempt` keeps it current as attempts are added or removed.
+ */
+export interface DashboardAnalytics {
+  stats: {
+    total: number;
+    qualified: number;
+    not_qualified: number;
+    average_score: number;
+    /** Sum of all percentages, so the average can be updated one attempt at a time. */
+    percentage_sum?: number;
+  };
+  questions: { id: number; correct: number; total: number; options: Record<string, number> }[];
+  modules: { id: string; correct: number; total: number }[];
+  categories: { name: string; correct: number; total: number }[];
+}
+
+export interface AttemptLike {
+  qualified: boolean;
+  percentage: number | string;
+  answers: Record<number, string> | null;
+}
+
+const moduleNames = new Map(modules.map(m => [m.id, m.name]));
+
+const percent = (part: number, whole: number) => Math.round((part / whole) * 100) || 0;
+
+// The options a stored answer may hold; attempt_answers keeps only these
+const ANSWER_OPTIONS = new Set(['A', 'B', 'C', 'D']);
+
+interface Tallies {
+  total: number;
+  qualified: number;
+  percentageSum: number;
+  byQuestion: Map<number, DashboardAnalytics['questions'][number]>;
+  byModule: Map<string, DashboardAnalytics['modules'][number]>;
+  byCategory: Map<string, DashboardAnalytics['categories'][number]>;
+}
+
+/**
+ * Adds (sign 1) or removes (sign -1) one attempt's answers. Each answer is
+ * resolved through `questionIndex` and counted for its question, module and
+ * category in the same step. Answers to unknown questions, and values other
+ * than A-D, are skipped, as the `attempt_answers` trigger skips them.
+ */
+const tallyAttempt = (tallies: Tallies, attempt: AttemptLike, sign: 1 | -1) => {
+  tallies.total += sign;
+  if (attempt.qualified) tallies.qualified += sign;
+  tallies.percentageSum += sign * Number(attempt.percentage);
+  if (!attempt.answers) return;
+
+  Object.entries(attempt.answers).forEach(([qId, selectedOption]) => {
+    const questionId = parseInt(qId);
+    const entry = questionIndex.get(questionId);
+    if (!entry || !ANSWER_OPTIONS.has(selectedOption)) return;
+    const { question } = entry;
+    const correct = selectedOption === entry.correct_option ? sign : 0;
+
+    let questionTally = tallies.byQuestion.get(questionId);
+    if (!questionTally) {
+      questionTally = { id: questionId, correct: 0, total: 0, options: { 'A': 0, 'B': 0, 'C': 0, 'D': 0 } };
+      tallies.byQuestion.set(questionId, questionTally);
+    }
+    questionTally.total += sign;
+    questionTally.options[selectedOption] = (questionTally.options[selectedOption] || 0) + sign;
+    questionTally.correct += correct;
+
+    let moduleTally = tallies.byModule.get(question.module);
+    if (!moduleTally) {
+      moduleTally = { id: question.module, correct: 0, total: 0 };
+      tallies.byModule.set(question.module, moduleTally);
+    }
+    moduleTally.total += sign;
+    moduleTally.correct += correct;
+
+    let categoryTally = tallies.byCategory.get(entry.category);
+    if (!categoryTally) {
+      categoryTally = { name: entry.category, correct: 0, total: 0 };
+      tallies.byCategory.set(entry.category, categoryTally);
+    }
+    categoryTally.total += sign;
+    categoryTally.correct += correct;
+  });
+};
+
+const toAnalytics = ({ total, qualified, percentageSum, byQuestion, byModule, byCategory }: Tallies): DashboardAnalytics => ({
+  stats: {
+    total,
+    qualified,
+    not_qualified: total - qualified,
+    average_score: total > 0 ? Math.round(percentageSum / total) : 0,
+    percentage_sum: percentageSum,
+  },
+  // Entries whose last answer was removed drop out, as they would from a fresh tally
+  questions: [...byQuestion.values()].filter(q => q.total > 0),
+  modules: [...byModule.values()].filter(m => m.total > 0),
+  categories: [...byCategory.values()].filter(c => c.total > 0),
+});
+
+/**
+ * Tallies attempts in the browser into the `DashboardAnalytics` shape.
+ * Used when the RPC is unavailable, e.g. before the migration is applied.
+ * Question, module and category counts are built in one walk over the
+ * answers, with each answer resolved through `questionIndex`.
+ */
+export const summarizeAttempts = (attempts: AttemptLike[]): DashboardAnalytics => {
+  const tallies: Tallies = {
+    total: 0,
+    qualified: 0,
+    percentageSum: 0,
+    byQuestion: new Map(),
+    byModule: new Map(),
+    byCategory: new Map(),
+  };
+  attempts.forEach(attempt => tallyAttempt(tallies, attempt, 1));
+  return toAnalytics(tallies);
+};
+
+/**
+ * Returns `analytics` with one attempt added (sign 1) or removed (sign -1),
+ * for realtime inserts and deletes. Only the current counters are copied, so
+ * the cost depends on the question bank, not on how many attempts exist.
+ */
+export const applyAttempt = (analytics: DashboardAnalytics, attempt: AttemptLike, sign: 1 | -1): DashboardAnalytics => {
+  const { stats } = analytics;
+  const tallies: Tallies = {
+    total: stats.total,
+    qualified: stats.qualified,
+    // Older deployments of the RPC only return the rounded average
+    percentageSum: stats.percentage_sum ?? stats.average_score * stats.total,
+    byQuestion: new Map(analytics.questions.map(q => [q.id, { ...q, options: { ...q.options } }])),
+    byModule: new Map(analytics.modules.map(m => [m.id, { ...m }])),
+    byCategory: new Map(analytics.categories.map(c => [c.name, { ...c }])),
+  };
+  tallyAttempt(tallies, attempt, sign);
+  return toAnalytics(tallies);
+};
+
+export const toAdminStats = (analytics: DashboardAnalytics): AdminStats => ({
+  total: analytics.stats.total,
+  qualified: analytics.stats.qualified,
+  notQualified: analytics.stats.not_qualified,
+  averageScore: analytics.stats.average_score,
+});
+
+/**
+ * Question-by-question correct/wrong counts and compliance percentages, by question id.
+ */
+export const toQuestionAnalysis = (analytics: DashboardAnalytics): QuestionAnalysis[] =>
+  analytics.questions
+    .map(({ id, correct, total, options }) => ({
+      id,
+      question: questionIndex.get(id)?.question.question_text ?? `Question ${id}`,
+      correct,
+      wrong: total - correct,
+      total,
+      options,
+      correct_option: questionIndex.get(id)?.correct_option,
+      compliance: percent(correct, total),
+      wrong_percentage: -percent(total - correct, total),
+    }))
+    .sort((a, b) => a.id - b.id);
+
+/**
+ * Module-level compliance, weakest module first.
+ */
+export const toTopicAnalysis = (analytics: DashboardAnalytics): TopicAnalysis[] =>
+  analytics.modules
+    .map(({ id, correct, total }) => ({
+      id,
+      name: moduleNames.get(id) ?? id,
+      compliance: percent(correct, total),
+      total,
+    }))
+    .sort((a, b) => a.compliance - b.compliance);
+
+/**
+ * Category-level compliance, strongest category first.
+ */
+export const toCategoryAnalysis = (analytics: DashboardAnalytics): CategoryAnalysis[] =>
+  analytics.categories
+    .map(({ name, correct, total }) => ({
+      name,
+      value: percent(correct, total),
+      count: total,
+    }))
+    .sort((a, b) => b.value - a.value);
+
+export type RollupDimension = 'state' | 'city' | 'process_allocated';
+
+/**
+ * @interface RollupTotal
+ * One state, city or process as `admin_attempt_rollup()` sums it from the
+ * trigger-maintained `attempt_rollup_daily` buckets.
+ */
+export interface RollupTotal {
+  name: string;
+  attempts: number;
+  qualified: number;
+  percentage_sum: number;
+}
+
+/**
+ * @interface DemographicAnalysis
+ * Attempts and qualification for one state, city or process.
+ */
+export interface DemographicAnalysis {
+  name: string;
+  total: number;
+  qualified: number;
+  notQualified: number;
+  averageScore: number;
+}
+
+/**
+ * Turns the server's totals for one dimension into chart entries, largest first.
+ */
+export const toDemographicAnalysis = (rows: RollupTotal[]): DemographicAnalysis[] =>
+  rows
+    .map(({ name, attempts, qualified, percentage_sum }) => ({
+      name,
+      total: attempts,
+      qualified,
+      notQualified: attempts - qualified,
+      averageScore: attempts > 0 ? Math.round(Number(percentage_sum) / attempts) : 0,
+    }))
+    .sort((a, b) => b.total - a.total);
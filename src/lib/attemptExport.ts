@@ -0,0 +1,137 @@
+import { supabase } from '@/integrations/supabase/client';
+
+const SUPABASE_URL = import.meta.env.VITE_SUPABASE_URL;
+const SUPABASE_PUBLISHABLE_KEY = import.meta.env.VITE_SUPABASE_PUBLISHABLE_KEY;
+
+const FILE_NAME = 'test_attempts.csv';
+
+/**
+ * @interface ExportProgress
+ * Rows written so far out of the total the server reported.
+ */
+export interface ExportProgress {
+  rows: number;
+  total: number;
+}
+
+interface CsvSink {
+  write(chunk: Uint8Array): Promise<void>;
+  close(): Promise<void>;
+  abort(): Promise<void>;
+}
+
+/**
+ * Where the streamed bytes go. With the File System Access API they are
+ * written straight to the file the admin picked; otherwise the chunks are
+ * kept as-is and handed to one Blob at the end, which never builds the CSV
+ * as a single string.
+ */
+const openSink = async (): Promise<CsvSink | null> => {
+  const picker = (window as any).showSaveFilePicker;
+  if (typeof picker === 'function') {
+    let handle;
+    try {
+      handle = await picker({
+        suggestedName: FILE_NAME,
+        types: [{ description: 'CSV file', accept: { 'text/csv': ['.csv'] } }],
+      });
+    } catch (error: any) {
+      // The admin closed the save dialog
+      if (error?.name === 'AbortError') return null;
+      throw error;
+    }
+    const writable = await handle.createWritable();
+    return {
+      write: chunk => writable.write(chunk),
+      close: () => writable.close(),
+      abort: () => writable.abort(),
+    };
+  }
+
+  const chunks: Uint8Array[] = [];
+  return {
+    write: async chunk => { chunks.push(chunk); },
+    close: async () => {
+      const blob = new Blob(chunks, { type: 'text/csv;charset=utf-8;' });
+      chunks.length = 0;
+      const url = URL.createObjectURL(blob);
+      const link = document.createElement('a');
+      link.setAttribute('href', url);
+      link.setAttribute('download', FILE_NAME);
+      link.style.visibility = 'hidden';
+      document.body.appendChild(link);
+      link.click();
+      document.body.removeChild(link);
+      setTimeout(() => URL.revokeObjectURL(url), 0);
+    },
+    abort: async () => { chunks.length = 0; },
+  };
+};
+
+const QUOTE = 0x22;
+const NEWLINE = 0x0a;
+
+/**
+ * Counts complete CSV lines across chunks, ignoring newlines inside quoted
+ * fields (an address may span lines). Escaped quotes ("") toggle twice.
+ */
+const lineCounter = () => {
+  let inQuotes = false;
+  let lines = 0;
+  return (chunk: Uint8Array) => {
+    for (let i = 0; i < chunk.length; i++) {
+      if (chunk[i] === QUOTE) inQuotes = !inQuotes;
+      else if (chunk[i] === NEWLINE && !inQuotes) lines++;
+    }
+    return lines;
+  };
+};
+
+/**
+ * Downloads every attempt as CSV from the `export-attempts` edge function,
+ * reading the response as a stream. Resolves to false when the admin
+ * cancelled the save dialog.
+ */
+export const downloadAttemptsCsv = async (onProgress?: (progress: ExportProgress) => void): Promise<boolean> => {
+  // Ask for the file first, while the click still counts as a user gesture
+  const sink = await openSink();
+  if (!sink) return false;
+
+  try {
+    const { data: { session } } = await supabase.auth.getSession();
+    const params = new URLSearchParams({
+      locale: navigator.language,
+      tz: Intl.DateTimeFormat().resolvedOptions().timeZone,
+    });
+    const response = await fetch(`${SUPABASE_URL}/functions/v1/export-attempts?${params}`, {
+      headers: {
+        apikey: SUPABASE_PUBLISHABLE_KEY,
+        Authorization: `Bearer ${session?.access_token ?? SUPABASE_PUBLISHABLE_KEY}`,
+      },
+    });
+
+    if (!response.ok || !response.body) {
+      const body = await response.json().catch(() => null);
+      throw new Error(body?.error || `Export failed (${response.status})`);
+    }
+
+    const total = Number(response.headers.get('X-Total-Count')) || 0;
+    const countLines = lineCounter();
+    const reader = response.body.getReader();
+    onProgress?.({ rows: 0, total });
+
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      await sink.write(value);
+      // The first line is the header
+      onProgress?.({ rows: Math.max(0, countLines(value) - 1), total });
+    }
+
+    await sink.close();
+    return true;
+  } catch (error) {
+    await sink.abort().catch(() => undefined);
+    throw error;
+  }
+};
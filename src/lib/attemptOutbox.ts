@@ -0,0 +1,230 @@
+import { supabase } from '@/integrations/supabase/client';
+import type { Database } from '@/integrations/supabase/types';
+import { idbDelete, idbGet, idbGetAll, idbPut } from '@/lib/idb';
+
+/**
+ * Crash-safe assessment state, in IndexedDB.
+ *
+ * The journal holds the paper a candidate is taking and is rewritten on every
+ * answer, so a reload, a crash or a dead battery resumes the same questions
+ * with the same answers. The outbox holds finished papers until the server
+ * confirms them: a failed submission is retried with jittered exponential
+ * backoff, also after a reload, and each paper carries a client-generated
+ * `client_attempt_id` that the database treats as unique, so a resend of a
+ * paper that already arrived is ignored. A paper the server refuses is not
+ * thrown away: it moves to the `attempt-rejected` store, with the reason.
+ */
+
+export type AttemptInsert = Database['public']['Tables']['test_attempts']['Insert'] & {
+  client_attempt_id: string;
+};
+
+/**
+ * @interface JournalEntry
+ * A paper in progress; one per user.
+ */
+export interface JournalEntry {
+  userId: string;
+  clientAttemptId: string;
+  questionIds: number[];
+  paperSeed: number | null;
+  startedAt: string;
+  /** When time runs out; issued by the server when it could be reached. */
+  deadline?: string;
+  answers: Record<number, string>;
+  currentIndex: number;
+}
+
+interface OutboxEntry {
+  payload: AttemptInsert;
+  tries: number;
+  nextAttemptAt: number;
+}
+
+/** A paper the server refused, kept on the device. */
+export interface RejectedAttempt extends OutboxEntry {
+  error: string;
+  rejectedAt: string;
+}
+
+const BACKOFF_BASE_MS = 2_000;
+const BACKOFF_MAX_MS = 60_000;
+
+/** A UUID for a new paper; `crypto.randomUUID` needs a secure context, so fall back to random bytes. */
+export const newAttemptId = (): string => {
+  if (typeof crypto.randomUUID === 'function') return crypto.randomUUID();
+  const bytes = crypto.getRandomValues(new Uint8Array(16));
+  bytes[6] = (bytes[6] & 0x0f) | 0x40;
+  bytes[8] = (bytes[8] & 0x3f) | 0x80;
+  const hex = Array.from(bytes, byte => byte.toString(16).padStart(2, '0')).join('');
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+};
+
+// ---- journal
+
+// Journal writes run one after another, so an older answer never lands after a newer one
+let journalWrites: Promise<void> = Promise.resolve();
+
+const chainJournalWrite = (write: () => Promise<void>) => {
+  journalWrites = journalWrites.then(write).catch(error => {
+    console.error('Error writing answer journal:', error);
+  });
+  return journalWrites;
+};
+
+export const readJournal = (userId: string) =>
+  journalWrites.then(() => idbGet<JournalEntry>('answer-journal', userId)).catch(() => undefined);
+
+export const writeJournal = (entry: JournalEntry) =>
+  chainJournalWrite(() => idbPut('answer-journal', entry.userId, entry));
+
+export const clearJournal = (userId: string) =>
+  chainJournalWrite(() => idbDelete('answer-journal', userId));
+
+// ---- outbox
+
+// Mirrors the stored outbox, and stands in for it when IndexedDB is unavailable
+const pending = new Map<string, OutboxEntry>();
+let activeUserId: string | null = null;
+let flushing: Promise<void> | null = null;
+let retryTimeout: ReturnType<typeof setTimeout> | undefined;
+let onRejected: ((rejected: RejectedAttempt) => void) | null = null;
+
+// No response, or one that may succeed on a later try
+const isRetryable = (status: number) =>
+  status === 0 || status === 408 || status === 429 || status >= 500;
+
+// An expired session is worth a retry only when it can be renewed
+const canRefreshSession = async () => {
+  const { data, error } = await supabase.auth.refreshSession();
+  return !error && Boolean(data.session);
+};
+
+const removeEntry = async (id: string) => {
+  pending.delete(id);
+  await idbDelete('attempt-outbox', id).catch(() => undefined);
+};
+
+const rejectEntry = async (entry: OutboxEntry, error: string) => {
+  const rejected: RejectedAttempt = { ...entry, error, rejectedAt: new Date().toISOString() };
+  await idbPut('attempt-rejected', entry.payload.client_attempt_id, rejected).catch(storeError => {
+    console.error('Error keeping rejected attempt:', storeError, rejected);
+  });
+  await removeEntry(entry.payload.client_attempt_id);
+  return rejected;
+};
+
+/**
+ * One send of a queued paper; returns the outcome and updates the outbox to
+ * match. A paper refused while nobody is waiting for the answer (a flush in
+ * the background) is reported to the `onRejected` listener.
+ */
+const deliver = async (
+  entry: OutboxEntry,
+  background = false
+): Promise<{ error: Error | null; queued: boolean }> => {
+  const id = entry.payload.client_attempt_id;
+  const { error, status } = await supabase
+    .from('test_attempts')
+    .upsert(entry.payload, { onConflict: 'client_attempt_id', ignoreDuplicates: true });
+
+  if (!error) {
+    await removeEntry(id);
+    return { error: null, queued: false };
+  }
+  if (!isRetryable(status) && !(status === 401 && await canRefreshSession())) {
+    console.error('Attempt rejected by the server:', error);
+    const rejected = await rejectEntry(entry, error.message);
+    if (background) onRejected?.(rejected);
+    return { error: new Error(error.message), queued: false };
+  }
+
+  entry.tries += 1;
+  const ceiling = Math.min(BACKOFF_MAX_MS, BACKOFF_BASE_MS * 2 ** entry.tries);
+  entry.nextAttemptAt = Date.now() + Math.random() * ceiling;
+  await idbPut('attempt-outbox', id, entry).catch(() => undefined);
+  return { error: null, queued: true };
+};
+
+const scheduleRetry = () => {
+  clearTimeout(retryTimeout);
+  const due = [...pending.values()]
+    .filter(entry => entry.payload.user_id === activeUserId)
+    .map(entry => entry.nextAttemptAt);
+  if (due.length === 0) return;
+  retryTimeout = setTimeout(() => void flushOutbox(), Math.max(0, Math.min(...due) - Date.now()));
+};
+
+const loadStored = async () => {
+  const stored = await idbGetAll<OutboxEntry>('attempt-outbox').catch(() => [] as OutboxEntry[]);
+  stored.forEach(entry => {
+    if (!pending.has(entry.payload.client_attempt_id)) pending.set(entry.payload.client_attempt_id, entry);
+  });
+};
+
+/**
+ * Sends every paper of the signed-in user that is due. Papers of another
+ * user wait for that user's session, since the insert runs as them.
+ */
+export const flushOutbox = () => {
+  if (!flushing) {
+    flushing = (async () => {
+      await loadStored();
+      const now = Date.now();
+      for (const entry of [...pending.values()]) {
+        if (entry.payload.user_id !== activeUserId || entry.nextAttemptAt > now) continue;
+        await deliver(entry, true);
+      }
+    })()
+      .catch(error => console.error('Error flushing attempt outbox:', error))
+      .finally(() => {
+        flushing = null;
+        scheduleRetry();
+      });
+  }
+  return flushing;
+};
+
+/**
+ * Queues a finished paper and tries to send it right away. `queued` means it
+ * could not be sent yet and stays in the outbox for a retry; `error` means
+ * the server refused it and it was moved to the rejected store.
+ */
+export const submitAttempt = async (payload: AttemptInsert) => {
+  const entry: OutboxEntry = { payload, tries: 0, nextAttemptAt: 0 };
+  pending.set(payload.client_attempt_id, entry);
+  await idbPut('attempt-outbox', payload.client_attempt_id, entry).catch(error => {
+    console.error('Error storing attempt in outbox:', error);
+  });
+  const outcome = await deliver(entry);
+  scheduleRetry();
+  return outcome;
+};
+
+/** Whether a paper of this user is still waiting in the outbox. */
+export const hasPendingAttempt = async (userId: string) => {
+  await loadStored();
+  return [...pending.values()].some(entry => entry.payload.user_id === userId);
+};
+
+/**
+ * Flushes the user's outbox now, on every reconnect and on each backoff
+ * timer; `rejected` is told about papers the server refuses meanwhile.
+ * Returns a cleanup.
+ */
+export const startOutbox = (userId: string, rejected?: (attempt: RejectedAttempt) => void) => {
+  activeUserId = userId;
+  onRejected = rejected ?? null;
+  const onOnline = () => void flushOutbox();
+  window.addEventListener('online', onOnline);
+  void flushOutbox();
+
+  return () => {
+    window.removeEventListener('online', onOnline);
+    if (activeUserId === userId) {
+      activeUserId = null;
+      onRejected = null;
+      clearTimeout(retryTimeout);
+    }
+  };
+};
@@ -0,0 +1,72 @@
+const DB_NAME = 'elderline';
+const DB_VERSION = 3;
+
+/**
+ * Object stores of the app's IndexedDB database. All use out-of-line keys.
+ * Adding a store means adding it here and bumping DB_VERSION; the upgrade
+ * creates whichever stores are missing.
+ */
+const STORES = ['question-shards', 'answer-journal', 'attempt-outbox', 'attempt-rejected'] as const;
+
+export type StoreName = typeof STORES[number];
+
+let opening: Promise<IDBDatabase> | null = null;
+
+const openDatabase = () => {
+  if (opening) return opening;
+  opening = new Promise<IDBDatabase>((resolve, reject) => {
+    if (typeof indexedDB === 'undefined') {
+      reject(new Error('IndexedDB is not available'));
+      return;
+    }
+    const request = indexedDB.open(DB_NAME, DB_VERSION);
+    request.onupgradeneeded = () => {
+      const db = request.result;
+      STORES.forEach(store => {
+        if (!db.objectStoreNames.contains(store)) db.createObjectStore(store);
+      });
+    };
+    request.onsuccess = () => {
+      const db = request.result;
+      // Another tab is upgrading the schema; let it, and reopen on next use
+      db.onversionchange = () => {
+        db.close();
+        opening = null;
+      };
+      resolve(db);
+    };
+    request.onerror = () => reject(request.error);
+  });
+  opening.catch(() => {
+    opening = null;
+  });
+  return opening;
+};
+
+/** Runs one request in its own transaction; resolves once the transaction commits. */
+const run = async <T,>(
+  store: StoreName,
+  mode: IDBTransactionMode,
+  action: (objectStore: IDBObjectStore) => IDBRequest<T>
+): Promise<T> => {
+  const db = await openDatabase();
+  return new Promise<T>((resolve, reject) => {
+    const transaction = db.transaction(store, mode);
+    const request = action(transaction.objectStore(store));
+    transaction.oncomplete = () => resolve(request.result);
+    transaction.onerror = () => reject(transaction.error ?? request.error);
+    transaction.onabort = () => reject(transaction.error ?? new Error('IndexedDB transaction aborted'));
+  });
+};
+
+export const idbGet = <T,>(store: StoreName, key: IDBValidKey) =>
+  run<T | undefined>(store, 'readonly', objectStore => objectStore.get(key));
+
+export const idbGetAll = <T,>(store: StoreName) =>
+  run<T[]>(store, 'readonly', objectStore => objectStore.getAll());
+
+export const idbPut = (store: StoreName, key: IDBValidKey, value: unknown) =>
+  run(store, 'readwrite', objectStore => objectStore.put(value, key)).then(() => undefined);
+
+export const idbDelete = (store: StoreName, key: IDBValidKey) =>
+  run(store, 'readwrite', objectStore => objectStore.delete(key)).then(() => undefined);
@@ -0,0 +1,188 @@
+const ENDPOINT = 'https://chelqujdhnjboeeamxtu.supabase.co/functions/v1/track-pageview';
+
+const STORAGE_KEY = '_pvq';
+const FORMAT_KEY = '_pvq_format';
+
+/** Oldest views are dropped past this, so an offline device cannot grow the queue forever. */
+const MAX_QUEUED = 200;
+/** Views sent per request; a beacon body must stay well under the browsers' 64 KB limit. */
+const MAX_BATCH = 25;
+const FLUSH_INTERVAL_MS = 15_000;
+/** A second view of the same path within this window (a re-render, a double effect) is dropped. */
+const COALESCE_MS = 1_000;
+
+/**
+ * @interface PageView
+ * One page view as `track-pageview` stores it. `eventId` lets the endpoint
+ * ignore a view that is re-sent after a reload raced an in-flight batch.
+ */
+export interface PageView {
+  eventId: string;
+  hostname: string;
+  path: string;
+  pageTitle: string;
+  referrer: string;
+  visitorId: string;
+  sessionId: string;
+  timestamp: string;
+}
+
+let queue: PageView[] = [];
+let loaded = false;
+let sending = false;
+
+/**
+ * What the endpoint takes: `batch` once it accepted `{ events }`, `single`
+ * once it refused that (an older deployment takes one view per request), and
+ * `unknown` until a fetch finds out. Kept across page loads.
+ */
+type BodyFormat = 'unknown' | 'batch' | 'single';
+let format: BodyFormat = 'unknown';
+
+const setFormat = (next: BodyFormat) => {
+  format = next;
+  try {
+    localStorage.setItem(FORMAT_KEY, next);
+  } catch {
+    // Found out again on the next page load
+  }
+};
+
+// A beacon never sees the response, so it sends batches only to an endpoint known to take them
+const sendsBatches = (beacon: boolean) => format === 'batch' || (format === 'unknown' && !beacon);
+
+// A request's worth of queued views, from `from`, and its body
+const nextRequest = (beacon: boolean, from = 0) => {
+  if (!sendsBatches(beacon)) return { views: queue.slice(from, from + 1), body: JSON.stringify(queue[from]) };
+  const views = queue.slice(from, from + MAX_BATCH);
+  return { views, body: JSON.stringify({ events: views }) };
+};
+
+const load = () => {
+  if (loaded) return;
+  loaded = true;
+  try {
+    const saved = localStorage.getItem(FORMAT_KEY);
+    if (saved === 'batch' || saved === 'single') format = saved;
+  } catch {
+    format = 'unknown';
+  }
+  try {
+    const saved = JSON.parse(localStorage.getItem(STORAGE_KEY) ?? '[]');
+    if (Array.isArray(saved)) queue = saved.slice(-MAX_QUEUED);
+  } catch {
+    queue = [];
+  }
+};
+
+const persist = () => {
+  try {
+    if (queue.length) {
+      localStorage.setItem(STORAGE_KEY, JSON.stringify(queue));
+    } else {
+      localStorage.removeItem(STORAGE_KEY);
+    }
+  } catch {
+    // Storage full or blocked; the views still go out from memory
+  }
+};
+
+const remove = (sent: PageView[]) => {
+  const ids = new Set(sent.map(view => view.eventId));
+  queue = queue.filter(view => !ids.has(view.eventId));
+  persist();
+};
+
+/** Adds a view to the queue and sends a batch once a full one is waiting. */
+export const enqueuePageView = (view: PageView) => {
+  load();
+  const last = queue[queue.length - 1];
+  if (
+    last &&
+    last.path === view.path &&
+    last.sessionId === view.sessionId &&
+    Date.parse(view.timestamp) - Date.parse(last.timestamp) < COALESCE_MS
+  ) {
+    return;
+  }
+  queue.push(view);
+  if (queue.length > MAX_QUEUED) queue = queue.slice(-MAX_QUEUED);
+  persist();
+  if (queue.length >= MAX_BATCH) void flushPageViews();
+};
+
+/**
+ * Sends queued views, one batch per request, until the queue is empty or a
+ * request fails. With `beacon` (the page is being hidden or unloaded) the
+ * batches go through `navigator.sendBeacon`, which the browser delivers
+ * after the page is gone; the body is a plain string so no CORS preflight is
+ * needed. Views stay queued until a request for them succeeds. An endpoint
+ * that rejects `{ events }` gets the views one at a time instead.
+ */
+export const flushPageViews = async ({ beacon = false } = {}) => {
+  load();
+  if (beacon) {
+    if (typeof navigator.sendBeacon !== 'function') return;
+    // Batches a running fetch already holds are sent again; eventId dedupes them
+    let accepted = 0;
+    while (accepted < queue.length) {
+      const { views, body } = nextRequest(true, accepted);
+      if (!navigator.sendBeacon(ENDPOINT, body)) break;
+      accepted += views.length;
+    }
+    if (accepted) remove(queue.slice(0, accepted));
+    return;
+  }
+
+  if (sending) return;
+  sending = true;
+  try {
+    while (queue.length) {
+      const batched = sendsBatches(false);
+      const { views, body } = nextRequest(false);
+      const response = await fetch(ENDPOINT, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body,
+        keepalive: true,
+      });
+      if (batched && [400, 413, 415, 422].includes(response.status)) {
+        setFormat('single');
+        continue;
+      }
+      if (!response.ok) break;
+      if (batched && format === 'unknown') setFormat('batch');
+      remove(views);
+    }
+  } catch (err) {
+    console.log('Analytics error:', err);
+  } finally {
+    sending = false;
+  }
+};
+
+/**
+ * Flushes on a timer, when the tab is hidden and when it is closed, and once
+ * on start for views a previous page load left unsent. Returns a cleanup.
+ */
+export const startPageViewQueue = () => {
+  load();
+  const interval = window.setInterval(() => void flushPageViews(), FLUSH_INTERVAL_MS);
+  const onHidden = () => {
+    if (document.visibilityState === 'hidden') void flushPageViews({ beacon: true });
+  };
+  const onPageHide = () => void flushPageViews({ beacon: true });
+  const onOnline = () => void flushPageViews();
+
+  document.addEventListener('visibilitychange', onHidden);
+  window.addEventListener('pagehide', onPageHide);
+  window.addEventListener('online', onOnline);
+  if (queue.length) void flushPageViews();
+
+  return () => {
+    window.clearInterval(interval);
+    document.removeEventListener('visibilitychange', onHidden);
+    window.removeEventListener('pagehide', onPageHide);
+    window.removeEventListener('online', onOnline);
+  };
+};
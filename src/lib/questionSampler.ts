@@ -0,0 +1,120 @@
+import type { Question } from '@/data/questions-updated';
+
+/**
+ * mulberry32: a tiny 32-bit PRNG. The same seed always yields the same
+ * sequence, which is what lets a paper be rebuilt from its seed.
+ */
+export const mulberry32 = (seed: number) => () => {
+  seed |= 0;
+  seed = (seed + 0x6d2b79f5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+/** A fresh unsigned 32-bit seed for a new paper. */
+export const newPaperSeed = (): number => {
+  if (typeof crypto !== 'undefined' && typeof crypto.getRandomValues === 'function') {
+    return crypto.getRandomValues(new Uint32Array(1))[0];
+  }
+  return Math.floor(Math.random() * 4294967296);
+};
+
+/**
+ * Moves a uniformly chosen `take` of `items[0..length)` to the front, in
+ * random order: the first `take` steps of a Fisher-Yates shuffle.
+ */
+const partialShuffle = <T,>(items: T[], length: number, take: number, random: () => number) => {
+  for (let i = 0; i < take; i++) {
+    const j = i + Math.floor(random() * (length - i));
+    const swap = items[i];
+    items[i] = items[j];
+    items[j] = swap;
+  }
+};
+
+/** Up to `count` questions drawn uniformly from `pool`, in random order. */
+export const drawQuestions = (pool: readonly Question[], count: number, seed: number): Question[] => {
+  const random = mulberry32(seed);
+  const items = [...pool];
+  const take = Math.min(Math.max(count, 0), items.length);
+  partialShuffle(items, items.length, take, random);
+  items.length = take;
+  return items;
+};
+
+/**
+ * @interface QuestionSampler
+ * Buckets of one question bank, built once, and the paper draws over them.
+ * Buckets are shared; callers must not mutate them.
+ */
+export interface QuestionSampler {
+  categories: readonly string[];
+  byCategory: ReadonlyMap<string, readonly Question[]>;
+  byModule: ReadonlyMap<string, readonly Question[]>;
+  byRole: Readonly<Record<'CO' | 'FRO', readonly Question[]>>;
+  /**
+   * A category-balanced paper: `count` split evenly across categories, the
+   * extra questions going to randomly chosen ones, in random order.
+   */
+  balanced(count: number, seed: number): Question[];
+  /** Up to `count` questions drawn uniformly from `pool`, in random order. */
+  draw(pool: readonly Question[], count: number, seed: number): Question[];
+}
+
+const bucket = <K,>(questions: readonly Question[], keys: (q: Question) => K[]) => {
+  const buckets = new Map<K, Question[]>();
+  questions.forEach(q => {
+    keys(q).forEach(key => {
+      const list = buckets.get(key);
+      if (list) list.push(q);
+      else buckets.set(key, [q]);
+    });
+  });
+  return buckets;
+};
+
+export const createQuestionSampler = (questions: readonly Question[]): QuestionSampler => {
+  const byCategory = bucket(questions, q => [q.category]);
+  const byModule = bucket(questions, q => [q.module]);
+  const byRole = bucket(questions, q => q.role === 'BOTH' ? ['CO', 'FRO'] : [q.role]);
+  const categories = [...byCategory.keys()];
+
+  // Reused between draws so a paper allocates only its result array
+  const largest = Math.max(0, ...[...byCategory.values()].map(list => list.length));
+  const scratch: Question[] = new Array(largest);
+  const order: string[] = [...categories];
+
+  const balanced = (count: number, seed: number) => {
+    const random = mulberry32(seed);
+    const perCategory = Math.floor(count / categories.length);
+    const remainder = count % categories.length;
+
+    // Which categories get the extra questions
+    for (let i = 0; i < categories.length; i++) order[i] = categories[i];
+    partialShuffle(order, order.length, order.length, random);
+
+    const paper: Question[] = [];
+    order.forEach((category, index) => {
+      const list = byCategory.get(category)!;
+      const take = Math.min(perCategory + (index < remainder ? 1 : 0), list.length);
+      for (let i = 0; i < list.length; i++) scratch[i] = list[i];
+      partialShuffle(scratch, list.length, take, random);
+      for (let i = 0; i < take; i++) paper.push(scratch[i]);
+    });
+    scratch.fill(undefined as unknown as Question);
+
+    // Interleave the categories
+    partialShuffle(paper, paper.length, paper.length, random);
+    return paper.slice(0, count);
+  };
+
+  return {
+    categories,
+    byCategory,
+    byModule,
+    byRole: { CO: byRole.get('CO') ?? [], FRO: byRole.get('FRO') ?? [] },
+    balanced,
+    draw: drawQuestions,
+  };
+};
@@ -0,0 +1,96 @@
+import { supabase } from '@/integrations/supabase/client';
+
+/**
+ * The assessment clock. A paper's deadline is issued by the server
+ * (`begin_assessment`) and kept in the journal; on the device it becomes a
+ * target on the `performance.now()` timeline, which is monotonic and does
+ * not jump with the wall clock. The remaining time is always computed from
+ * that target, never counted down, so a throttled background tab or a
+ * reload cannot make it drift or restart.
+ */
+
+export const TEST_DURATION_MINUTES = 20; // 20 minutes for 20 questions
+
+interface ServerSession {
+  started_at: string;
+  deadline: string;
+  server_now: string;
+}
+
+/**
+ * Starts (or, for a paper already started, looks up) the signed-in user's
+ * server-side session of a paper. Returns the session's start time and deadline, and `expiresAt`,
+ * the deadline on this page's `performance.now()` timeline. When the server
+ * cannot be reached the journaled deadline is used against the device clock.
+ */
+export const beginAssessment = async (
+  clientAttemptId: string,
+  fallback: { startedAt: string; deadline: string }
+): Promise<{ startedAt: string; deadline: string; expiresAt: number }> => {
+  try {
+    const { data, error } = await supabase.rpc('begin_assessment', {
+      _client_attempt_id: clientAttemptId,
+      _duration_minutes: TEST_DURATION_MINUTES,
+    });
+    if (error) throw error;
+    const receivedAt = performance.now();
+    const session = data as unknown as ServerSession;
+    return {
+      startedAt: session.started_at,
+      deadline: session.deadline,
+      expiresAt: receivedAt + Date.parse(session.deadline) - Date.parse(session.server_now),
+    };
+  } catch (error) {
+    console.error('Error starting assessment session; using the saved deadline:', error);
+    return { ...fallback, expiresAt: performance.now() + Date.parse(fallback.deadline) - Date.now() };
+  }
+};
+
+/** A deadline `TEST_DURATION_MINUTES` from now, by the device clock. */
+export const localDeadline = (startedAt: Date = new Date()) =>
+  new Date(startedAt.getTime() + TEST_DURATION_MINUTES * 60_000).toISOString();
+
+interface TestClockHandlers {
+  /** Whole seconds left, rounded up; called only when the value changes. */
+  onTick: (secondsRemaining: number) => void;
+  /** Called once, when the time is up. */
+  onExpire: () => void;
+}
+
+/**
+ * Runs the clock towards `expiresAt` (a `performance.now()` value). Each tick
+ * is scheduled for the moment the displayed second changes, and a tab coming
+ * back into view re-checks at once. Returns a function that stops it.
+ */
+export const startTestClock = (expiresAt: number, { onTick, onExpire }: TestClockHandlers) => {
+  let timeout: ReturnType<typeof setTimeout> | undefined;
+  let lastSeconds = -1;
+  let stopped = false;
+
+  const stop = () => {
+    stopped = true;
+    clearTimeout(timeout);
+    document.removeEventListener('visibilitychange', tick);
+  };
+
+  function tick() {
+    if (stopped) return;
+    clearTimeout(timeout);
+    const remaining = expiresAt - performance.now();
+    const seconds = Math.max(0, Math.ceil(remaining / 1000));
+    if (seconds !== lastSeconds) {
+      lastSeconds = seconds;
+      onTick(seconds);
+    }
+    if (remaining <= 0) {
+      stop();
+      onExpire();
+      return;
+    }
+    timeout = setTimeout(tick, remaining % 1000 || 1000);
+  }
+
+  document.addEventListener('visibilitychange', tick);
+  tick();
+  return stop;
+};
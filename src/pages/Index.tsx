@@ -1,60 +1,70 @@
-import { useState, useEffect } from "react";
+import { lazy, Suspense } from "react";
 import { useNavigate } from "react-router-dom";
 import { LandingPage } from "@/components/LandingPage";
-import { TestInterface } from "@/components/TestInterface";
-import { getRandomQuestions, Question } from "@/data/questions";
 import { useAuth } from "@/hooks/useAuth";
 import { useTestAttempts } from "@/hooks/useTestAttempts";
+import { useAssessmentSession } from "@/hooks/useAssessmentSession";
+import { useToast } from "@/hooks/use-toast";
+import { ToastAction } from "@/components/ui/toast";
 
 const QUESTIONS_PER_TEST = 20;
 
+// The test screen and the question shards load when a test starts, not with the landing page
+const TestInterface = lazy(() => import("@/components/TestInterface").then(m => ({ default: m.TestInterface })));
+
 const Index = () => {
-  const [isTestActive, setIsTestActive] = useState(false);
-  const [testQuestions, setTestQuestions] = useState<Question[]>([]);
-  const [testStartTime, setTestStartTime] = useState<Date | null>(null);
-  
   const { user, loading: authLoading } = useAuth();
   const { hasAttempted, loading: attemptsLoading, saveAttempt } = useTestAttempts();
   const navigate = useNavigate();
+  const { toast } = useToast();
+  const {
+    questions: testQuestions,
+    isTestActive,
+    resumed,
+    expiresAt,
+    resuming,
+    starting,
+    startTest,
+    recordProgress,
+    submitTest,
+  } = useAssessmentSession({ userId: user?.id, ready: !attemptsLoading, hasAttempted, saveAttempt });
 
-  const handleStartTest = () => {
+  const handleStartTest = async () => {
     if (!user) {
       navigate('/auth');
       return;
     }
     
-    const randomQuestions = getRandomQuestions(QUESTIONS_PER_TEST);
-    setTestQuestions(randomQuestions);
-    setTestStartTime(new Date());
-    setIsTestActive(true);
-  };
-
-
-
-  const handleSubmitTest = async (
-    score: number,
-    totalQuestions: number,
-    answers: Record<number, string>
-  ): Promise<{ error: Error | null; qualified: boolean; percentage: number }> => {
-    if (testStartTime) {
-      const result = await saveAttempt(score, totalQuestions, answers, testStartTime);
-      return { 
-        error: result.error || null, 
-        qualified: result.qualified ?? false, 
-        percentage: result.percentage ?? 0 
-      };
+    try {
+      await startTest(QUESTIONS_PER_TEST);
+    } catch (error) {
+      console.error('Error loading questions:', error);
+      toast({
+        title: "Could not start the assessment",
+        description: "The questions could not be loaded. Check your connection and try again.",
+        variant: "destructive",
+        action: (
+          <ToastAction altText="Try again" onClick={() => void handleStartTest()}>
+            Try again
+          </ToastAction>
+        ),
+      });
     }
-    return { error: new Error('Test start time not set'), qualified: false, percentage: 0 };
   };
 
   if (isTestActive && testQuestions.length > 0) {
     return (
-      <TestInterface 
-        questions={testQuestions} 
-
-        onSubmit={handleSubmitTest}
-        hasAttempted={hasAttempted}
-      />
+      <Suspense fallback={null}>
+        <TestInterface 
+          questions={testQuestions} 
+          initialAnswers={resumed?.answers}
+          initialIndex={resumed?.currentIndex}
+          onProgress={recordProgress}
+          expiresAt={expiresAt}
+          onSubmit={submitTest}
+          hasAttempted={hasAttempted}
+        />
+      </Suspense>
     );
   }
 
@@ -64,7 +74,8 @@ const Index = () => {
       totalQuestions={QUESTIONS_PER_TEST}
       user={user}
       hasAttempted={hasAttempted}
-      loading={authLoading || attemptsLoading}
+      loading={authLoading || attemptsLoading || resuming}
+      starting={starting}
     />
   );
 };
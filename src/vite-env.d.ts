@@ -1 +1,15 @@
 /// <reference types="vite/client" />
+
+// Emitted by the questionShards plugin in vite.config.ts
+declare module 'virtual:question-shards' {
+  import type { Module } from '@/data/questions-updated';
+
+  const manifest: {
+    /** `module:<id>` and `role:<CO|FRO>` shards: URL of the JSON and hash of its content. */
+    shards: Record<string, { url: string; hash: string }>;
+    modules: Module[];
+    /** Question ids in bank order. */
+    order: number[];
+  };
+  export default manifest;
+}
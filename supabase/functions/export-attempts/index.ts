@@ -0,0 +1,200 @@
+import { createClient } from '@supabase/supabase-js'
+
+const corsHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Expose-Headers': 'content-disposition, x-total-count',
+}
+
+// Attempts read per round trip; each page is written out before the next is fetched
+const PAGE_SIZE = 1000
+
+const HEADERS = [
+  'Name',
+  'Employee ID',
+  'Email',
+  'First Name',
+  'Last Name',
+  'Phone Number',
+  'Gender',
+  'State',
+  'City',
+  'Process Allocated',
+  'Designation',
+  'Father Name',
+  'Address',
+  'Qualification',
+  'Date of Birth',
+  'Score',
+  'Percentage',
+  'Status',
+  'Date',
+]
+
+const quoted = (value: unknown) => `"${String(value || 'N/A').replace(/"/g, '""')}"`
+
+const jsonError = (message: string, status: number) =>
+  new Response(JSON.stringify({ error: message }), {
+    status,
+    headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+  })
+
+;(globalThis as any).Deno?.serve(async (req: any) => {
+  if (req.method === 'OPTIONS') {
+    return new Response('ok', { headers: corsHeaders })
+  }
+
+  try {
+    // 1. Verify the caller is an admin, as fetch-admin-data does
+    const authHeader = req.headers.get('Authorization');
+    if (!authHeader) {
+      return jsonError('No authorization header', 401);
+    }
+
+    const supabaseClient = createClient(
+      (globalThis as any).Deno?.env?.get('VITE_SUPABASE_URL') ?? '',
+      (globalThis as any).Deno?.env?.get('VITE_SUPABASE_ANON_KEY') ?? '',
+      {
+        global: {
+          headers: { Authorization: authHeader },
+        },
+      }
+    )
+
+    const { data: { user }, error: userError } = await supabaseClient.auth.getUser();
+    if (userError || !user) {
+      return jsonError('Invalid token', 401);
+    }
+
+    const { data: roleData, error: roleError } = await supabaseClient
+      .from('user_roles')
+      .select('role')
+      .eq('user_id', user.id)
+      .eq('role', 'admin')
+      .maybeSingle();
+
+    if (roleError || !roleData) {
+      return jsonError('Unauthorized: Admin access required', 403);
+    }
+
+    const supabaseAdmin = createClient(
+      (globalThis as any).Deno?.env?.get('SUPABASE_URL') ?? '',
+      (globalThis as any).Deno?.env?.get('SUPABASE_SERVICE_ROLE_KEY') ?? ''
+    )
+
+    // 2. Dates are formatted the way the dashboard shows them to this admin
+    const url = new URL(req.url);
+    const locale = url.searchParams.get('locale') || 'en-IN';
+    const timeZone = url.searchParams.get('tz') || 'Asia/Kolkata';
+    let formatter: Intl.DateTimeFormat;
+    try {
+      // The same fields Date#toLocaleString() prints in the browser
+      formatter = new Intl.DateTimeFormat(locale, {
+        timeZone,
+        year: 'numeric', month: 'numeric', day: 'numeric',
+        hour: 'numeric', minute: '2-digit', second: '2-digit',
+      });
+    } catch {
+      formatter = new Intl.DateTimeFormat('en-IN', {
+        timeZone: 'Asia/Kolkata',
+        year: 'numeric', month: 'numeric', day: 'numeric',
+        hour: 'numeric', minute: '2-digit', second: '2-digit',
+      });
+    }
+    const formatDate = (value: string) => formatter.format(new Date(value));
+
+    const { count, error: countError } = await supabaseAdmin
+      .from('test_attempts')
+      .select('id', { count: 'exact', head: true });
+
+    if (countError) {
+      console.error('Error counting attempts:', countError);
+      throw countError;
+    }
+
+    // 3. Stream the CSV, walking admin_attempt_rows (completed_at DESC, id DESC) one page per pull
+    const encoder = new TextEncoder();
+    let cursor: { completed_at: string; id: string } | null = null;
+    let headerSent = false;
+
+    const body = new ReadableStream<Uint8Array>({
+      async pull(controller) {
+        if (!headerSent) {
+          headerSent = true;
+          controller.enqueue(encoder.encode(HEADERS.join(',') + '\n'));
+          return;
+        }
+
+        let query = supabaseAdmin
+          .from('admin_attempt_rows')
+          .select(`
+            id, score, percentage, qualified, completed_at,
+            full_name, emp_id, email,
+            first_name, last_name, phone_number, gender, state, city, process_allocated,
+            designation, father_name, address, qualification, date_of_birth
+          `)
+          .order('completed_at', { ascending: false })
+          .order('id', { ascending: false })
+          .limit(PAGE_SIZE);
+
+        if (cursor) {
+          const at = `"${cursor.completed_at}"`;
+          query = query.or(`completed_at.lt.${at},and(completed_at.eq.${at},id.lt.${cursor.id})`);
+        }
+
+        const { data: page, error: pageError } = await query;
+        if (pageError) {
+          console.error('Error fetching attempts page:', pageError);
+          controller.error(pageError);
+          return;
+        }
+        if (!page || page.length === 0) {
+          controller.close();
+          return;
+        }
+
+        const lines = page.map((row: any) => [
+          quoted(row.full_name),
+          quoted(row.emp_id),
+          quoted(row.email),
+          quoted(row.first_name),
+          quoted(row.last_name),
+          quoted(row.phone_number),
+          quoted(row.gender),
+          quoted(row.state),
+          quoted(row.city),
+          quoted(row.process_allocated),
+          quoted(row.designation),
+          quoted(row.father_name),
+          quoted(row.address),
+          quoted(row.qualification),
+          quoted(row.date_of_birth),
+          row.score,
+          row.percentage,
+          row.qualified ? 'Qualified' : 'Not Qualified',
+          quoted(formatDate(row.completed_at)),
+        ].join(','));
+
+        controller.enqueue(encoder.encode(lines.join('\n') + '\n'));
+
+        const last = page[page.length - 1];
+        cursor = { completed_at: last.completed_at, id: last.id };
+        if (page.length < PAGE_SIZE) controller.close();
+      },
+    });
+
+    return new Response(body, {
+      status: 200,
+      headers: {
+        ...corsHeaders,
+        'Content-Type': 'text/csv; charset=utf-8',
+        'Content-Disposition': 'attachment; filename="test_attempts.csv"',
+        'X-Total-Count': String(count ?? 0),
+      },
+    })
+
+  } catch (e) {
+    console.error('Edge Function error:', e);
+    return jsonError((e as any).message || 'Internal server error', 500);
+  }
+})
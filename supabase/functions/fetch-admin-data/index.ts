@@ -2,9 +2,54 @@ import { createClient } from '@supabase/supabase-js'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, if-none-match',
+  'Access-Control-Expose-Headers': 'etag',
 }
 
+// Admin checks are remembered per token for this long, so a polling
+// dashboard does not hit auth and user_roles on every request
+const ROLE_CACHE_TTL_MS = 60_000
+const ROLE_CACHE_MAX_ENTRIES = 500
+
+// Bodies smaller than this are sent uncompressed
+const COMPRESS_MIN_BYTES = 1024
+
+const adminTokens = new Map<string, number>()
+
+const isCachedAdmin = (token: string) => {
+  const expires = adminTokens.get(token)
+  if (expires === undefined) return false
+  if (expires > Date.now()) return true
+  adminTokens.delete(token)
+  return false
+}
+
+const rememberAdmin = (token: string) => {
+  if (adminTokens.size >= ROLE_CACHE_MAX_ENTRIES) {
+    const now = Date.now()
+    for (const [key, expires] of adminTokens) {
+      if (expires <= now) adminTokens.delete(key)
+    }
+    // Still full: drop the oldest entry (Maps iterate in insertion order)
+    if (adminTokens.size >= ROLE_CACHE_MAX_ENTRIES) {
+      adminTokens.delete(adminTokens.keys().next().value as string)
+    }
+  }
+  adminTokens.set(token, Date.now() + ROLE_CACHE_TTL_MS)
+}
+
+const sha1 = async (text: string) => {
+  const digest = await crypto.subtle.digest('SHA-1', new TextEncoder().encode(text))
+  return [...new Uint8Array(digest)].map(b => b.toString(16).padStart(2, '0')).join('')
+}
+
+// If-None-Match may list several tags, possibly weak (W/"...")
+const etagMatches = (header: string | null, etag: string) =>
+  !!header && header.split(',').some(tag => {
+    const value = tag.trim()
+    return value === '*' || value.replace(/^W\//, '') === etag
+  })
+
 ;(globalThis as any).Deno?.serve(async (req: any) => {
   if (req.method === 'OPTIONS') {
     return new Response('ok', { headers: corsHeaders })
@@ -20,38 +65,42 @@ const corsHeaders = {
       });
     }
 
-    const supabaseClient = createClient(
-      (globalThis as any).Deno?.env?.get('VITE_SUPABASE_URL') ?? '',
-      (globalThis as any).Deno?.env?.get('VITE_SUPABASE_ANON_KEY') ?? '',
-      {
-        global: {
-          headers: { Authorization: authHeader },
-        },
+    if (!isCachedAdmin(authHeader)) {
+      const supabaseClient = createClient(
+        (globalThis as any).Deno?.env?.get('VITE_SUPABASE_URL') ?? '',
+        (globalThis as any).Deno?.env?.get('VITE_SUPABASE_ANON_KEY') ?? '',
+        {
+          global: {
+            headers: { Authorization: authHeader },
+          },
+        }
+      )
+
+      // Check if the user is an admin
+      const { data: { user }, error: userError } = await supabaseClient.auth.getUser();
+      if (userError || !user) {
+        return new Response(JSON.stringify({ error: 'Invalid token' }), {
+          status: 401,
+          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        });
       }
-    )
 
-    // Check if the user is an admin
-    const { data: { user }, error: userError } = await supabaseClient.auth.getUser();
-    if (userError || !user) {
-      return new Response(JSON.stringify({ error: 'Invalid token' }), {
-        status: 401,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
-      });
-    }
+      // Check for admin role
+      const { data: roleData, error: roleError } = await supabaseClient
+        .from('user_roles')
+        .select('role')
+        .eq('user_id', user.id)
+        .eq('role', 'admin')
+        .maybeSingle();
+
+      if (roleError || !roleData) {
+        return new Response(JSON.stringify({ error: 'Unauthorized: Admin access required' }), {
+          status: 403,
+          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        });
+      }
 
-    // Check for admin role
-    const { data: roleData, error: roleError } = await supabaseClient
-      .from('user_roles')
-      .select('role')
-      .eq('user_id', user.id)
-      .eq('role', 'admin')
-      .maybeSingle();
-
-    if (roleError || !roleData) {
-      return new Response(JSON.stringify({ error: 'Unauthorized: Admin access required' }), {
-        status: 403,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
-      });
+      rememberAdmin(authHeader);
     }
 
     // 2. Create a client with Service Role Key to bypass RLS for data fetching
@@ -60,53 +109,106 @@ const corsHeaders = {
       (globalThis as any).Deno?.env?.get('SUPABASE_SERVICE_ROLE_KEY') ?? ''
     )
 
-    // 3. Fetch test_attempts with profiles
-    const { data: attemptsData, error: attemptsError } = await supabaseAdmin
-      .from('test_attempts')
-      .select(`
-        *,
-        profiles (email, full_name)
-      `)
-      .order('completed_at', { ascending: false });
-
-    if (attemptsError) {
-      console.error('Error fetching attempts:', attemptsError);
-      throw attemptsError;
+    // 3. Version the data cheaply: attempt count and newest completed_at,
+    // plus count and newest updated_at of profiles and user_details, which
+    // the payload also carries
+    const [attemptsVersion, profilesVersion, detailsVersion] = await Promise.all([
+      supabaseAdmin
+        .from('test_attempts')
+        .select('completed_at', { count: 'exact' })
+        .order('completed_at', { ascending: false })
+        .limit(1),
+      supabaseAdmin
+        .from('profiles')
+        .select('updated_at', { count: 'exact' })
+        .order('updated_at', { ascending: false })
+        .limit(1),
+      supabaseAdmin
+        .from('user_details')
+        .select('updated_at', { count: 'exact' })
+        .order('updated_at', { ascending: false })
+        .limit(1),
+    ]);
+
+    if (attemptsVersion.error) {
+      console.error('Error reading attempts version:', attemptsVersion.error);
+      throw attemptsVersion.error;
+    }
+    if (profilesVersion.error) {
+      console.error('Error reading profiles version:', profilesVersion.error);
+      throw profilesVersion.error;
+    }
+    if (detailsVersion.error) {
+      console.error('Error reading user details version:', detailsVersion.error);
+      throw detailsVersion.error;
     }
 
-    // 4. Fetch user_details for the users found in attempts
-    const userIds = attemptsData.map((a: any) => a.user_id);
-    // Remove duplicates
-    const uniqueUserIds = [...new Set(userIds)];
+    const etag = `"${await sha1([
+      attemptsVersion.count ?? 0,
+      attemptsVersion.data?.[0]?.completed_at ?? '',
+      profilesVersion.count ?? 0,
+      profilesVersion.data?.[0]?.updated_at ?? '',
+      detailsVersion.count ?? 0,
+      detailsVersion.data?.[0]?.updated_at ?? '',
+    ].join('|'))}"`;
+
+    const cacheHeaders = {
+      ETag: etag,
+      // Browsers keep the body but revalidate it on every request
+      'Cache-Control': 'private, no-cache',
+      Vary: 'Authorization, Accept-Encoding',
+    };
+
+    if (etagMatches(req.headers.get('If-None-Match'), etag)) {
+      return new Response(null, { status: 304, headers: { ...corsHeaders, ...cacheHeaders } });
+    }
 
-    let userDetailsMap: Record<string, any> = {};
+    // 4. Fetch attempts joined to profiles and user_details in one statement
+    const { data: rows, error: rowsError } = await supabaseAdmin
+      .from('admin_attempt_rows')
+      .select('*')
+      .order('completed_at', { ascending: false })
+      .order('id', { ascending: false });
 
-    if (uniqueUserIds.length > 0) {
-      const { data: detailsData, error: detailsError } = await supabaseAdmin
-        .from('user_details')
-        .select('*')
-        .in('user_id', uniqueUserIds);
-
-      if (detailsError) {
-        console.error('Error fetching user details:', detailsError);
-        // We continue even if details fail, just without details
-      } else if (detailsData) {
-        // Create a map for easy lookup
-        detailsData.forEach((detail: any) => {
-          userDetailsMap[detail.user_id] = detail;
-        });
-      }
+    if (rowsError) {
+      console.error('Error fetching attempts:', rowsError);
+      throw rowsError;
     }
 
-    // 5. Merge data
-    const mergedData = attemptsData.map((attempt: any) => ({
+    // 5. Reshape to the { ...attempt, profiles, userDetails } the frontend expects
+    const mergedData = rows.map(({
+      email, full_name, emp_id,
+      details_id, first_name, last_name, phone_number, gender, state, city, process_allocated,
+      designation, father_name, address, qualification, date_of_birth,
+      ...attempt
+    }: any) => ({
       ...attempt,
-      // Add user_details to the response mapped to 'userDetails' to match frontend interface
-      userDetails: userDetailsMap[attempt.user_id] || null
+      profiles: { email, full_name, emp_id },
+      userDetails: details_id ? {
+        id: details_id, user_id: attempt.user_id, first_name, last_name, phone_number, gender, state, city,
+        process_allocated, designation, father_name, address, qualification, date_of_birth,
+      } : null,
     }));
 
-    return new Response(JSON.stringify({ data: mergedData }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+    const body = JSON.stringify({ data: mergedData });
+    const headers: Record<string, string> = {
+      ...corsHeaders,
+      ...cacheHeaders,
+      'Content-Type': 'application/json',
+    };
+
+    // 6. Compress large payloads (CompressionStream has no brotli, so gzip only)
+    const acceptsGzip = /\bgzip\b/.test(req.headers.get('Accept-Encoding') ?? '');
+    if (acceptsGzip && body.length >= COMPRESS_MIN_BYTES) {
+      const compressed = new Blob([body]).stream().pipeThrough(new CompressionStream('gzip'));
+      return new Response(compressed, {
+        headers: { ...headers, 'Content-Encoding': 'gzip' },
+        status: 200,
+      })
+    }
+
+    return new Response(body, {
+      headers,
       status: 200,
     })
 
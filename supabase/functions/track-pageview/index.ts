@@ -0,0 +1,89 @@
+import { createClient } from '@supabase/supabase-js'
+
+const corsHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+}
+
+// MAX_BATCH in src/lib/pageviewQueue.ts; a beacon body stays far below this
+const MAX_EVENTS = 25
+const MAX_BODY_BYTES = 64 * 1024
+
+const UUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+const json = (body: unknown, status: number) =>
+  new Response(JSON.stringify(body), {
+    status,
+    headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+  })
+
+const text = (value: unknown, max = 2048) =>
+  typeof value === 'string' && value ? value.slice(0, max) : null
+
+// One view as the app sends it: a single object from older clients, or an
+// element of { events: [...] } from the batching queue
+const toRow = (event: any) => {
+  const path = text(event?.path)
+  if (!path) return null
+  const viewedAt = Date.parse(event.timestamp)
+  return {
+    event_id: typeof event.eventId === 'string' && UUID.test(event.eventId) ? event.eventId : null,
+    hostname: text(event.hostname, 255),
+    path,
+    page_title: text(event.pageTitle, 512),
+    referrer: text(event.referrer),
+    visitor_id: text(event.visitorId, 64),
+    session_id: text(event.sessionId, 64),
+    // A queued view keeps the time it happened, but never one in the future
+    viewed_at: new Date(Number.isNaN(viewedAt) ? Date.now() : Math.min(viewedAt, Date.now())).toISOString(),
+  }
+}
+
+;(globalThis as any).Deno?.serve(async (req: any) => {
+  if (req.method === 'OPTIONS') {
+    return new Response('ok', { headers: corsHeaders })
+  }
+  if (req.method !== 'POST') {
+    return json({ error: 'Method not allowed' }, 405)
+  }
+
+  try {
+    // navigator.sendBeacon posts a plain string (text/plain, no preflight),
+    // so the body is parsed as JSON whatever its content type says
+    const raw = await req.text()
+    if (raw.length > MAX_BODY_BYTES) {
+      return json({ error: 'Body too large' }, 413)
+    }
+    let body: any
+    try {
+      body = JSON.parse(raw)
+    } catch {
+      return json({ error: 'Body must be JSON' }, 400)
+    }
+
+    const events = Array.isArray(body?.events) ? body.events : [body]
+    if (events.length > MAX_EVENTS) {
+      return json({ error: `At most ${MAX_EVENTS} events per request` }, 413)
+    }
+    const rows = events.map(toRow).filter((row: any) => row !== null)
+    if (rows.length === 0) {
+      return json({ error: 'No valid page views' }, 400)
+    }
+
+    const supabaseAdmin = createClient(
+      (globalThis as any).Deno?.env?.get('SUPABASE_URL') ?? '',
+      (globalThis as any).Deno?.env?.get('SUPABASE_SERVICE_ROLE_KEY') ?? ''
+    )
+
+    // A view re-sent with the same eventId (a beacon racing a fetch) is ignored
+    const { error } = await supabaseAdmin
+      .from('page_views')
+      .upsert(rows, { onConflict: 'event_id', ignoreDuplicates: true })
+    if (error) throw error
+
+    return json({ success: true, received: rows.length }, 200)
+  } catch (e) {
+    console.error('Edge Function error:', e);
+    return json({ error: (e as any).message || 'Internal server error' }, 500)
+  }
+})
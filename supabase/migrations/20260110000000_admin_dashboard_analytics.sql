@@ -0,0 +1,180 @@
+-- Server-side aggregates for the Admin dashboard.
+--
+-- The dashboard used to download every test_attempts row (answers JSONB
+-- included) and tally per-question, per-module and per-category results in
+-- the browser. admin_dashboard_analytics() returns the same counts plus the
+-- summary stats as one small JSON document.
+
+-- ============================================
+-- QUESTION BANK (scoring metadata only)
+-- ============================================
+
+-- Mirrors src/data/questions.ts so answers can be scored in SQL. Question
+-- text stays in the frontend bundle; only what scoring needs lives here.
+CREATE TABLE IF NOT EXISTS public.question_bank (
+  id INTEGER PRIMARY KEY,
+  module TEXT NOT NULL,
+  category TEXT NOT NULL,
+  role TEXT NOT NULL CHECK (role IN ('CO', 'FRO', 'BOTH')),
+  correct_option CHAR(1) NOT NULL CHECK (correct_option IN ('A', 'B', 'C', 'D'))
+);
+
+ALTER TABLE public.question_bank ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Admins can view the question bank"
+ON public.question_bank FOR SELECT
+USING (public.has_role(auth.uid(), 'admin'));
+
+INSERT INTO public.question_bank (id, module, category, role, correct_option) VALUES
+  (1, 'module1-co', 'Introduction', 'CO', 'C'),
+  (2, 'module1-co', 'Introduction', 'CO', 'C'),
+  (3, 'module1-co', 'Introduction', 'CO', 'D'),
+  (4, 'module1-co', 'Introduction', 'CO', 'D'),
+  (5, 'module1-co', 'Introduction', 'CO', 'D'),
+  (6, 'module1-co', 'Introduction', 'CO', 'D'),
+  (7, 'module1-co', 'Introduction', 'CO', 'C'),
+  (8, 'module1-co', 'Introduction', 'CO', 'C'),
+  (9, 'module1-co', 'Introduction', 'CO', 'D'),
+  (10, 'module1-co', 'Role of CO', 'CO', 'C'),
+  (11, 'module1-co', 'Role of CO', 'CO', 'C'),
+  (12, 'module1-co', 'Role of CO', 'CO', 'C'),
+  (13, 'module1-co', 'Role of CO', 'CO', 'D'),
+  (14, 'module1-co', 'Role of CO', 'CO', 'D'),
+  (15, 'module1-co', 'Role of CO', 'CO', 'D'),
+  (16, 'module1-co', 'Role of CO', 'CO', 'C'),
+  (17, 'module1-co', 'Role of CO', 'CO', 'C'),
+  (18, 'module1-co', 'Role of CO', 'CO', 'C'),
+  (19, 'module2-co', 'Health Services', 'CO', 'C'),
+  (20, 'module2-co', 'Health Services', 'CO', 'C'),
+  (21, 'module2-co', 'Health Services', 'CO', 'C'),
+  (22, 'module2-co', 'Health Services', 'CO', 'C'),
+  (23, 'module2-co', 'Health Services', 'CO', 'C'),
+  (24, 'module2-co', 'Health Services', 'CO', 'C'),
+  (25, 'module2-co', 'Health Services', 'CO', 'D'),
+  (26, 'module2-co', 'Health Services', 'CO', 'D'),
+  (27, 'module2-co', 'Health Services', 'CO', 'C'),
+  (28, 'module2-co', 'Elder Care', 'CO', 'C'),
+  (29, 'module2-co', 'Elder Care', 'CO', 'D'),
+  (30, 'module2-co', 'Elder Care', 'CO', 'C'),
+  (31, 'module2-co', 'Assisted Living', 'CO', 'C'),
+  (32, 'module2-co', 'Assisted Living', 'CO', 'C'),
+  (33, 'module2-co', 'Assisted Living', 'CO', 'C'),
+  (34, 'module2-co', 'Assisted Living', 'CO', 'D'),
+  (35, 'module2-co', 'Nutrition', 'CO', 'C'),
+  (36, 'module2-co', 'Nutrition', 'CO', 'C'),
+  (37, 'module2-co', 'Nutrition', 'CO', 'C'),
+  (38, 'module3-co', 'Timeliness', 'CO', 'C'),
+  (39, 'module3-co', 'Timeliness', 'CO', 'C'),
+  (40, 'module3-co', 'Timeliness', 'CO', 'C'),
+  (41, 'module3-co', 'Legal Rights', 'CO', 'B'),
+  (42, 'module3-co', 'Legal Rights', 'CO', 'C'),
+  (43, 'module3-co', 'Legal Rights', 'CO', 'C'),
+  (44, 'module3-co', 'Legal Rights', 'CO', 'C'),
+  (45, 'module3-co', 'Pension Schemes', 'CO', 'C'),
+  (46, 'module3-co', 'Pension Schemes', 'CO', 'C'),
+  (47, 'module3-co', 'Pension Schemes', 'CO', 'B'),
+  (48, 'module3-co', 'Pension Schemes', 'CO', 'B'),
+  (56, 'module3-co', 'Emotional Support', 'CO', 'B'),
+  (57, 'module3-co', 'Emotional Support', 'CO', 'C'),
+  (58, 'module3-co', 'Emotional Support', 'CO', 'A'),
+  (59, 'module3-co', 'Emotional Support', 'CO', 'B'),
+  (60, 'module3-co', 'Emotional Support', 'CO', 'C'),
+  (49, 'module1-fro', 'Field Intervention', 'FRO', 'B'),
+  (50, 'module1-fro', 'Field Intervention', 'FRO', 'C'),
+  (51, 'module1-fro', 'Field Intervention', 'FRO', 'C'),
+  (52, 'module1-fro', 'Field Intervention', 'FRO', 'C'),
+  (53, 'module1-fro', 'Field Intervention', 'FRO', 'B'),
+  (54, 'module1-fro', 'Field Intervention', 'FRO', 'B'),
+  (55, 'module1-fro', 'Field Intervention', 'FRO', 'C')
+ON CONFLICT (id) DO UPDATE SET
+  module = EXCLUDED.module,
+  category = EXCLUDED.category,
+  role = EXCLUDED.role,
+  correct_option = EXCLUDED.correct_option;
+
+-- ============================================
+-- DASHBOARD AGGREGATES
+-- ============================================
+
+-- Returns:
+--   {
+--     "stats":      { "total", "qualified", "not_qualified", "average_score" },
+--     "questions":  [ { "id", "correct", "total", "options": { "A", "B", "C", "D" } } ],
+--     "modules":    [ { "id", "correct", "total" } ],
+--     "categories": [ { "name", "correct", "total" } ]
+--   }
+-- Answers for question ids missing from question_bank are ignored, as the
+-- client-side tally ignored ids missing from the bundled bank.
+CREATE OR REPLACE FUNCTION public.admin_dashboard_analytics()
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  result JSONB;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  WITH scored AS (
+    SELECT
+      qb.id,
+      qb.module,
+      qb.category,
+      answer.value AS selected,
+      (answer.value = qb.correct_option) AS is_correct
+    FROM public.test_attempts ta
+    CROSS JOIN LATERAL jsonb_each_text(ta.answers) AS answer(key, value)
+    JOIN public.question_bank qb ON qb.id::text = answer.key
+    WHERE ta.answers IS NOT NULL
+      AND jsonb_typeof(ta.answers) = 'object'
+  ),
+  per_question AS (
+    SELECT
+      id,
+      count(*) FILTER (WHERE is_correct) AS correct,
+      count(*) AS total,
+      jsonb_build_object(
+        'A', count(*) FILTER (WHERE selected = 'A'),
+        'B', count(*) FILTER (WHERE selected = 'B'),
+        'C', count(*) FILTER (WHERE selected = 'C'),
+        'D', count(*) FILTER (WHERE selected = 'D')
+      ) AS options
+    FROM scored
+    GROUP BY id
+  ),
+  per_module AS (
+    SELECT module AS id, count(*) FILTER (WHERE is_correct) AS correct, count(*) AS total
+    FROM scored
+    GROUP BY module
+  ),
+  per_category AS (
+    SELECT category AS name, count(*) FILTER (WHERE is_correct) AS correct, count(*) AS total
+    FROM scored
+    GROUP BY category
+  ),
+  summary AS (
+    SELECT
+      count(*) AS total,
+      count(*) FILTER (WHERE qualified) AS qualified,
+      count(*) FILTER (WHERE NOT qualified) AS not_qualified,
+      COALESCE(round(avg(percentage)), 0)::INTEGER AS average_score
+    FROM public.test_attempts
+  )
+  SELECT jsonb_build_object(
+    'stats', (SELECT to_jsonb(summary) FROM summary),
+    'questions', COALESCE((SELECT jsonb_agg(to_jsonb(per_question) ORDER BY id) FROM per_question), '[]'::jsonb),
+    'modules', COALESCE((SELECT jsonb_agg(to_jsonb(per_module) ORDER BY id) FROM per_module), '[]'::jsonb),
+    'categories', COALESCE((SELECT jsonb_agg(to_jsonb(per_category) ORDER BY name) FROM per_category), '[]'::jsonb)
+  )
+  INTO result;
+
+  RETURN result;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_dashboard_analytics() FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.admin_dashboard_analytics() TO authenticated;
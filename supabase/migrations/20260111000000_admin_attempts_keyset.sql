@@ -0,0 +1,169 @@
+-- Keyset-paginated, server-filtered candidate list for the Admin dashboard.
+--
+-- The Admin table used to load the whole attempt history and filter, search
+-- and paginate it in the browser. admin_list_attempts() returns one page of
+-- attempts with their profile and user details, walking
+-- (completed_at DESC, id DESC) from a cursor; admin_count_attempts() returns
+-- the size of the filtered set for the "x of y" label.
+
+-- Columns the Admin table reads from user_details that earlier migrations
+-- did not create
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'user_details' AND column_name = 'product_process') THEN
+    ALTER TABLE public.user_details ADD COLUMN product_process TEXT;
+  END IF;
+  IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'user_details' AND column_name = 'designation') THEN
+    ALTER TABLE public.user_details ADD COLUMN designation TEXT;
+  END IF;
+  IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'user_details' AND column_name = 'father_name') THEN
+    ALTER TABLE public.user_details ADD COLUMN father_name TEXT;
+  END IF;
+  IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'user_details' AND column_name = 'address') THEN
+    ALTER TABLE public.user_details ADD COLUMN address TEXT;
+  END IF;
+  IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'user_details' AND column_name = 'qualification') THEN
+    ALTER TABLE public.user_details ADD COLUMN qualification TEXT;
+  END IF;
+  IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'user_details' AND column_name = 'date_of_birth') THEN
+    ALTER TABLE public.user_details ADD COLUMN date_of_birth DATE;
+  END IF;
+END $$;
+
+-- idx_test_attempts_completed_at orders by completed_at alone; the id
+-- tie-breaker makes the keyset total so equal timestamps never skip rows
+CREATE INDEX IF NOT EXISTS idx_test_attempts_completed_at_id
+ON public.test_attempts (completed_at DESC, id DESC);
+
+-- Shared filter for the list and the count. Inlined by the planner.
+CREATE OR REPLACE FUNCTION public.admin_attempt_matches(
+  _qualified BOOLEAN,
+  _full_name TEXT,
+  _email TEXT,
+  _emp_id TEXT,
+  _phone_number TEXT,
+  _status TEXT,
+  _search TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT
+    (_status = 'all'
+      OR (_status = 'qualified' AND _qualified)
+      OR (_status = 'not_qualified' AND NOT _qualified))
+    AND (COALESCE(_search, '') = ''
+      OR _full_name ILIKE '%' || _search || '%'
+      OR _email ILIKE '%' || _search || '%'
+      OR _emp_id ILIKE '%' || _search || '%'
+      OR _phone_number LIKE '%' || _search || '%')
+$$;
+
+-- Returns a JSON array of attempts, newest first, shaped like the rows the
+-- Admin table renders ({ ...attempt, profiles, userDetails }).
+--   _direction = 'next': rows older than the cursor (no cursor: first page)
+--   _direction = 'prev': rows newer than the cursor (no cursor: last page)
+CREATE OR REPLACE FUNCTION public.admin_list_attempts(
+  _status TEXT DEFAULT 'all',
+  _search TEXT DEFAULT NULL,
+  _limit INTEGER DEFAULT 10,
+  _cursor_completed_at TIMESTAMPTZ DEFAULT NULL,
+  _cursor_id UUID DEFAULT NULL,
+  _direction TEXT DEFAULT 'next'
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  page_ids UUID[];
+  result JSONB;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  _limit := LEAST(GREATEST(COALESCE(_limit, 10), 1), 100);
+  -- Match the search text literally
+  _search := replace(replace(replace(NULLIF(trim(_search), ''), '\', '\\'), '%', '\%'), '_', '\_');
+
+  IF _direction = 'prev' THEN
+    SELECT array_agg(id) INTO page_ids FROM (
+      SELECT ta.id
+      FROM public.test_attempts ta
+      LEFT JOIN public.profiles p ON p.user_id = ta.user_id
+      LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id
+      WHERE public.admin_attempt_matches(ta.qualified, p.full_name, p.email, p.emp_id, ud.phone_number, _status, _search)
+        AND (_cursor_completed_at IS NULL OR (ta.completed_at, ta.id) > (_cursor_completed_at, _cursor_id))
+      ORDER BY ta.completed_at ASC, ta.id ASC
+      LIMIT _limit
+    ) page;
+  ELSE
+    SELECT array_agg(id) INTO page_ids FROM (
+      SELECT ta.id
+      FROM public.test_attempts ta
+      LEFT JOIN public.profiles p ON p.user_id = ta.user_id
+      LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id
+      WHERE public.admin_attempt_matches(ta.qualified, p.full_name, p.email, p.emp_id, ud.phone_number, _status, _search)
+        AND (_cursor_completed_at IS NULL OR (ta.completed_at, ta.id) < (_cursor_completed_at, _cursor_id))
+      ORDER BY ta.completed_at DESC, ta.id DESC
+      LIMIT _limit
+    ) page;
+  END IF;
+
+  SELECT COALESCE(jsonb_agg(
+    to_jsonb(ta)
+    || jsonb_build_object(
+      'profiles', jsonb_build_object('email', p.email, 'full_name', p.full_name, 'emp_id', p.emp_id),
+      'userDetails', CASE WHEN ud.id IS NULL THEN NULL ELSE
+        to_jsonb(ud) || jsonb_build_object('process_allocated', ud.product_process)
+      END
+    )
+    ORDER BY ta.completed_at DESC, ta.id DESC
+  ), '[]'::jsonb)
+  INTO result
+  FROM public.test_attempts ta
+  LEFT JOIN public.profiles p ON p.user_id = ta.user_id
+  LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id
+  WHERE ta.id = ANY(COALESCE(page_ids, '{}'));
+
+  RETURN result;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.admin_count_attempts(
+  _status TEXT DEFAULT 'all',
+  _search TEXT DEFAULT NULL
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  total INTEGER;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  _search := replace(replace(replace(NULLIF(trim(_search), ''), '\', '\\'), '%', '\%'), '_', '\_');
+
+  SELECT count(*) INTO total
+  FROM public.test_attempts ta
+  LEFT JOIN public.profiles p ON p.user_id = ta.user_id
+  LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id
+  WHERE public.admin_attempt_matches(ta.qualified, p.full_name, p.email, p.emp_id, ud.phone_number, _status, _search);
+
+  RETURN total;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_list_attempts(TEXT, TEXT, INTEGER, TIMESTAMPTZ, UUID, TEXT) FROM PUBLIC, anon;
+REVOKE ALL ON FUNCTION public.admin_count_attempts(TEXT, TEXT) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.admin_list_attempts(TEXT, TEXT, INTEGER, TIMESTAMPTZ, UUID, TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.admin_count_attempts(TEXT, TEXT) TO authenticated;
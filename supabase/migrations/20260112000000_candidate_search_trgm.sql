@@ -0,0 +1,192 @@
+-- Trigram-indexed candidate search.
+--
+-- Admin search is a case-insensitive substring match on name, email,
+-- employee ID and phone number. B-tree indexes cannot serve ILIKE '%x%', so
+-- each field gets a pg_trgm GIN index. candidate_user_ids() matches each
+-- field separately, so every predicate can use its own index, and unions
+-- the results. search_candidates() exposes it to the dashboard. The
+-- attempt list and count RPCs filter through it too.
+--
+-- Benchmark: supabase/benchmarks/candidate_search.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_full_name_trgm
+ON public.profiles USING gin (full_name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_profiles_email_trgm
+ON public.profiles USING gin (email extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_profiles_emp_id_trgm
+ON public.profiles USING gin (emp_id extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_user_details_phone_number_trgm
+ON public.user_details USING gin (phone_number extensions.gin_trgm_ops);
+
+-- ============================================
+-- SEARCH
+-- ============================================
+
+-- User ids whose name, email, employee ID or phone number contains _search.
+-- The text is matched literally (% and _ are escaped).
+CREATE OR REPLACE FUNCTION public.candidate_user_ids(_search TEXT)
+RETURNS SETOF UUID
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+  WITH pattern AS (
+    SELECT '%' || replace(replace(replace(trim(_search), '\', '\\'), '%', '\%'), '_', '\_') || '%' AS value
+  )
+  SELECT user_id FROM public.profiles, pattern WHERE full_name ILIKE pattern.value
+  UNION
+  SELECT user_id FROM public.profiles, pattern WHERE email ILIKE pattern.value
+  UNION
+  SELECT user_id FROM public.profiles, pattern WHERE emp_id ILIKE pattern.value
+  UNION
+  SELECT user_id FROM public.user_details, pattern WHERE phone_number LIKE pattern.value
+$$;
+
+REVOKE ALL ON FUNCTION public.candidate_user_ids(TEXT) FROM PUBLIC, anon, authenticated;
+
+CREATE OR REPLACE FUNCTION public.search_candidates(
+  _search TEXT,
+  _limit INTEGER DEFAULT 20
+)
+RETURNS TABLE (
+  user_id UUID,
+  full_name TEXT,
+  email TEXT,
+  emp_id TEXT,
+  phone_number TEXT
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  IF COALESCE(trim(_search), '') = '' THEN
+    RETURN;
+  END IF;
+
+  RETURN QUERY
+  SELECT p.user_id, p.full_name, p.email, p.emp_id, ud.phone_number
+  FROM public.candidate_user_ids(_search) AS matched(user_id)
+  JOIN public.profiles p ON p.user_id = matched.user_id
+  LEFT JOIN public.user_details ud ON ud.user_id = matched.user_id
+  ORDER BY p.full_name, p.user_id
+  LIMIT LEAST(GREATEST(COALESCE(_limit, 20), 1), 100);
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.search_candidates(TEXT, INTEGER) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.search_candidates(TEXT, INTEGER) TO authenticated;
+
+-- ============================================
+-- ATTEMPT LIST / COUNT THROUGH THE INDEXED SEARCH
+-- ============================================
+
+-- Same contract as before; the search now narrows by candidate_user_ids()
+-- instead of an OR across joined columns, which no index could serve.
+CREATE OR REPLACE FUNCTION public.admin_list_attempts(
+  _status TEXT DEFAULT 'all',
+  _search TEXT DEFAULT NULL,
+  _limit INTEGER DEFAULT 10,
+  _cursor_completed_at TIMESTAMPTZ DEFAULT NULL,
+  _cursor_id UUID DEFAULT NULL,
+  _direction TEXT DEFAULT 'next'
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  page_ids UUID[];
+  result JSONB;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  _limit := LEAST(GREATEST(COALESCE(_limit, 10), 1), 100);
+  _search := NULLIF(trim(_search), '');
+
+  IF _direction = 'prev' THEN
+    SELECT array_agg(id) INTO page_ids FROM (
+      SELECT ta.id
+      FROM public.test_attempts ta
+      WHERE (_status = 'all' OR ta.qualified = (_status = 'qualified'))
+        AND (_search IS NULL OR ta.user_id IN (SELECT public.candidate_user_ids(_search)))
+        AND (_cursor_completed_at IS NULL OR (ta.completed_at, ta.id) > (_cursor_completed_at, _cursor_id))
+      ORDER BY ta.completed_at ASC, ta.id ASC
+      LIMIT _limit
+    ) page;
+  ELSE
+    SELECT array_agg(id) INTO page_ids FROM (
+      SELECT ta.id
+      FROM public.test_attempts ta
+      WHERE (_status = 'all' OR ta.qualified = (_status = 'qualified'))
+        AND (_search IS NULL OR ta.user_id IN (SELECT public.candidate_user_ids(_search)))
+        AND (_cursor_completed_at IS NULL OR (ta.completed_at, ta.id) < (_cursor_completed_at, _cursor_id))
+      ORDER BY ta.completed_at DESC, ta.id DESC
+      LIMIT _limit
+    ) page;
+  END IF;
+
+  SELECT COALESCE(jsonb_agg(
+    to_jsonb(ta)
+    || jsonb_build_object(
+      'profiles', jsonb_build_object('email', p.email, 'full_name', p.full_name, 'emp_id', p.emp_id),
+      'userDetails', CASE WHEN ud.id IS NULL THEN NULL ELSE
+        to_jsonb(ud) || jsonb_build_object('process_allocated', ud.product_process)
+      END
+    )
+    ORDER BY ta.completed_at DESC, ta.id DESC
+  ), '[]'::jsonb)
+  INTO result
+  FROM public.test_attempts ta
+  LEFT JOIN public.profiles p ON p.user_id = ta.user_id
+  LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id
+  WHERE ta.id = ANY(COALESCE(page_ids, '{}'));
+
+  RETURN result;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.admin_count_attempts(
+  _status TEXT DEFAULT 'all',
+  _search TEXT DEFAULT NULL
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  total INTEGER;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  _search := NULLIF(trim(_search), '');
+
+  SELECT count(*) INTO total
+  FROM public.test_attempts ta
+  WHERE (_status = 'all' OR ta.qualified = (_status = 'qualified'))
+    AND (_search IS NULL OR ta.user_id IN (SELECT public.candidate_user_ids(_search)));
+
+  RETURN total;
+END;
+$$;
+
+-- Superseded by candidate_user_ids()
+DROP FUNCTION IF EXISTS public.admin_attempt_matches(BOOLEAN, TEXT, TEXT, TEXT, TEXT, TEXT, TEXT);
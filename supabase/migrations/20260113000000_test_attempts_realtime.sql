@@ -0,0 +1,105 @@
+-- Realtime updates for the Admin dashboard.
+--
+-- The dashboard subscribes to INSERT and DELETE changes on test_attempts
+-- and folds each row into its counters instead of reloading everything.
+-- Realtime only delivers changes for tables in the supabase_realtime
+-- publication; the "Admins can view all attempts" policy decides who
+-- receives them.
+--
+-- DELETE payloads on a table with RLS carry only the primary key, whatever
+-- the replica identity, so the client removes deleted rows using the copy it
+-- already has on screen and falls back to admin_dashboard_analytics()
+-- otherwise.
+
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_publication WHERE pubname = 'supabase_realtime')
+    AND NOT EXISTS (
+      SELECT 1 FROM pg_publication_tables
+      WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = 'test_attempts'
+    ) THEN
+    ALTER PUBLICATION supabase_realtime ADD TABLE public.test_attempts;
+  END IF;
+END $$;
+
+-- ============================================
+-- DASHBOARD AGGREGATES
+-- ============================================
+
+-- As before, plus stats.percentage_sum: the client keeps the average score
+-- current across inserts and deletes from the exact sum rather than the
+-- rounded average.
+CREATE OR REPLACE FUNCTION public.admin_dashboard_analytics()
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  result JSONB;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  WITH scored AS (
+    SELECT
+      qb.id,
+      qb.module,
+      qb.category,
+      answer.value AS selected,
+      (answer.value = qb.correct_option) AS is_correct
+    FROM public.test_attempts ta
+    CROSS JOIN LATERAL jsonb_each_text(ta.answers) AS answer(key, value)
+    JOIN public.question_bank qb ON qb.id::text = answer.key
+    WHERE ta.answers IS NOT NULL
+      AND jsonb_typeof(ta.answers) = 'object'
+  ),
+  per_question AS (
+    SELECT
+      id,
+      count(*) FILTER (WHERE is_correct) AS correct,
+      count(*) AS total,
+      jsonb_build_object(
+        'A', count(*) FILTER (WHERE selected = 'A'),
+        'B', count(*) FILTER (WHERE selected = 'B'),
+        'C', count(*) FILTER (WHERE selected = 'C'),
+        'D', count(*) FILTER (WHERE selected = 'D')
+      ) AS options
+    FROM scored
+    GROUP BY id
+  ),
+  per_module AS (
+    SELECT module AS id, count(*) FILTER (WHERE is_correct) AS correct, count(*) AS total
+    FROM scored
+    GROUP BY module
+  ),
+  per_category AS (
+    SELECT category AS name, count(*) FILTER (WHERE is_correct) AS correct, count(*) AS total
+    FROM scored
+    GROUP BY category
+  ),
+  summary AS (
+    SELECT
+      count(*) AS total,
+      count(*) FILTER (WHERE qualified) AS qualified,
+      count(*) FILTER (WHERE NOT qualified) AS not_qualified,
+      COALESCE(round(avg(percentage)), 0)::INTEGER AS average_score,
+      COALESCE(sum(percentage), 0)::BIGINT AS percentage_sum
+    FROM public.test_attempts
+  )
+  SELECT jsonb_build_object(
+    'stats', (SELECT to_jsonb(summary) FROM summary),
+    'questions', COALESCE((SELECT jsonb_agg(to_jsonb(per_question) ORDER BY id) FROM per_question), '[]'::jsonb),
+    'modules', COALESCE((SELECT jsonb_agg(to_jsonb(per_module) ORDER BY id) FROM per_module), '[]'::jsonb),
+    'categories', COALESCE((SELECT jsonb_agg(to_jsonb(per_category) ORDER BY name) FROM per_category), '[]'::jsonb)
+  )
+  INTO result;
+
+  RETURN result;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_dashboard_analytics() FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.admin_dashboard_analytics() TO authenticated;
@@ -0,0 +1,192 @@
+-- Trigger-maintained demographic rollup of test attempts.
+--
+-- Charts by state, city and process used to need every test_attempts row
+-- joined to user_details. attempt_rollup_daily keeps one row per
+-- (day, state, city, process_allocated) with attempt, qualified and
+-- percentage totals; triggers keep it current as attempts are submitted or
+-- deleted (re-exam resets) and as candidates edit their details. The table
+-- grows by up to one row per (state, city, process) each day, so it is not
+-- read whole: admin_attempt_rollup() (20260121000000) sums it per dimension.
+--
+-- Days are calendar days in Asia/Kolkata. Missing details are bucketed as
+-- 'Unknown' so the key never contains NULLs.
+
+CREATE TABLE IF NOT EXISTS public.attempt_rollup_daily (
+  day DATE NOT NULL,
+  state TEXT NOT NULL,
+  city TEXT NOT NULL,
+  process_allocated TEXT NOT NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  qualified INTEGER NOT NULL DEFAULT 0,
+  percentage_sum NUMERIC NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, state, city, process_allocated)
+);
+
+ALTER TABLE public.attempt_rollup_daily ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Admins can view the attempt rollup"
+ON public.attempt_rollup_daily FOR SELECT
+USING (public.has_role(auth.uid(), 'admin'));
+
+GRANT SELECT ON public.attempt_rollup_daily TO authenticated;
+
+-- ============================================
+-- MAINTENANCE
+-- ============================================
+
+CREATE OR REPLACE FUNCTION public.rollup_key(_value TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT COALESCE(NULLIF(trim(_value), ''), 'Unknown')
+$$;
+
+-- Adds the given (possibly negative) counts to one bucket and drops the
+-- bucket once it is empty.
+CREATE OR REPLACE FUNCTION public.bump_attempt_rollup(
+  _day DATE,
+  _state TEXT,
+  _city TEXT,
+  _process TEXT,
+  _attempts INTEGER,
+  _qualified INTEGER,
+  _percentage_sum NUMERIC
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO public.attempt_rollup_daily AS r (day, state, city, process_allocated, attempts, qualified, percentage_sum)
+  VALUES (_day, public.rollup_key(_state), public.rollup_key(_city), public.rollup_key(_process),
+          _attempts, _qualified, _percentage_sum)
+  ON CONFLICT (day, state, city, process_allocated) DO UPDATE SET
+    attempts = r.attempts + EXCLUDED.attempts,
+    qualified = r.qualified + EXCLUDED.qualified,
+    percentage_sum = r.percentage_sum + EXCLUDED.percentage_sum;
+
+  DELETE FROM public.attempt_rollup_daily
+  WHERE day = _day
+    AND state = public.rollup_key(_state)
+    AND city = public.rollup_key(_city)
+    AND process_allocated = public.rollup_key(_process)
+    AND attempts <= 0;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.rollup_test_attempt()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  attempt public.test_attempts%ROWTYPE;
+  delta INTEGER;
+  details RECORD;
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    attempt := NEW;
+    delta := 1;
+  ELSE
+    attempt := OLD;
+    delta := -1;
+  END IF;
+
+  SELECT ud.state, ud.city, ud.product_process INTO details
+  FROM public.user_details ud
+  WHERE ud.user_id = attempt.user_id;
+
+  PERFORM public.bump_attempt_rollup(
+    (attempt.completed_at AT TIME ZONE 'Asia/Kolkata')::date,
+    details.state, details.city, details.product_process,
+    delta, delta * (CASE WHEN attempt.qualified THEN 1 ELSE 0 END), delta * attempt.percentage
+  );
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS rollup_test_attempt ON public.test_attempts;
+CREATE TRIGGER rollup_test_attempt
+AFTER INSERT OR DELETE ON public.test_attempts
+FOR EACH ROW EXECUTE FUNCTION public.rollup_test_attempt();
+
+-- A candidate whose state, city or process changes takes their attempts to
+-- the new bucket, so a later delete decrements the bucket it was counted in.
+CREATE OR REPLACE FUNCTION public.rollup_user_details()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  _user_id UUID := COALESCE(NEW.user_id, OLD.user_id);
+  old_state TEXT;
+  old_city TEXT;
+  old_process TEXT;
+  new_state TEXT;
+  new_city TEXT;
+  new_process TEXT;
+  bucket RECORD;
+BEGIN
+  IF TG_OP <> 'INSERT' THEN
+    old_state := OLD.state; old_city := OLD.city; old_process := OLD.product_process;
+  END IF;
+  IF TG_OP <> 'DELETE' THEN
+    new_state := NEW.state; new_city := NEW.city; new_process := NEW.product_process;
+  END IF;
+
+  IF public.rollup_key(old_state) = public.rollup_key(new_state)
+    AND public.rollup_key(old_city) = public.rollup_key(new_city)
+    AND public.rollup_key(old_process) = public.rollup_key(new_process) THEN
+    RETURN NULL;
+  END IF;
+
+  FOR bucket IN
+    SELECT
+      (completed_at AT TIME ZONE 'Asia/Kolkata')::date AS day,
+      count(*)::INTEGER AS attempts,
+      count(*) FILTER (WHERE qualified)::INTEGER AS qualified,
+      sum(percentage) AS percentage_sum
+    FROM public.test_attempts
+    WHERE user_id = _user_id
+    GROUP BY 1
+  LOOP
+    PERFORM public.bump_attempt_rollup(bucket.day, old_state, old_city, old_process,
+                                       -bucket.attempts, -bucket.qualified, -bucket.percentage_sum);
+    PERFORM public.bump_attempt_rollup(bucket.day, new_state, new_city, new_process,
+                                       bucket.attempts, bucket.qualified, bucket.percentage_sum);
+  END LOOP;
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS rollup_user_details ON public.user_details;
+CREATE TRIGGER rollup_user_details
+AFTER INSERT OR DELETE OR UPDATE OF state, city, product_process ON public.user_details
+FOR EACH ROW EXECUTE FUNCTION public.rollup_user_details();
+
+REVOKE ALL ON FUNCTION public.bump_attempt_rollup(DATE, TEXT, TEXT, TEXT, INTEGER, INTEGER, NUMERIC) FROM PUBLIC, anon, authenticated;
+
+-- ============================================
+-- BACKFILL
+-- ============================================
+
+DELETE FROM public.attempt_rollup_daily;
+
+INSERT INTO public.attempt_rollup_daily (day, state, city, process_allocated, attempts, qualified, percentage_sum)
+SELECT
+  (ta.completed_at AT TIME ZONE 'Asia/Kolkata')::date,
+  public.rollup_key(ud.state),
+  public.rollup_key(ud.city),
+  public.rollup_key(ud.product_process),
+  count(*),
+  count(*) FILTER (WHERE ta.qualified),
+  sum(ta.percentage)
+FROM public.test_attempts ta
+LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id
+GROUP BY 1, 2, 3, 4;
@@ -0,0 +1,210 @@
+-- Per-answer fact table.
+--
+-- Question-level metrics had to unpack the answers JSONB of every attempt,
+-- and "who got question N wrong" was a full scan. attempt_answers holds one
+-- row per answered question, scored against question_bank, filled by a
+-- trigger on test_attempts and backfilled here. Deleting an attempt
+-- (re-exam reset) cascades to its answers.
+
+CREATE TABLE IF NOT EXISTS public.attempt_answers (
+  attempt_id UUID NOT NULL REFERENCES public.test_attempts(id) ON DELETE CASCADE,
+  user_id UUID NOT NULL,
+  question_id INTEGER NOT NULL,
+  selected_option CHAR(1) NOT NULL,
+  is_correct BOOLEAN NOT NULL,
+  module TEXT NOT NULL,
+  category TEXT NOT NULL,
+  PRIMARY KEY (attempt_id, question_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_attempt_answers_question_id
+ON public.attempt_answers (question_id);
+
+CREATE INDEX IF NOT EXISTS idx_attempt_answers_module_is_correct
+ON public.attempt_answers (module, is_correct);
+
+CREATE INDEX IF NOT EXISTS idx_attempt_answers_user_id
+ON public.attempt_answers (user_id);
+
+ALTER TABLE public.attempt_answers ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view their own answers"
+ON public.attempt_answers FOR SELECT
+USING (auth.uid() = user_id);
+
+CREATE POLICY "Admins can view all answers"
+ON public.attempt_answers FOR SELECT
+USING (public.has_role(auth.uid(), 'admin'));
+
+GRANT SELECT ON public.attempt_answers TO authenticated;
+
+-- ============================================
+-- MAINTENANCE
+-- ============================================
+
+-- Answers for question ids missing from question_bank are skipped, as the
+-- dashboard aggregates skip them. So are values other than A-D, which the
+-- app never stores and selected_option cannot hold; tallyAttempt() in
+-- src/lib/attemptAnalytics.ts skips them too, so realtime updates agree.
+CREATE OR REPLACE FUNCTION public.explode_attempt_answers()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'UPDATE' THEN
+    DELETE FROM public.attempt_answers WHERE attempt_id = NEW.id;
+  END IF;
+
+  IF NEW.answers IS NOT NULL AND jsonb_typeof(NEW.answers) = 'object' THEN
+    INSERT INTO public.attempt_answers (attempt_id, user_id, question_id, selected_option, is_correct, module, category)
+    SELECT NEW.id, NEW.user_id, qb.id, answer.value, answer.value = qb.correct_option, qb.module, qb.category
+    FROM jsonb_each_text(NEW.answers) AS answer(key, value)
+    JOIN public.question_bank qb ON qb.id::text = answer.key
+    WHERE answer.value IN ('A', 'B', 'C', 'D');
+  END IF;
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS explode_attempt_answers ON public.test_attempts;
+CREATE TRIGGER explode_attempt_answers
+AFTER INSERT OR UPDATE OF answers ON public.test_attempts
+FOR EACH ROW EXECUTE FUNCTION public.explode_attempt_answers();
+
+-- ============================================
+-- BACKFILL
+-- ============================================
+
+INSERT INTO public.attempt_answers (attempt_id, user_id, question_id, selected_option, is_correct, module, category)
+SELECT ta.id, ta.user_id, qb.id, answer.value, answer.value = qb.correct_option, qb.module, qb.category
+FROM public.test_attempts ta
+CROSS JOIN LATERAL jsonb_each_text(ta.answers) AS answer(key, value)
+JOIN public.question_bank qb ON qb.id::text = answer.key
+WHERE ta.answers IS NOT NULL
+  AND jsonb_typeof(ta.answers) = 'object'
+  AND answer.value IN ('A', 'B', 'C', 'D')
+ON CONFLICT (attempt_id, question_id) DO NOTHING;
+
+ANALYZE public.attempt_answers;
+
+-- ============================================
+-- DASHBOARD AGGREGATES
+-- ============================================
+
+-- Grouped from the fact table instead of unpacking every attempt's answers.
+-- The result matches the previous version except that answers other than
+-- A-D, which it counted towards a question's total, are now left out.
+CREATE OR REPLACE FUNCTION public.admin_dashboard_analytics()
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  result JSONB;
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  WITH scored AS (
+    SELECT question_id AS id, module, category, selected_option AS selected, is_correct
+    FROM public.attempt_answers
+  ),
+  per_question AS (
+    SELECT
+      id,
+      count(*) FILTER (WHERE is_correct) AS correct,
+      count(*) AS total,
+      jsonb_build_object(
+        'A', count(*) FILTER (WHERE selected = 'A'),
+        'B', count(*) FILTER (WHERE selected = 'B'),
+        'C', count(*) FILTER (WHERE selected = 'C'),
+        'D', count(*) FILTER (WHERE selected = 'D')
+      ) AS options
+    FROM scored
+    GROUP BY id
+  ),
+  per_module AS (
+    SELECT module AS id, count(*) FILTER (WHERE is_correct) AS correct, count(*) AS total
+    FROM scored
+    GROUP BY module
+  ),
+  per_category AS (
+    SELECT category AS name, count(*) FILTER (WHERE is_correct) AS correct, count(*) AS total
+    FROM scored
+    GROUP BY category
+  ),
+  summary AS (
+    SELECT
+      count(*) AS total,
+      count(*) FILTER (WHERE qualified) AS qualified,
+      count(*) FILTER (WHERE NOT qualified) AS not_qualified,
+      COALESCE(round(avg(percentage)), 0)::INTEGER AS average_score,
+      COALESCE(sum(percentage), 0)::BIGINT AS percentage_sum
+    FROM public.test_attempts
+  )
+  SELECT jsonb_build_object(
+    'stats', (SELECT to_jsonb(summary) FROM summary),
+    'questions', COALESCE((SELECT jsonb_agg(to_jsonb(per_question) ORDER BY id) FROM per_question), '[]'::jsonb),
+    'modules', COALESCE((SELECT jsonb_agg(to_jsonb(per_module) ORDER BY id) FROM per_module), '[]'::jsonb),
+    'categories', COALESCE((SELECT jsonb_agg(to_jsonb(per_category) ORDER BY name) FROM per_category), '[]'::jsonb)
+  )
+  INTO result;
+
+  RETURN result;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_dashboard_analytics() FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.admin_dashboard_analytics() TO authenticated;
+
+-- ============================================
+-- QUERIES
+-- ============================================
+
+-- Candidates who answered one question, newest attempt first, optionally only
+-- those who got it right (_is_correct = true) or wrong (false). Served by
+-- idx_attempt_answers_question_id.
+CREATE OR REPLACE FUNCTION public.admin_question_responses(
+  _question_id INTEGER,
+  _is_correct BOOLEAN DEFAULT NULL,
+  _limit INTEGER DEFAULT 50
+)
+RETURNS TABLE (
+  attempt_id UUID,
+  user_id UUID,
+  full_name TEXT,
+  emp_id TEXT,
+  selected_option TEXT,
+  is_correct BOOLEAN,
+  completed_at TIMESTAMPTZ
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  RETURN QUERY
+  SELECT aa.attempt_id, aa.user_id, p.full_name, p.emp_id, aa.selected_option::TEXT, aa.is_correct, ta.completed_at
+  FROM public.attempt_answers aa
+  JOIN public.test_attempts ta ON ta.id = aa.attempt_id
+  LEFT JOIN public.profiles p ON p.user_id = aa.user_id
+  WHERE aa.question_id = _question_id
+    AND (_is_correct IS NULL OR aa.is_correct = _is_correct)
+  ORDER BY ta.completed_at DESC, aa.attempt_id DESC
+  LIMIT LEAST(GREATEST(COALESCE(_limit, 50), 1), 500);
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_question_responses(INTEGER, BOOLEAN, INTEGER) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.admin_question_responses(INTEGER, BOOLEAN, INTEGER) TO authenticated;
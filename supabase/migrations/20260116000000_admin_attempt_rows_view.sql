@@ -0,0 +1,47 @@
+-- One-statement attempt listing for admin callers.
+--
+-- fetch-admin-data and the dashboard's full load read test_attempts, then
+-- sent every distinct user_id back as .in('user_id', [...]) to fetch
+-- user_details. With thousands of candidates that list becomes a huge URL
+-- and IN-list plan. admin_attempt_rows joins the three tables in the
+-- database and projects only the columns the callers use.
+--
+-- security_invoker keeps the base tables' RLS in force: admins see every
+-- row, anyone else only their own.
+--
+-- Benchmark: supabase/benchmarks/admin_attempt_rows.sql
+
+CREATE OR REPLACE VIEW public.admin_attempt_rows
+WITH (security_invoker = true)
+AS
+SELECT
+  ta.id,
+  ta.user_id,
+  ta.score,
+  ta.total_questions,
+  ta.percentage,
+  ta.qualified,
+  ta.answers,
+  ta.completed_at,
+  p.email,
+  p.full_name,
+  p.emp_id,
+  ud.id AS details_id,
+  ud.first_name,
+  ud.last_name,
+  ud.phone_number,
+  ud.gender,
+  ud.state,
+  ud.city,
+  ud.product_process AS process_allocated,
+  ud.designation,
+  ud.father_name,
+  ud.address,
+  ud.qualification,
+  ud.date_of_birth
+FROM public.test_attempts ta
+LEFT JOIN public.profiles p ON p.user_id = ta.user_id
+LEFT JOIN public.user_details ud ON ud.user_id = ta.user_id;
+
+REVOKE ALL ON public.admin_attempt_rows FROM PUBLIC, anon;
+GRANT SELECT ON public.admin_attempt_rows TO authenticated, service_role;
@@ -0,0 +1,21 @@
+-- Seed of the question paper each attempt was given.
+--
+-- The app draws a paper with getRandomQuestions(total_questions, seed), a
+-- seeded shuffle over a fixed question bank, so the seed alone is enough to
+-- rebuild exactly which questions a candidate saw, in order, for an audit.
+-- The seed is an unsigned 32-bit integer, hence BIGINT. Older attempts have
+-- no seed.
+
+ALTER TABLE public.test_attempts
+ADD COLUMN IF NOT EXISTS paper_seed BIGINT;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_constraint WHERE conname = 'test_attempts_paper_seed_range'
+  ) THEN
+    ALTER TABLE public.test_attempts
+    ADD CONSTRAINT test_attempts_paper_seed_range
+    CHECK (paper_seed IS NULL OR paper_seed BETWEEN 0 AND 4294967295);
+  END IF;
+END $$;
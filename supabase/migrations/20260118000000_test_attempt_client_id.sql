@@ -0,0 +1,21 @@
+-- Idempotency key for attempt submissions.
+--
+-- The app journals a paper in IndexedDB and submits it from an outbox that
+-- retries until the server confirms, so the same attempt can arrive more
+-- than once (a retry after a response was lost, two tabs flushing the same
+-- outbox). Each paper carries a client-generated UUID; the unique constraint
+-- plus an upsert that ignores duplicates make every resend after the first a
+-- no-op. NULLs are distinct, so older attempts without a key are unaffected.
+
+ALTER TABLE public.test_attempts
+ADD COLUMN IF NOT EXISTS client_attempt_id UUID;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_constraint WHERE conname = 'test_attempts_client_attempt_id_key'
+  ) THEN
+    ALTER TABLE public.test_attempts
+    ADD CONSTRAINT test_attempts_client_attempt_id_key UNIQUE (client_attempt_id);
+  END IF;
+END $$;
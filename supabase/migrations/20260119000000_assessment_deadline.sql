@@ -0,0 +1,151 @@
+-- Server-issued deadline for a timed assessment.
+--
+-- The test timer used to count down from 20:00 in the browser, so a reload
+-- restarted it and a throttled background tab let it drift. Now the app
+-- calls begin_assessment() when a paper starts, and again whenever it
+-- resumes one: the first call records the start time and deadline on the
+-- server, every later call for the same client_attempt_id returns the same
+-- pair. The server clock in the reply lets the client turn the deadline
+-- into a monotonic performance.now() target.
+--
+-- The caller is always auth.uid(), the same identity the test_attempts
+-- insert policy checks; sessions are keyed by (user_id, client_attempt_id),
+-- so one user's ids never collide with, or reveal, another user's. A user
+-- may have only a few sessions running at once.
+--
+-- When the attempt is submitted, its started_at is taken from the session
+-- and the deadline is enforced: an attempt completed more than a short grace
+-- period after it is rejected.
+
+CREATE TABLE IF NOT EXISTS public.assessment_sessions (
+  user_id UUID NOT NULL,
+  client_attempt_id UUID NOT NULL,
+  started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  deadline TIMESTAMPTZ NOT NULL,
+  PRIMARY KEY (user_id, client_attempt_id)
+);
+
+-- Only begin_assessment() and the attempt trigger touch the table
+ALTER TABLE public.assessment_sessions ENABLE ROW LEVEL SECURITY;
+
+-- Sessions a user may have running (deadline not yet passed) at once
+CREATE OR REPLACE FUNCTION public.assessment_max_open_sessions()
+RETURNS INTEGER
+LANGUAGE sql
+IMMUTABLE
+AS $$ SELECT 3 $$;
+
+-- Network and clock slack allowed after the deadline
+CREATE OR REPLACE FUNCTION public.assessment_deadline_grace()
+RETURNS INTERVAL
+LANGUAGE sql
+IMMUTABLE
+AS $$ SELECT INTERVAL '2 minutes' $$;
+
+-- How long a paper finished in time may wait in the app's offline outbox
+CREATE OR REPLACE FUNCTION public.assessment_outbox_window()
+RETURNS INTERVAL
+LANGUAGE sql
+IMMUTABLE
+AS $$ SELECT INTERVAL '24 hours' $$;
+
+CREATE OR REPLACE FUNCTION public.begin_assessment(
+  _client_attempt_id UUID,
+  _duration_minutes INTEGER
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+VOLATILE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  caller UUID := auth.uid();
+  session public.assessment_sessions;
+BEGIN
+  IF caller IS NULL THEN
+    RAISE EXCEPTION 'not signed in' USING ERRCODE = '42501';
+  END IF;
+  IF _duration_minutes IS NULL OR _duration_minutes NOT BETWEEN 1 AND 180 THEN
+    RAISE EXCEPTION 'duration must be between 1 and 180 minutes';
+  END IF;
+
+  SELECT * INTO session
+  FROM public.assessment_sessions
+  WHERE user_id = caller AND client_attempt_id = _client_attempt_id;
+
+  IF NOT FOUND THEN
+    -- Serialise a user's starts so the cap cannot be raced
+    PERFORM pg_advisory_xact_lock(hashtext('begin_assessment:' || caller::text));
+    IF (SELECT count(*) FROM public.assessment_sessions
+        WHERE user_id = caller AND deadline > now()) >= public.assessment_max_open_sessions() THEN
+      RAISE EXCEPTION 'too many assessments in progress' USING ERRCODE = '54000';
+    END IF;
+
+    INSERT INTO public.assessment_sessions (user_id, client_attempt_id, started_at, deadline)
+    VALUES (caller, _client_attempt_id, now(), now() + make_interval(mins => _duration_minutes))
+    ON CONFLICT (user_id, client_attempt_id) DO NOTHING;
+
+    SELECT * INTO session
+    FROM public.assessment_sessions
+    WHERE user_id = caller AND client_attempt_id = _client_attempt_id;
+  END IF;
+
+  RETURN jsonb_build_object(
+    'started_at', session.started_at,
+    'deadline', session.deadline,
+    'server_now', clock_timestamp()
+  );
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.begin_assessment(UUID, INTEGER) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.begin_assessment(UUID, INTEGER) TO authenticated;
+
+-- Copies the session's started_at onto the attempt and rejects attempts
+-- completed after the deadline. completed_at cannot be in the future, and
+-- an attempt arriving long after its deadline is rejected whatever it
+-- claims, which bounds how far a tampered client can backdate it. Papers
+-- started while the server was unreachable have no session; they are held
+-- to the default duration from their own started_at.
+CREATE OR REPLACE FUNCTION public.test_attempts_session_started_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  session public.assessment_sessions;
+  attempt_deadline TIMESTAMPTZ;
+BEGIN
+  IF NEW.client_attempt_id IS NULL THEN
+    RETURN NEW;
+  END IF;
+
+  NEW.completed_at := LEAST(COALESCE(NEW.completed_at, now()), now());
+
+  SELECT * INTO session
+  FROM public.assessment_sessions s
+  WHERE s.user_id = NEW.user_id AND s.client_attempt_id = NEW.client_attempt_id;
+
+  IF FOUND THEN
+    NEW.started_at := session.started_at;
+    attempt_deadline := session.deadline;
+  ELSE
+    attempt_deadline := COALESCE(NEW.started_at, now()) + INTERVAL '20 minutes';
+  END IF;
+
+  IF NEW.completed_at > attempt_deadline + public.assessment_deadline_grace()
+     OR now() > attempt_deadline + public.assessment_outbox_window() THEN
+    RAISE EXCEPTION 'assessment submitted after its deadline (%)', attempt_deadline
+      USING ERRCODE = '22023';
+  END IF;
+
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS test_attempts_session_started_at ON public.test_attempts;
+CREATE TRIGGER test_attempts_session_started_at
+BEFORE INSERT ON public.test_attempts
+FOR EACH ROW EXECUTE FUNCTION public.test_attempts_session_started_at();
@@ -0,0 +1,38 @@
+-- Page views recorded by the track-pageview edge function.
+--
+-- The app queues views and sends them in batches, by fetch while the page is
+-- open and by navigator.sendBeacon when it is hidden or closed. A batch a
+-- beacon re-sends may already have arrived, so every view carries a
+-- client-generated event_id and a resend is ignored. Views from clients
+-- that predate batching have no event_id; NULLs are distinct, so they are
+-- always stored.
+
+CREATE TABLE IF NOT EXISTS public.page_views (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  hostname TEXT,
+  path TEXT NOT NULL,
+  page_title TEXT,
+  referrer TEXT,
+  visitor_id TEXT,
+  session_id TEXT,
+  viewed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.page_views
+ADD COLUMN IF NOT EXISTS event_id UUID;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_constraint WHERE conname = 'page_views_event_id_key'
+  ) THEN
+    ALTER TABLE public.page_views
+    ADD CONSTRAINT page_views_event_id_key UNIQUE (event_id);
+  END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS page_views_viewed_at_idx ON public.page_views (viewed_at DESC);
+
+-- Written only by the edge function, with the service role
+ALTER TABLE public.page_views ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,52 @@
+-- Demographic totals, grouped on the server.
+--
+-- The dashboard used to read every attempt_rollup_daily bucket and fold them
+-- by state, city or process in the browser. There is a bucket per day and
+-- (state, city, process), so the table grows with the calendar, and once it
+-- passed PostgREST's max_rows the read was cut short and the most recent
+-- days were silently left out of the charts. admin_attempt_rollup() does the
+-- fold in SQL and returns only the largest groups of one dimension.
+
+CREATE OR REPLACE FUNCTION public.admin_attempt_rollup(
+  _dimension TEXT,
+  _limit INTEGER DEFAULT 15
+)
+RETURNS TABLE (
+  name TEXT,
+  attempts BIGINT,
+  qualified BIGINT,
+  percentage_sum NUMERIC
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF NOT public.has_role(auth.uid(), 'admin') THEN
+    RAISE EXCEPTION 'Admin access required' USING ERRCODE = '42501';
+  END IF;
+
+  IF _dimension NOT IN ('state', 'city', 'process_allocated') THEN
+    RAISE EXCEPTION 'unknown rollup dimension: %', _dimension USING ERRCODE = '22023';
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    CASE _dimension
+      WHEN 'state' THEN r.state
+      WHEN 'city' THEN r.city
+      ELSE r.process_allocated
+    END AS name,
+    sum(r.attempts)::BIGINT,
+    sum(r.qualified)::BIGINT,
+    sum(r.percentage_sum)
+  FROM public.attempt_rollup_daily r
+  GROUP BY 1
+  ORDER BY 2 DESC, 1
+  LIMIT LEAST(GREATEST(COALESCE(_limit, 15), 1), 100);
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_attempt_rollup(TEXT, INTEGER) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.admin_attempt_rollup(TEXT, INTEGER) TO authenticated;
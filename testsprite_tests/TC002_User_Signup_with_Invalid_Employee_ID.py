@@ -1,49 +1,17 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+from browser import browser_context
+from waits import click, fill, open_page, submit
+
+async def run_test(context=None):
+    # Use the runner's context when given one, otherwise launch a private browser
+    async with browser_context(context) as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080/admin", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Navigate to the app and wait for the document and its frames to load
+        await open_page(page, "/admin")
         
         # Interact with the page elements to simulate user flow
         # -> Navigate to the signup page by finding and clicking the signup or register button or link.
@@ -53,59 +21,50 @@ async def run_test():
         frame = context.pages[-1]
         # Click the Login button to proceed to login/signup page
         elem = frame.locator('xpath=html/body/div/div[2]/header/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # -> Click the 'Don't have an account? Create one' button to go to the signup page.
         frame = context.pages[-1]
         # Click the 'Don't have an account? Create one' button to navigate to signup page
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # -> Enter full name, invalid employee ID, email, and password, then submit the signup form.
         frame = context.pages[-1]
         # Enter full name
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
+        await fill(elem, 'Test User')
         
 
         frame = context.pages[-1]
         # Enter invalid employee ID
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalidID123')
+        await fill(elem, 'invalidID123')
         
 
         frame = context.pages[-1]
         # Enter email
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser@example.com')
+        await fill(elem, 'testuser@example.com')
         
 
         frame = context.pages[-1]
         # Enter password
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[4]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TestPass123!')
+        await fill(elem, 'TestPass123!')
         
 
         frame = context.pages[-1]
         # Click Create Account button to submit signup form
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await submit(elem)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         await expect(frame.locator('text=Forgot your Employee ID? Please contact your administrator for recovery.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
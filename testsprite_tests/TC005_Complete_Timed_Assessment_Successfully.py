@@ -1,108 +1,28 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from browser import browser_context
+from waits import click, open_page
 
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+# Start from the signed-in storage state cached by auth_state.py
+REQUIRES_AUTH = True
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
 
+async def run_test(context=None):
+    # Use the runner's context when given one, otherwise launch a private browser
+    async with browser_context(context, authenticated=REQUIRES_AUTH) as context:
         # Open a new page in the browser context
         page = await context.new_page()
 
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080/admin", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Navigate to the app and wait for the document and its frames to load
+        await open_page(page, "/admin")
 
         # Interact with the page elements to simulate user flow
-        # -> Click the Login button to start authentication.
-        frame = context.pages[-1]
-        # Click the Login button to start authentication. 
-        elem = frame.locator('xpath=html/body/div/div[2]/header/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        # -> Try inputting email/employee ID and password again, or try inputting password first then email, or check if any other input fields are available.
-        frame = context.pages[-1]
-        # Try entering password first to see if input works. 
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
-        # -> Click the email/employee ID input field at index 1 to focus it, then input the username 'Moh375'.
-        frame = context.pages[-1]
-        # Click the email or employee ID input field to focus it. 
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
-        # -> Input password and click the Login button to authenticate.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input username/email in the email/employee ID field and then click Login.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Moh375')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try clicking the Login button again after re-entering username and password to attempt login once more.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Moh375')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
+        # -> Already signed in from the cached storage state, so the login form is skipped.
         # -> Click the button or link to start the timed assessment test.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/section/div[2]/div/div[2]/div[3]/button[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # -> Locate and click the correct button or link to start the timed assessment test, possibly by scrolling or checking other visible buttons.
@@ -112,13 +32,13 @@ async def run_test():
         # -> Click the 'Go to slide 1' button (index 11) to start the timed assessment and trigger the timer and questions.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/section/div[2]/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # -> Click the 'Go to slide 3' button (index 13) to see if it triggers the timed assessment or reveals questions and timer.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/section/div[2]/div/div[2]/div[3]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # --> Assertions to verify final state
@@ -127,15 +47,6 @@ async def run_test():
             await expect(frame.locator('text=Assessment Completed Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test plan execution failed: The timed assessment did not complete successfully with correct timing enforcement and result calculation.")
-        await asyncio.sleep(5)
-
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
 
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,119 +1,137 @@
 import asyncio
-from playwright import async_api
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+import stand_in
+from browser import browser_context
+from waits import expect_supabase, open_page
+
+# Start from the signed-in storage state cached by auth_state.py
+REQUIRES_AUTH = True
+
+# TEST_DURATION_MINUTES in src/lib/testClock.ts
+TEST_DURATION_SECONDS = 20 * 60
+
+# The journaled paper was started this long ago on the device...
+JOURNAL_ELAPSED_SECONDS = 5 * 60
+
+# ...and, with the stand-in, its server session this long ago. The readout
+# must follow the server, so it never shows the journal's own remaining time.
+SESSION_ELAPSED_SECONDS = 8 * 60
+
+# Slack for the time between the server's reply and reading the readout
+READOUT_SLACK_SECONDS = 10
+
+
+def readout_pattern(seconds):
+    """The mm:ss readouts for ``seconds`` remaining, or up to READOUT_SLACK_SECONDS fewer."""
+    values = range(max(seconds - READOUT_SLACK_SECONDS, 0), seconds + 1)
+    return re.compile("^(" + "|".join(f"{value // 60:02d}:{value % 60:02d}" for value in values) + ")$")
+
+
+# Puts a 20-question paper in the answer journal, as if the candidate had started
+# it a few minutes ago; the assessment page resumes it and asks the server for its deadline
+SEED_JOURNAL = """async ({ userId, clientAttemptId, questionIds, startedAt, deadline }) => {
+  const db = await new Promise((resolve, reject) => {
+    const request = indexedDB.open('elderline', 3);
+    request.onupgradeneeded = () => ['question-shards', 'answer-journal', 'attempt-outbox', 'attempt-rejected'].forEach(name => {
+      if (!request.result.objectStoreNames.contains(name)) request.result.createObjectStore(name);
+    });
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+  await new Promise((resolve, reject) => {
+    const transaction = db.transaction('answer-journal', 'readwrite');
+    transaction.objectStore('answer-journal').put({
+      userId,
+      clientAttemptId,
+      questionIds,
+      paperSeed: null,
+      startedAt,
+      deadline,
+      answers: {},
+      currentIndex: 0,
+    }, userId);
+    transaction.oncomplete = resolve;
+    transaction.onerror = () => reject(transaction.error);
+  });
+  db.close();
+}"""
+
+
+async def run_test(context=None):
+    # Use the runner's context when given one, otherwise launch a private browser
+    async with browser_context(context, authenticated=REQUIRES_AUTH) as context:
         # Open a new page in the browser context
         page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080/admin", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+
+        # Fake Date, timers and performance.now(), so the time limit can be crossed without waiting 20 minutes
+        await page.clock.install()
+
+        # Navigate to the app and wait for the document and its frames to load
+        await open_page(page, "/")
+
+        # -> Already signed in from the cached storage state, so the login form is skipped.
+        # -> Start a paper for the signed-in candidate and open the assessment.
+        user_id = await page.evaluate("() => JSON.parse(localStorage.getItem('user') || 'null')?.id")
+        if not user_id:
+            raise AssertionError("Test failed: no signed-in user in the cached storage state.")
+        now = datetime.now(timezone.utc)
+        client_attempt_id = str(uuid.uuid4())
+        journal_started = now - timedelta(seconds=JOURNAL_ELAPSED_SECONDS)
+        await page.evaluate(SEED_JOURNAL, {
+            "userId": user_id,
+            "clientAttemptId": client_attempt_id,
+            "questionIds": list(range(1, 21)),
+            "startedAt": journal_started.isoformat(),
+            "deadline": (journal_started + timedelta(seconds=TEST_DURATION_SECONDS)).isoformat(),
+        })
+        journal_remaining = TEST_DURATION_SECONDS - JOURNAL_ELAPSED_SECONDS
+
+        # -> The real backend starts the session on the page's first call, so the
+        #    full allowance is expected; the stand-in has it started minutes ago.
+        backend = stand_in.active()
+        if backend is not None:
+            backend.store.add_session(user_id, client_attempt_id, now - timedelta(seconds=SESSION_ELAPSED_SECONDS))
+            expected_remaining = TEST_DURATION_SECONDS - SESSION_ELAPSED_SECONDS
+        else:
+            expected_remaining = TEST_DURATION_SECONDS
+
+        async with expect_supabase(page, "rpc/begin_assessment", method="POST") as begin:
+            await open_page(page, "/engagement/assesement")
+        response = await begin.value
+        if response.status != 200:
+            raise AssertionError(f"Test failed: begin_assessment answered {response.status}, so the timer ran on the device's deadline.")
+
+        # -> The clock resumes from the time the server has left for the paper, not the journal's.
+        timer = page.get_by_test_id("test-timer")
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the Login button to proceed to login form.
-        frame = context.pages[-1]
-        # Click the Login button to open login form.
-        elem = frame.locator('xpath=html/body/div/div[2]/header/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Retry inputting password or try alternative method to login.
-        frame = context.pages[-1]
-        # Retry inputting password in password field.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
-        
-
-        # -> Click the Login button to submit credentials and start the timed assessment.
-        frame = context.pages[-1]
-        # Click Login button to submit credentials and start the timed assessment.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the username/email in the Email or Employee ID field and then click Login to start the timed assessment.
-        frame = context.pages[-1]
-        # Input username/email in the Email or Employee ID field.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Moh375')
-        
-
-        frame = context.pages[-1]
-        # Click Login button to submit credentials and start the timed assessment.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input username and password, then click Login to start the timed assessment.
-        frame = context.pages[-1]
-        # Input username/email in the Email or Employee ID field.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Moh375')
-        
-
-        frame = context.pages[-1]
-        # Input password in the password field.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
-        
-
-        frame = context.pages[-1]
-        # Click Login button to submit credentials and start the timed assessment.
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+            await expect(page.get_by_test_id("test-timer-readout")).to_have_text(readout_pattern(expected_remaining), timeout=10000)
+        except AssertionError:
+            raise AssertionError(f"Test failed: the resumed assessment did not show the {expected_remaining} s the server has left.")
+        remaining = int(await timer.get_attribute("data-remaining-seconds"))
+        if not expected_remaining - READOUT_SLACK_SECONDS <= remaining <= expected_remaining:
+            raise AssertionError(f"Test failed: the timer resumed at {remaining} s instead of {expected_remaining} s.")
+        if abs(remaining - journal_remaining) <= READOUT_SLACK_SECONDS:
+            raise AssertionError("Test failed: the timer followed the device's journaled deadline instead of the server's.")
+
+        # -> Moments before the limit the test is still running.
+        await page.clock.fast_forward((remaining - 2) * 1000)
+        await expect(page.get_by_test_id("test-timer-readout")).to_have_text(re.compile(r"^00:0[12]$"), timeout=5000)
+        await expect(timer).not_to_have_attribute("data-expired", "true")
+
+        # -> Delay answering past the allocated time.
+        await page.clock.fast_forward(3000)
 
         # --> Assertions to verify final state
-        frame = context.pages[-1]
         try:
-            await expect(frame.locator('text=Assessment Completed Successfully').first).to_be_visible(timeout=1000)
+            await expect(page.locator("text=Time's Up!").first).to_be_visible(timeout=5000)
+            await expect(page).to_have_url(re.compile(r"/engagement/?$"), timeout=10000)
         except AssertionError:
             raise AssertionError("Test failed: The assessment engine did not automatically end the test when time expired or did not calculate results correctly as expected in the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,69 +1,25 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from browser import browser_context
+from waits import click, expect_supabase, fill, open_page, submit
 
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+# Start from the signed-in storage state cached by auth_state.py
+REQUIRES_AUTH = True
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
 
+async def run_test(context=None):
+    # Use the runner's context when given one, otherwise launch a private browser
+    async with browser_context(context, authenticated=REQUIRES_AUTH) as context:
         # Open a new page in the browser context
         page = await context.new_page()
 
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080/admin", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Navigate to the dashboard and wait for its attempts query to respond
+        async with expect_supabase(page, "test_attempts"):
+            await open_page(page, "/admin")
 
         # Interact with the page elements to simulate user flow
-        # -> Click the Login button to start admin login process.
-        frame = context.pages[-1]
-        # Click the Login button to open the login form. 
-        elem = frame.locator('xpath=html/body/div/div[2]/header/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        # -> Input admin username and password, then click the Login button to submit.
-        frame = context.pages[-1]
-        # Input admin username or employee ID 
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Moh375')
-        frame = context.pages[-1]
-        # Input admin password 
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
-        frame = context.pages[-1]
-        # Click Login button to submit admin credentials 
-        elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> Already signed in from the cached storage state, so the login form is skipped.
         # -> Verify compliance charts and topic focus suggestions are visible and error-free on the dashboard.
         await page.mouse.wheel(0, 400)
         # -> Check for compliance charts and topic focus suggestions on the dashboard and verify they are visible and error-free.
@@ -76,55 +32,54 @@ async def run_test():
         frame = context.pages[-1]
         # Click the 'Admin Panel' button to go to Admin Dashboard 
         elem = frame.locator('xpath=html/body/div/div[2]/header/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         # -> Check for compliance charts and topic focus suggestions on the dashboard and verify they are visible and error-free.
         await page.mouse.wheel(0, 400)
         # -> Check for compliance charts and topic focus suggestions on the dashboard and verify they are visible and error-free.
         await page.mouse.wheel(0, 400)
         # -> Perform an assessment activity as a user and observe if the Admin Dashboard updates in real-time or near real-time with new user data.
-        await page.goto('http://localhost:8080', timeout=10000)
-        await asyncio.sleep(3)
+        await open_page(page, "/")
         # -> Start the assessment by clicking on the first slide or start button to begin answering questions.
         frame = context.pages[-1]
         # Click the button to go to slide 1 and start the assessment 
         elem = frame.locator('xpath=html/body/div/div[2]/section/div[2]/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         # -> Try an alternative way to start the assessment, such as clicking another visible button or element related to starting the assessment.
         frame = context.pages[-1]
         # Click the 'How long is the assessment?' button as an alternative to start or interact with the assessment 
         elem = frame.locator('xpath=html/body/div/div[2]/section[6]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         # -> Start the assessment by clicking the 'Go to slide 1' button to begin answering questions.
         frame = context.pages[-1]
         # Click the 'Go to slide 1' button to start the assessment 
         elem = frame.locator('xpath=html/body/div/div[2]/section/div[2]/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
+        await click(elem)
         # -> Click the Login button to start admin login process.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/header/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # -> Input admin username and password, then click the Login button to submit.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Moh375')
+        await fill(elem, 'Moh375')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456789')
+        await fill(elem, '123456789')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await submit(elem)
         
 
         # -> Click the 'Question Analysis' tab to check for performance analytics charts, compliance charts, and topic suggestions.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[5]/div[2]/div/div/table/tbody/tr[5]/td[16]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await click(elem)
         
 
         # --> Assertions to verify final state
@@ -133,15 +88,6 @@ async def run_test():
             await expect(frame.locator('text=Admin Dashboard Loaded Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Admin users could not log in and see real-time updated charts for user performance, compliance, and topic suggestions as required by the test plan.")
-        await asyncio.sleep(5)
-
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
 
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,107 @@
+"""Log in once per run and reuse the session as Playwright ``storage_state``.
+
+The app keeps its session in localStorage (``token`` and ``user``, written by
+``useAuth.signIn``).  ``storage_state(browser)`` performs the Auth form login
+once, saves the context's storage state to ``tmp/storage_state.json`` and
+returns that path; authenticated tests create their context from it and start
+already signed in.  The cached file is reused until the token's ``exp`` claim
+is reached, so a stale session is never handed out.  Offline runs keep their
+own file, since stand-in tokens are not valid against the real backend.
+"""
+import asyncio
+import base64
+import json
+import pathlib
+import time
+
+import stand_in
+from browser import BASE_URL, new_context
+from waits import fill, open_page, submit
+
+HERE = pathlib.Path(__file__).resolve().parent
+STATE_PATH = HERE / "tmp" / "storage_state.json"
+OFFLINE_STATE_PATH = HERE / "tmp" / "storage_state.offline.json"
+CONFIG_PATH = HERE / "tmp" / "config.json"
+
+# Refresh this long before the token actually expires, so a test never starts on a dying session
+EXPIRY_SKEW_SECONDS = 60
+
+# Lifetime assumed for tokens that carry no readable exp claim
+FALLBACK_TTL_SECONDS = 30 * 60
+
+EMP_ID_INPUT = 'xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div/input'
+PASSWORD_INPUT = 'xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/div[2]/div[2]/input'
+LOGIN_BUTTON = 'xpath=html/body/div/div[2]/div/div[2]/div/div[2]/div[2]/form/button'
+
+_login_lock = asyncio.Lock()
+
+
+def credentials():
+    """Return the (employee id, password) pair from ``tmp/config.json``."""
+    config = json.loads(CONFIG_PATH.read_text()) if CONFIG_PATH.exists() else {}
+    return config.get("loginUser", "Moh375"), config.get("loginPassword", "123456789")
+
+
+def _local_storage(state):
+    for origin in state.get("origins", []):
+        if origin.get("origin") == BASE_URL:
+            return {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+    return {}
+
+
+def token_expiry(state, saved_at):
+    """Return the epoch second the saved session expires at."""
+    token = _local_storage(state).get("token") or ""
+    parts = token.split(".")
+    if len(parts) == 3:
+        try:
+            payload = parts[1] + "=" * (-len(parts[1]) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+            if exp:
+                return float(exp)
+        except ValueError:
+            pass
+    return saved_at + FALLBACK_TTL_SECONDS
+
+
+def cached_state(path=STATE_PATH):
+    """Return ``path`` if it holds a session that is still valid, else None."""
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not _local_storage(state).get("token"):
+        return None
+    if token_expiry(state, path.stat().st_mtime) - EXPIRY_SKEW_SECONDS <= time.time():
+        return None
+    return path
+
+
+async def login(browser, path=STATE_PATH):
+    """Sign in through the Auth form and save the resulting storage state to ``path``."""
+    emp_id, password = credentials()
+    context = await new_context(browser)
+    try:
+        page = await context.new_page()
+        await open_page(page, "/auth")
+        await fill(page.locator(EMP_ID_INPUT).nth(0), emp_id)
+        await fill(page.locator(PASSWORD_INPUT).nth(0), password)
+        await submit(page.locator(LOGIN_BUTTON).nth(0))
+        await page.wait_for_function("() => localStorage.getItem('token')")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(path))
+    finally:
+        await context.close()
+    return path
+
+
+def state_path():
+    """The cache file for the backend currently in use."""
+    return OFFLINE_STATE_PATH if stand_in.active() else STATE_PATH
+
+
+async def storage_state(browser, path=None):
+    """Return a path to a valid signed-in storage state, logging in at most once."""
+    path = path or state_path()
+    async with _login_lock:
+        return cached_state(path) or await login(browser, path)
@@ -0,0 +1,93 @@
+"""Shared Chromium bootstrap for the TC0xx scripts.
+
+A script run on its own (``python TC003_User_Login_with_Correct_Credentials.py``)
+still launches a private headless browser, exactly as the generated scripts
+always did.  When the scripts are driven by ``runner.py`` they are handed a
+``BrowserContext`` on the runner's shared browser instead, and the runner owns
+that context's lifetime.
+
+Scripts that set ``REQUIRES_AUTH = True`` start from the cached signed-in
+storage state (see ``auth_state.py``) instead of driving the login form.
+
+With ``TESTSPRITE_OFFLINE=1`` (or ``runner.py --offline``) every context's
+backend traffic is routed to the local stand-in in ``stand_in.py``, and with
+``TESTSPRITE_PERF=1`` (or ``runner.py --perf``) the run writes a performance
+timeline (see ``perf.py``).
+"""
+import contextlib
+import pathlib
+import sys
+
+from playwright import async_api
+
+import perf
+import stand_in
+
+BASE_URL = "http://localhost:8080"
+
+# Default timeout applied to every action in a context
+DEFAULT_TIMEOUT_MS = 5000
+
+BROWSER_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+
+async def launch_browser(pw, single_process=True):
+    """Launch headless Chromium with the arguments the scripts were recorded with.
+
+    ``--single-process`` is only safe with one context per browser, so the
+    shared runner browser launches without it.
+    """
+    args = list(BROWSER_ARGS)
+    if single_process:
+        args.append("--single-process")  # Run the browser in a single process mode
+    return await pw.chromium.launch(headless=True, args=args)
+
+
+async def new_context(browser, **kwargs):
+    """Create an isolated context (like an incognito window) with the default timeout."""
+    context = await browser.new_context(**kwargs)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    await stand_in.attach(context)
+    return context
+
+
+async def context_options(browser, authenticated):
+    """Keyword arguments for ``new_context``; signed in when ``authenticated``."""
+    if not authenticated:
+        return {}
+    from auth_state import storage_state
+    return {"storage_state": str(await storage_state(browser))}
+
+
+@contextlib.asynccontextmanager
+async def browser_context(context=None, authenticated=False):
+    """Yield ``context`` untouched, or a fresh private browser's context when it is None."""
+    if context is not None:
+        yield context
+        return
+
+    pw = None
+    browser = None
+    backend = contextlib.AsyncExitStack()
+    try:
+        if stand_in.offline_requested():
+            await backend.enter_async_context(stand_in.serving())
+        pw = await async_api.async_playwright().start()
+        browser = await launch_browser(pw)
+        context = await new_context(browser, **await context_options(browser, authenticated))
+        if perf.recording_requested():
+            await perf.attach(context, pathlib.Path(sys.argv[0]).stem)
+        yield context
+    finally:
+        if context:
+            await perf.finish(context)
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+        await backend.aclose()
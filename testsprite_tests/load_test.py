@@ -0,0 +1,414 @@
+"""Simulate a crowd of candidates taking the timed assessment at once.
+
+Each virtual candidate makes the requests the app makes for one sitting, over
+its own keep-alive connection:
+
+* ``register``  ``POST /api/Auth/register`` (``--register``; the stand-in seed
+  only has a handful of accounts)
+* ``login``     ``POST /api/Auth/login``, as the fresh account or as one of the
+  ``--accounts`` file's existing ones
+* ``start``     the two reads the assessment page does on mount: the
+  candidate's ``user_details`` row and their latest ``test_attempts`` row
+* ``questions`` ``GET`` of every ``questions-module-*.json`` shard, which is
+  what a cold browser fetches to draw a paper.  The shard URLs are
+  content-hashed, so they are found once before the run by crawling the
+  scripts of ``--app-url``; skipped when no app URL is given, and the paper is
+  then drawn from question ids 1-60
+* ``begin``     ``POST /rest/v1/rpc/begin_assessment``, which fixes the paper's
+  start time and deadline on the server
+* ``submit``    after a think-time per question, the upsert the outbox sends:
+  ``POST /rest/v1/test_attempts?on_conflict=client_attempt_id`` with
+  ``Prefer: resolution=ignore-duplicates`` and 20 answers
+
+Against a real backend the candidates need accounts: pass ``--register`` to
+create one each, or ``--accounts`` with a CSV file of ``email,password`` rows,
+one account per candidate.  Candidates start spread over ``--ramp`` seconds.
+The report lists, per step, completed requests, errors, throughput and
+p50/p95/p99 latency.
+
+    python testsprite_tests/load_test.py --offline -n 300          # against the stand-in
+    python testsprite_tests/load_test.py -n 200 --think 2 --ramp 30 --accounts accounts.csv \\
+        --api-url http://192.168.2.185:5000 --supabase-url http://127.0.0.1:54321
+"""
+import argparse
+import asyncio
+import contextlib
+import csv
+import json
+import os
+import pathlib
+import random
+import re
+import ssl
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from urllib.parse import urlencode, urljoin, urlsplit
+
+HERE = pathlib.Path(__file__).resolve().parent
+if str(HERE) not in sys.path:
+    sys.path.insert(0, str(HERE))
+
+from stand_in import DEFAULT_LATENCY_MS, serving  # noqa: E402
+
+DEFAULT_CANDIDATES = 100
+DEFAULT_THINK_SECONDS = 0.5
+DEFAULT_API_URL = "http://192.168.2.185:5000"
+PASSWORD = "LoadTest#2026"
+
+# The assessment: 20 of the 60 questions in src/data/questions-updated.ts
+QUESTIONS_PER_TEST = 20
+QUESTION_IDS = range(1, 61)
+PASS_PERCENTAGE = 60
+# TEST_DURATION_MINUTES in src/lib/testClock.ts
+TEST_DURATION_MINUTES = 20
+
+STEPS = ("register", "login", "start", "questions", "begin", "submit")
+
+# The question-shards manifest as the dev server serves it; a build has it in a hashed chunk
+DEV_SHARD_MANIFEST = "/@id/__x00__virtual:question-shards"
+SHARD_URL = re.compile(r"""[\w./@-]*questions-module-[\w.-]+?\.json""")
+SCRIPT_URL = re.compile(r"""["']([^"'\s]+\.js)["']""")
+MAX_SCRIPTS = 200
+
+
+class HttpError(Exception):
+    def __init__(self, status, body):
+        super().__init__(f"HTTP {status}: {body[:200]!r}")
+        self.status = status
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection, reopened if the server drops it."""
+
+    def __init__(self, origin):
+        parts = urlsplit(origin)
+        self.host = parts.hostname
+        self.secure = parts.scheme == "https"
+        self.port = parts.port or (443 if self.secure else 80)
+        self.host_header = parts.netloc
+        self.reader = self.writer = None
+
+    async def _open(self):
+        context = ssl.create_default_context() if self.secure else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            with contextlib.suppress(Exception):
+                await self.writer.wait_closed()
+            self.reader = self.writer = None
+
+    async def request(self, method, path, headers=None, body=None):
+        payload = b"" if body is None else json.dumps(body).encode()
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host_header}", "Connection: keep-alive",
+                 f"Content-Length: {len(payload)}"]
+        if body is not None:
+            lines.append("Content-Type: application/json")
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        raw = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+        for retry in (False, True):
+            if self.writer is None:
+                await self._open()
+            try:
+                self.writer.write(raw)
+                await self.writer.drain()
+                return await self._read_response()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # A kept-alive socket the server already closed; try once on a fresh one
+                await self.close()
+                if retry:
+                    raise
+
+    async def _read_response(self):
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                body += await self.reader.readexactly(size)
+                await self.reader.readline()
+            body = bytes(body)
+        else:
+            length = int(headers.get("content-length") or 0)
+            body = await self.reader.readexactly(length) if length else b""
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        if status >= 400:
+            raise HttpError(status, body.decode("utf-8", "replace"))
+        return status, headers, body
+
+
+@dataclass
+class StepStats:
+    latencies: list = field(default_factory=list)
+    errors: int = 0
+    first: float = None
+    last: float = None
+
+    def record(self, started, elapsed):
+        self.latencies.append(elapsed)
+        self.first = started if self.first is None else min(self.first, started)
+        self.last = started + elapsed if self.last is None else max(self.last, started + elapsed)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class LoadTest:
+    api_url: str
+    supabase_url: str
+    app_url: str = None
+    apikey: str = ""
+    think_seconds: float = DEFAULT_THINK_SECONDS
+    register: bool = False
+    # (email, password) of existing accounts, one per candidate
+    accounts: list = None
+    # Paths of the questions-module-*.json shards on app_url
+    shard_paths: list = field(default_factory=list)
+    stats: dict = field(default_factory=lambda: {step: StepStats() for step in STEPS})
+    failures: list = field(default_factory=list)
+    completed: int = 0
+
+    async def timed(self, step, call):
+        started = time.perf_counter()
+        try:
+            result = await call
+        except Exception:
+            self.stats[step].errors += 1
+            raise
+        self.stats[step].record(started, time.perf_counter() - started)
+        return result
+
+    def rest_headers(self, token):
+        return {"apikey": self.apikey, "Authorization": f"Bearer {token or self.apikey}"}
+
+    async def candidate(self, index, delay, rng):
+        await asyncio.sleep(delay)
+        connections = {}
+
+        def connection(origin):
+            if origin not in connections:
+                connections[origin] = Connection(origin)
+            return connections[origin]
+
+        api = connection(self.api_url)
+        rest = connection(self.supabase_url)
+        tag = uuid.uuid4().hex[:8]
+        email, password = self.accounts[index] if self.accounts else (f"load.{index}.{tag}@elderline.com", PASSWORD)
+        try:
+            if self.register:
+                await self.timed("register", api.request("POST", "/api/Auth/register", body={
+                    "email": email, "password": PASSWORD, "fullName": f"Load Candidate {index}",
+                    "empId": f"LOAD{index:05d}{tag[:4].upper()}"}))
+
+            _, _, body = await self.timed("login", api.request("POST", "/api/Auth/login", body={
+                "email": email, "password": password}))
+            session = json.loads(body)
+            token = session.get("token")
+            user_id = (session.get("user") or session).get("id")
+
+            headers = self.rest_headers(token)
+            details_query = urlencode({"select": "user_id", "user_id": f"eq.{user_id}"})
+            attempt_query = urlencode({"select": "score,total_questions,qualified,percentage",
+                                       "user_id": f"eq.{user_id}", "order": "completed_at.desc", "limit": 1})
+
+            async def start():
+                await rest.request("GET", f"/rest/v1/user_details?{details_query}", headers)
+                await rest.request("GET", f"/rest/v1/test_attempts?{attempt_query}", headers)
+
+            await self.timed("start", start())
+
+            question_ids = QUESTION_IDS
+            if self.shard_paths:
+                app = connection(self.app_url)
+
+                async def questions():
+                    bank = []
+                    for path in self.shard_paths:
+                        _, _, shard = await app.request("GET", path)
+                        bank += [question["id"] for question in json.loads(shard)]
+                    return bank
+
+                question_ids = await self.timed("questions", questions())
+
+            client_attempt_id = str(uuid.uuid4())
+            _, _, body = await self.timed("begin", rest.request("POST", "/rest/v1/rpc/begin_assessment", headers, body={
+                "_client_attempt_id": client_attempt_id, "_duration_minutes": TEST_DURATION_MINUTES}))
+            started_at = json.loads(body)["started_at"]
+
+            answers = {}
+            for question_id in rng.sample(question_ids, QUESTIONS_PER_TEST):
+                # Reading time varies a lot between questions and candidates
+                await asyncio.sleep(rng.lognormvariate(0, 0.5) * self.think_seconds)
+                answers[str(question_id)] = rng.choice("ABCD")
+
+            score = sum(rng.random() < 0.7 for _ in answers)
+            percentage = round(score / QUESTIONS_PER_TEST * 100)
+            await self.timed("submit", rest.request(
+                "POST", f"/rest/v1/test_attempts?{urlencode({'on_conflict': 'client_attempt_id'})}",
+                {**headers, "Prefer": "resolution=ignore-duplicates,return=minimal"}, body={
+                    "user_id": user_id, "score": score, "total_questions": QUESTIONS_PER_TEST,
+                    "percentage": percentage, "qualified": percentage >= PASS_PERCENTAGE, "answers": answers,
+                    "started_at": started_at, "completed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "paper_seed": None, "client_attempt_id": client_attempt_id}))
+            self.completed += 1
+        except Exception as exc:
+            self.failures.append(f"candidate {index}: {type(exc).__name__}: {exc}")
+        finally:
+            for open_connection in connections.values():
+                await open_connection.close()
+
+    async def run(self, candidates, ramp_seconds, seed=None):
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            self.candidate(index, rng.uniform(0, ramp_seconds), random.Random(rng.random()))
+            for index in range(candidates)))
+        return time.perf_counter() - started
+
+
+async def find_shards(app_url):
+    """Paths of the questions-module-*.json shards the app at ``app_url`` loads.
+
+    The dev server serves the shard manifest as a module of its own; a build
+    puts it in a hashed chunk, so the scripts reachable from the page are read
+    until the chunk that names the shards turns up.
+    """
+    app = Connection(app_url)
+    origin = f"{urlsplit(app_url).scheme}://{urlsplit(app_url).netloc}"
+
+    async def text(url):
+        try:
+            _, _, body = await app.request("GET", urlsplit(url).path or "/")
+        except HttpError:
+            return ""
+        return body.decode("utf-8", "replace")
+
+    try:
+        manifest = await text(urljoin(origin, DEV_SHARD_MANIFEST))
+        if SHARD_URL.search(manifest):
+            return sorted({urlsplit(urljoin(origin, match)).path for match in SHARD_URL.findall(manifest)})
+
+        shards, seen = set(), set()
+        queue = [app_url]
+        while queue and len(seen) < MAX_SCRIPTS:
+            url = queue.pop(0)
+            if url in seen or not url.startswith(origin):
+                continue
+            seen.add(url)
+            source = await text(url)
+            # Built shard URLs are relative to the chunk that names them
+            shards.update(urlsplit(urljoin(url, match)).path for match in SHARD_URL.findall(source))
+            queue += [urljoin(url, match) for match in SCRIPT_URL.findall(source)]
+            queue += [urljoin(url, match) for match in re.findall(r'src="([^"]+)"', source)]
+        return sorted(shards)
+    finally:
+        await app.close()
+
+
+def print_report(test, candidates, wall_time):
+    print(f"\n{test.completed}/{candidates} candidates submitted in {wall_time:.1f}s "
+          f"({test.completed / wall_time:.1f} submissions/s)\n")
+    print(f"{'step':<10}{'ok':>7}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for step in STEPS:
+        stats = test.stats[step]
+        if not stats.latencies and not stats.errors:
+            continue
+        latencies = sorted(stats.latencies)
+        window = (stats.last - stats.first) if latencies else 0
+        throughput = len(latencies) / window if window > 0 else 0
+        print(f"{step:<10}{len(latencies):>7}{stats.errors:>8}{throughput:>9.1f}"
+              f"{percentile(latencies, 0.50) * 1000:>10.1f}{percentile(latencies, 0.95) * 1000:>10.1f}"
+              f"{percentile(latencies, 0.99) * 1000:>10.1f}")
+    if test.failures:
+        print(f"\n{len(test.failures)} candidates failed; first few:")
+        for failure in test.failures[:5]:
+            print(f"  {failure}")
+
+
+def load_accounts(path):
+    """``(email, password)`` pairs from a CSV file with ``email`` and ``password`` columns."""
+    with open(path, newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    if rows and not {"email", "password"} <= rows[0].keys():
+        raise SystemExit(f"{path}: expected email and password columns")
+    return [(row["email"].strip(), row["password"]) for row in rows if row["email"].strip()]
+
+
+async def run(args):
+    accounts = load_accounts(args.accounts) if args.accounts else None
+    if accounts is not None and len(accounts) < args.candidates:
+        raise SystemExit(f"{args.accounts} has {len(accounts)} accounts for {args.candidates} candidates")
+    if not (args.offline or args.register or accounts):
+        raise SystemExit("Candidates need accounts: pass --register, --accounts FILE or --offline")
+    backend = serving(latency_ms=args.latency) if args.offline else contextlib.nullcontext()
+    async with backend as stand_in:
+        api_url = stand_in.url if stand_in else args.api_url
+        supabase_url = stand_in.url if stand_in else args.supabase_url
+        if not supabase_url:
+            raise SystemExit("--supabase-url (or VITE_SUPABASE_URL) is required without --offline")
+        shard_paths = await find_shards(args.app_url) if args.app_url else []
+        if args.app_url and not shard_paths:
+            raise SystemExit(f"No questions-module-*.json shards found at {args.app_url}")
+        test = LoadTest(api_url=api_url, supabase_url=supabase_url, app_url=args.app_url, apikey=args.apikey,
+                        think_seconds=args.think, register=not accounts and (args.register or args.offline),
+                        accounts=accounts, shard_paths=shard_paths)
+        wall_time = await test.run(args.candidates, args.ramp, args.seed)
+    print_report(test, args.candidates, wall_time)
+    return 0 if not test.failures else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--candidates", type=int, default=DEFAULT_CANDIDATES,
+                        help=f"virtual candidates (default: {DEFAULT_CANDIDATES})")
+    parser.add_argument("--ramp", type=float, default=5.0,
+                        help="spread candidate start times over this many seconds (default: 5)")
+    parser.add_argument("--think", type=float, default=DEFAULT_THINK_SECONDS,
+                        help=f"median think-time per question in seconds (default: {DEFAULT_THINK_SECONDS}; "
+                             "a real sitting is closer to 60)")
+    parser.add_argument("--seed", type=int, help="random seed, for repeatable runs")
+    parser.add_argument("--register", action="store_true",
+                        help="register every candidate first (on with --offline unless --accounts is given)")
+    parser.add_argument("--accounts", type=pathlib.Path,
+                        help="CSV file of email,password rows; each candidate signs in as one of them")
+    parser.add_argument("--offline", action="store_true", help="run against a fresh local stand-in backend")
+    parser.add_argument("--latency", type=int, default=DEFAULT_LATENCY_MS,
+                        help=f"stand-in delay per HTTP response in ms (default: {DEFAULT_LATENCY_MS})")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL, help=f"auth API (default: {DEFAULT_API_URL})")
+    parser.add_argument("--supabase-url", default=os.environ.get("VITE_SUPABASE_URL"),
+                        help="Supabase project URL (default: $VITE_SUPABASE_URL)")
+    parser.add_argument("--apikey", default=os.environ.get("VITE_SUPABASE_PUBLISHABLE_KEY", ""),
+                        help="Supabase publishable key (default: $VITE_SUPABASE_PUBLISHABLE_KEY)")
+    parser.add_argument("--app-url", help="frontend URL whose question shards each candidate fetches, "
+                                          "e.g. http://localhost:8080/")
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
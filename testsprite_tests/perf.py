@@ -0,0 +1,304 @@
+"""Per-test browser performance timelines for the TC0xx scripts.
+
+The scripts only assert on visible text; this module records how the pages
+behaved while they ran.  A recorded context gets a small init script that
+keeps PerformanceObserver tallies in every document (LCP, FCP, CLS over
+session windows, INP over event timing, long tasks), and at each named step
+the recorder samples them together with CDP ``Performance.getMetrics``
+(``JSHeapUsedSize``, DOM nodes, script/layout/task time).  ``waits.open_page``
+marks a step after every navigation and the runner marks ``end`` when the test
+returns; scripts can add their own with ``await perf.mark(page, "name")``.
+
+Each test writes ``tmp/perf/<test>.json``: one entry per step, in order.
+
+    python testsprite_tests/runner.py --perf                 # record a timeline per test
+    TESTSPRITE_PERF=1 python testsprite_tests/TC003_...py    # one script on its own
+    python testsprite_tests/perf.py baseline                 # keep the current timelines as the baseline
+    python testsprite_tests/perf.py compare                  # flag steps that got slower than the baseline
+    python testsprite_tests/perf.py compare --budget lcp_ms=20% --budget cls=+0.05
+
+A metric regresses when it is worse than the baseline by more than both its
+relative and its absolute budget, so noise on tiny values is not reported.
+"""
+import argparse
+import json
+import os
+import pathlib
+import shutil
+import sys
+import time
+from dataclasses import dataclass, field
+
+HERE = pathlib.Path(__file__).resolve().parent
+PERF_DIR = HERE / "tmp" / "perf"
+BASELINE_DIR = PERF_DIR / "baseline"
+
+# Set to "1" to record a standalone script
+PERF_ENV = "TESTSPRITE_PERF"
+
+# metric: (relative budget, absolute budget); both must be exceeded to count as a regression
+DEFAULT_BUDGETS = {
+    "ttfb_ms": (0.25, 100),
+    "fcp_ms": (0.20, 100),
+    "lcp_ms": (0.20, 150),
+    "cls": (0.0, 0.02),
+    "inp_ms": (0.25, 50),
+    "long_task_ms": (0.25, 100),
+    "heap_used_mb": (0.15, 2),
+    "dom_nodes": (0.15, 200),
+    "script_ms": (0.25, 100),
+    "layout_ms": (0.25, 50),
+}
+
+# Runs in every document of a recorded context, before the app's own scripts
+OBSERVERS = """(() => {
+  if (window.__testsprite_perf) return;
+  const perf = window.__testsprite_perf = { lcp: null, fcp: null, cls: 0, interactions: {}, longTasks: [] };
+  const observe = (type, callback, options = {}) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({ type, buffered: true, ...options });
+    } catch (error) {
+      // Entry type not supported by this browser
+    }
+  };
+  observe('largest-contentful-paint', entry => { perf.lcp = entry.startTime; });
+  observe('paint', entry => { if (entry.name === 'first-contentful-paint') perf.fcp = entry.startTime; });
+  // CLS: the largest burst of shifts less than 1 s apart and within 5 s
+  let windowValue = 0, windowStart = 0, lastShift = -Infinity;
+  observe('layout-shift', entry => {
+    if (entry.hadRecentInput) return;
+    if (entry.startTime - lastShift < 1000 && entry.startTime - windowStart < 5000) {
+      windowValue += entry.value;
+    } else {
+      windowValue = entry.value;
+      windowStart = entry.startTime;
+    }
+    lastShift = entry.startTime;
+    perf.cls = Math.max(perf.cls, windowValue);
+  });
+  observe('event', entry => {
+    if (!entry.interactionId) return;
+    perf.interactions[entry.interactionId] = Math.max(perf.interactions[entry.interactionId] || 0, entry.duration);
+  }, { durationThreshold: 16 });
+  observe('longtask', entry => { perf.longTasks.push(entry.duration); });
+})()"""
+
+# The current document's vitals; long tasks are handed over once and then forgotten
+SNAPSHOT = """() => {
+  const perf = window.__testsprite_perf;
+  const navigation = performance.getEntriesByType('navigation')[0];
+  if (!perf) return null;
+  // INP: the worst interaction, ignoring one outlier per 50 interactions
+  const durations = Object.values(perf.interactions).sort((a, b) => b - a);
+  const inp = durations.length ? durations[Math.min(durations.length - 1, Math.floor(durations.length / 50))] : null;
+  return {
+    ttfb: navigation ? navigation.responseStart : null,
+    fcp: perf.fcp,
+    lcp: perf.lcp,
+    cls: perf.cls,
+    inp,
+    longTasks: perf.longTasks.splice(0),
+  };
+}"""
+
+# CDP Performance.getMetrics values kept in the timeline, and their units
+CDP_METRICS = {
+    "JSHeapUsedSize": ("heap_used_mb", 1 / 2 ** 20),
+    "Nodes": ("dom_nodes", 1),
+    "ScriptDuration": ("script_ms", 1000),
+    "LayoutDuration": ("layout_ms", 1000),
+    "TaskDuration": ("task_ms", 1000),
+}
+
+
+def recording_requested():
+    return os.environ.get(PERF_ENV) == "1"
+
+
+def _rounded(value, digits=1):
+    return None if value is None else round(value, digits)
+
+
+@dataclass
+class Recorder:
+    """The timeline of one test's context."""
+
+    test: str
+    started: float = field(default_factory=time.perf_counter)
+    steps: list = field(default_factory=list)
+    _sessions: dict = field(default_factory=dict)
+
+    async def _cdp_metrics(self, page):
+        session = self._sessions.get(page)
+        if session is None:
+            session = await page.context.new_cdp_session(page)
+            await session.send("Performance.enable")
+            self._sessions[page] = session
+        result = await session.send("Performance.getMetrics")
+        values = {metric["name"]: metric["value"] for metric in result["metrics"]}
+        return {name: _rounded(values[key] * scale, 3 if name == "heap_used_mb" else 1)
+                for key, (name, scale) in CDP_METRICS.items() if key in values}
+
+    async def mark(self, page, step):
+        """Sample ``page`` and append it to the timeline as ``step``."""
+        entry = {"step": step, "t_ms": _rounded((time.perf_counter() - self.started) * 1000), "url": page.url}
+        try:
+            vitals = await page.evaluate(SNAPSHOT)
+        except Exception as exc:  # page closed or mid-navigation
+            vitals, entry["error"] = None, f"{type(exc).__name__}: {exc}".splitlines()[0]
+        if vitals:
+            long_tasks = vitals["longTasks"]
+            entry.update({
+                "ttfb_ms": _rounded(vitals["ttfb"]),
+                "fcp_ms": _rounded(vitals["fcp"]),
+                "lcp_ms": _rounded(vitals["lcp"]),
+                "cls": _rounded(vitals["cls"], 4),
+                "inp_ms": _rounded(vitals["inp"]),
+                "long_tasks": len(long_tasks),
+                "long_task_ms": _rounded(sum(long_tasks)),
+                "longest_task_ms": _rounded(max(long_tasks, default=0)),
+            })
+        try:
+            entry.update(await self._cdp_metrics(page))
+        except Exception as exc:
+            entry.setdefault("error", f"{type(exc).__name__}: {exc}".splitlines()[0])
+        self.steps.append(entry)
+        return entry
+
+    def save(self, directory=PERF_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.test}.json"
+        path.write_text(json.dumps({"test": self.test, "steps": self.steps}, indent=2) + "\n")
+        return path
+
+
+_recorders = {}
+
+
+async def attach(context, test):
+    """Record ``context`` as ``test``'s timeline; returns the recorder."""
+    recorder = Recorder(test)
+    await context.add_init_script(script=OBSERVERS)
+    _recorders[context] = recorder
+    return recorder
+
+
+async def mark(page, step):
+    """Add a step to the timeline of ``page``'s test; a no-op when it is not recorded."""
+    recorder = _recorders.get(page.context)
+    if recorder is not None:
+        await recorder.mark(page, step)
+
+
+async def finish(context):
+    """Mark ``end`` on the context's last open page, write the timeline and return its path."""
+    recorder = _recorders.pop(context, None)
+    if recorder is None:
+        return None
+    pages = [page for page in context.pages if not page.is_closed()]
+    if pages:
+        await recorder.mark(pages[-1], "end")
+    return recorder.save()
+
+
+# --------------------------------------------------------------------------- comparison
+
+def parse_budget(text):
+    """``lcp_ms=20%`` sets the relative budget, ``lcp_ms=+150`` the absolute one."""
+    metric, sep, value = text.partition("=")
+    if not sep or metric not in DEFAULT_BUDGETS:
+        raise argparse.ArgumentTypeError(f"expected METRIC=PCT% or METRIC=+ABS with METRIC one of "
+                                         f"{', '.join(DEFAULT_BUDGETS)}")
+    try:
+        if value.endswith("%"):
+            return metric, "relative", float(value[:-1]) / 100
+        return metric, "absolute", float(value.lstrip("+"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad budget value: {value!r}") from None
+
+
+def budgets_with(overrides):
+    budgets = dict(DEFAULT_BUDGETS)
+    for metric, kind, value in overrides:
+        relative, absolute = budgets[metric]
+        budgets[metric] = (value, absolute) if kind == "relative" else (relative, value)
+    return budgets
+
+
+def load_timelines(directory):
+    return {path.stem: json.loads(path.read_text())["steps"] for path in sorted(directory.glob("*.json"))}
+
+
+def _step_names(steps):
+    """Step names made unique, so a page opened twice is compared visit by visit."""
+    seen = {}
+    names = []
+    for step in steps:
+        seen[step["step"]] = seen.get(step["step"], 0) + 1
+        names.append(step["step"] if seen[step["step"]] == 1 else f"{step['step']} #{seen[step['step']]}")
+    return names
+
+
+def compare(baseline, current, budgets):
+    """Regressions of ``current`` against ``baseline``: (test, step, metric, before, after) tuples."""
+    regressions = []
+    for test, steps in current.items():
+        before_steps = dict(zip(_step_names(baseline.get(test, [])), baseline.get(test, [])))
+        for name, step in zip(_step_names(steps), steps):
+            before = before_steps.get(name)
+            if before is None:
+                continue
+            for metric, (relative, absolute) in budgets.items():
+                old, new = before.get(metric), step.get(metric)
+                if old is None or new is None:
+                    continue
+                if new - old > absolute and new > old * (1 + relative):
+                    regressions.append((test, name, metric, old, new))
+    return regressions
+
+
+def print_regressions(regressions, compared):
+    if not regressions:
+        print(f"No regressions in {compared} test(s).")
+        return
+    width = max(len(f"{test}  {step}") for test, step, *_ in regressions)
+    for test, step, metric, old, new in regressions:
+        change = f"+{(new - old) / old:.0%}" if old else "new"
+        print(f"{f'{test}  {step}':<{width}}  {metric:<14} {old:>10} -> {new:<10} {change}")
+    print(f"\n{len(regressions)} regression(s) in {compared} test(s).")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("baseline", help=f"copy the timelines in {PERF_DIR.relative_to(HERE)} to the baseline")
+    compare_parser = commands.add_parser("compare", help="flag steps that regressed against the baseline")
+    compare_parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_DIR,
+                                help=f"baseline timelines (default: {BASELINE_DIR.relative_to(HERE)})")
+    compare_parser.add_argument("--current", type=pathlib.Path, default=PERF_DIR,
+                                help=f"timelines to check (default: {PERF_DIR.relative_to(HERE)})")
+    compare_parser.add_argument("--budget", action="append", type=parse_budget, default=[],
+                                help="override a budget, e.g. lcp_ms=20%% or cls=+0.05 (repeatable)")
+    args = parser.parse_args(argv)
+
+    if args.command == "baseline":
+        timelines = sorted(PERF_DIR.glob("*.json"))
+        if not timelines:
+            raise SystemExit(f"No timelines in {PERF_DIR}; run runner.py --perf first")
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        for path in timelines:
+            shutil.copy2(path, BASELINE_DIR / path.name)
+        print(f"Baseline updated with {len(timelines)} timeline(s).")
+        return 0
+
+    baseline, current = load_timelines(args.baseline), load_timelines(args.current)
+    if not baseline:
+        raise SystemExit(f"No baseline timelines in {args.baseline}; run perf.py baseline first")
+    compared = [test for test in current if test in baseline]
+    regressions = compare(baseline, current, budgets_with(args.budget))
+    print_regressions(regressions, len(compared))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
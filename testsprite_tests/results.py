@@ -0,0 +1,131 @@
+"""The results store: ``tmp/test_results.json`` and ``tmp/raw_report.md``.
+
+``test_results.json`` holds one record per test, as TestSprite writes it
+(``title`` starts with the test id, e.g. ``TC003-User Login ...``).  Runs
+merged in by ``runner.py`` update a record's ``testStatus``, ``testError``
+and ``modified``, and add ``durationMs``, the wall time of the last run;
+the shard planner reads those durations back.  ``raw_report.md`` is then
+re-rendered from the records, keeping its header and closing sections.
+"""
+import json
+import pathlib
+import re
+import uuid
+from datetime import datetime, timezone
+
+HERE = pathlib.Path(__file__).resolve().parent
+RESULTS_PATH = HERE / "tmp" / "test_results.json"
+REPORT_PATH = HERE / "tmp" / "raw_report.md"
+
+DASHBOARD_URL = "https://www.testsprite.com/dashboard/mcp/tests"
+
+TEST_ID = re.compile(r"^(TC\d{3})")
+
+STATUS_LABELS = {"PASSED": "✅ Passed", "FAILED": "❌ Failed"}
+
+SUMMARY_HEADING = "## 2️⃣ Requirement Validation Summary"
+METRICS_HEADING = "## 3️⃣ Coverage & Matching Metrics"
+PASS_RATE = re.compile(r"- \*\*[\d.]+\*\* of tests passed")
+
+
+def test_id(name):
+    """``TC003`` for a script name or a record title; None when there is no id."""
+    match = TEST_ID.match(name)
+    return match.group(1) if match else None
+
+
+def load_records(path=RESULTS_PATH):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []
+
+
+def durations(records):
+    """Seconds each test took on its last recorded run, by test id."""
+    return {test_id(record.get("title", "")): record["durationMs"] / 1000
+            for record in records if test_id(record.get("title", "")) and record.get("durationMs") is not None}
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _new_record(name, template):
+    identifier, _, rest = name.partition("_")
+    record = {key: template[key] for key in ("projectId", "userId") if key in template}
+    script = HERE / f"{name}.py"
+    record.update({
+        "testId": str(uuid.uuid4()),
+        "title": f"{identifier}-{rest.replace('_', ' ')}",
+        "description": "",
+        "code": script.read_text() if script.exists() else "",
+        "testType": "FRONTEND",
+        "createFrom": "runner",
+        "created": _now(),
+    })
+    return record
+
+
+def merge(outcomes, records):
+    """Fold runner outcomes into ``records`` (in place) and return them, ordered by test id."""
+    by_id = {test_id(record.get("title", "")): record for record in records}
+    template = records[0] if records else {}
+    for outcome in outcomes:
+        key = test_id(outcome["name"])
+        record = by_id.get(key)
+        if record is None:
+            record = by_id[key] = _new_record(outcome["name"], template)
+            records.append(record)
+        record["testStatus"] = outcome["status"]
+        if outcome["error"]:
+            record["testError"] = outcome["error"]
+        else:
+            record.pop("testError", None)
+        record["durationMs"] = round(outcome["duration"] * 1000)
+        record["modified"] = _now()
+    records.sort(key=lambda record: test_id(record.get("title", "")) or "")
+    return records
+
+
+def save_records(records, path=RESULTS_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(records, indent=2, ensure_ascii=False) + "\n")
+
+
+def _section(record):
+    key = test_id(record.get("title", ""))
+    script = next(HERE.glob(f"{key}_*.py"), None) if key else None
+    lines = [f"#### Test {key}", f"- **Test Name:** {record.get('title', '')}"]
+    if script is not None:
+        lines.append(f"- **Test Code:** [{script.name}](./{script.name})")
+    if record.get("testError"):
+        lines.append(f"- **Test Error:** {record['testError']}")
+    if record.get("testVisualization"):
+        # The report links the TestSprite dashboard page, which embeds the recording
+        lines.append(f"- **Test Visualization and Result:** {DASHBOARD_URL}/{record['projectId']}/{record['testId']}")
+    if record.get("durationMs") is not None:
+        lines.append(f"- **Duration:** {record['durationMs'] / 1000:.1f}s")
+    lines.append(f"- **Status:** {STATUS_LABELS.get(record.get('testStatus'), record.get('testStatus'))}")
+    lines.append("- **Analysis / Findings:** {{TODO:AI_ANALYSIS}}.")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def write_report(records, path=REPORT_PATH):
+    """Re-render the per-test summary and the pass rate of ``raw_report.md`` from ``records``."""
+    existing = path.read_text() if path.exists() else ""
+    head, found, rest = existing.partition(SUMMARY_HEADING)
+    if not found:
+        head = "# TestSprite AI Testing Report(MCP)\n\n---\n\n"
+    if METRICS_HEADING in rest:
+        tail = rest[rest.index(METRICS_HEADING):]
+    else:
+        tail = f"{METRICS_HEADING}\n\n- **0** of tests passed\n---\n"
+
+    passed = sum(record.get("testStatus") == "PASSED" for record in records)
+    rate = f"{100 * passed / len(records):.2f}" if records else "0"
+    tail = PASS_RATE.sub(f"- **{rate}** of tests passed", tail, count=1)
+
+    sections = "\n".join(_section(record) for record in records)
+    path.write_text(f"{head}{SUMMARY_HEADING}\n\n{sections}\n\n{tail}")
@@ -0,0 +1,311 @@
+"""Run the TC0xx scripts concurrently on one shared Chromium.
+
+Every script exposes ``run_test(context=None)``.  Instead of letting each one
+cold-start its own browser, the runner launches a single browser and hands
+every test its own ``BrowserContext`` on it, so the suite takes roughly as long
+as its slowest test rather than the sum of all of them.
+
+    python testsprite_tests/runner.py                  # every TC0xx script, 4 at a time
+    python testsprite_tests/runner.py -c 8             # up to 8 tests in flight
+    python testsprite_tests/runner.py TC003 TC005      # only the named tests
+    python testsprite_tests/runner.py --compare        # fixed 3 s sleeps vs event-driven waits
+    python testsprite_tests/runner.py --offline        # against the local stand-in backend
+    python testsprite_tests/runner.py --perf           # also write a performance timeline per test (perf.py)
+
+Sharding splits the suite into balanced shards using each test's last
+recorded duration in ``tmp/test_results.json`` (tests with no history count
+as the median), placing the longest tests first, each on the shard with the
+least work so far:
+
+    python testsprite_tests/runner.py --shards 3       # 3 worker processes on this machine, results merged
+    python testsprite_tests/runner.py --shard 2/3      # only the second of 3 shards, e.g. on one CI box
+    python testsprite_tests/runner.py --merge tmp/shards/*.json   # fold the boxes' outcomes together
+
+Sharded and merged runs update ``test_results.json`` (status, error and
+``durationMs``) and re-render ``raw_report.md`` (see ``results.py``).
+"""
+import argparse
+import asyncio
+import contextlib
+import importlib
+import json
+import os
+import pathlib
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+from playwright import async_api
+
+HERE = pathlib.Path(__file__).resolve().parent
+if str(HERE) not in sys.path:
+    sys.path.insert(0, str(HERE))
+
+import perf  # noqa: E402
+import results  # noqa: E402
+from browser import context_options, launch_browser, new_context  # noqa: E402
+from stand_in import DEFAULT_LATENCY_MS, serving  # noqa: E402
+
+DEFAULT_CONCURRENCY = 4
+
+# Where each shard writes its outcomes for the merge
+SHARDS_DIR = HERE / "tmp" / "shards"
+
+# Estimate for a test with no recorded duration when no test has one
+DEFAULT_DURATION_S = 30.0
+
+
+@dataclass
+class TestOutcome:
+    name: str
+    status: str
+    duration: float
+    error: str = ""
+
+
+def discover(selected=None):
+    """Return the module names of the TC0xx scripts, optionally filtered by id prefix."""
+    names = sorted(path.stem for path in HERE.glob("TC[0-9][0-9][0-9]_*.py"))
+    if not selected:
+        return names
+    picked = [name for name in names if any(name.startswith(prefix) for prefix in selected)]
+    missing = [prefix for prefix in selected if not any(name.startswith(prefix) for name in names)]
+    if missing:
+        raise SystemExit(f"No test script matches: {', '.join(missing)}")
+    return picked
+
+
+async def run_one(browser, name, semaphore, record_perf=False):
+    """Run one script's ``run_test`` in a fresh context once a concurrency slot is free."""
+    async with semaphore:
+        module = importlib.import_module(name)
+        options = await context_options(browser, getattr(module, "REQUIRES_AUTH", False))
+        context = await new_context(browser, **options)
+        if record_perf:
+            await perf.attach(context, name)
+        started = time.perf_counter()
+        try:
+            await module.run_test(context)
+            status, error = "PASSED", ""
+        except Exception as exc:
+            status, error = "FAILED", f"{type(exc).__name__}: {exc}"
+        finally:
+            duration = time.perf_counter() - started
+            if record_perf:
+                await perf.finish(context)
+            await context.close()
+        return TestOutcome(name, status, duration, error)
+
+
+async def run_suite(names, concurrency=DEFAULT_CONCURRENCY, latency_ms=None, record_perf=False):
+    """Run ``names`` against one shared browser with at most ``concurrency`` in flight.
+
+    With ``latency_ms`` set, a fresh stand-in backend answering after that fixed
+    delay serves the run instead of the real one.  With ``record_perf`` every
+    test writes its performance timeline to ``tmp/perf``.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    backend = contextlib.nullcontext() if latency_ms is None else serving(latency_ms=latency_ms)
+    async with backend, async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, single_process=False)
+        try:
+            return await asyncio.gather(*(run_one(browser, name, semaphore, record_perf) for name in names))
+        finally:
+            await browser.close()
+
+
+async def compare_waits(names, concurrency=DEFAULT_CONCURRENCY, latency_ms=None):
+    """Run ``names`` with the legacy fixed sleeps, then with event-driven waits."""
+    os.environ["TESTSPRITE_LEGACY_WAITS"] = "1"
+    try:
+        before = await run_suite(names, concurrency, latency_ms)
+    finally:
+        del os.environ["TESTSPRITE_LEGACY_WAITS"]
+    after = await run_suite(names, concurrency, latency_ms)
+    return before, after
+
+
+def plan_shards(names, durations, count):
+    """Split ``names`` into ``count`` shards of similar total duration (longest processing time first).
+
+    Returns ``(names, estimated seconds)`` per shard; the same inputs always give the same plan,
+    so every CI box computes identical shards.
+    """
+    fallback = statistics.median(durations.values()) if durations else DEFAULT_DURATION_S
+    estimate = {name: durations.get(results.test_id(name), fallback) for name in names}
+    shards = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for name in sorted(names, key=lambda name: (-estimate[name], name)):
+        index = min(range(count), key=lambda i: (loads[i], i))
+        shards[index].append(name)
+        loads[index] += estimate[name]
+    return [(sorted(shard), load) for shard, load in zip(shards, loads)]
+
+
+def parse_shard(text):
+    """``2/3`` -> (2, 3)."""
+    index, sep, count = text.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        index = count = 0
+    if not sep or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"expected K/N with 1 <= K <= N, got {text!r}")
+    return index, count
+
+
+def save_outcomes(outcomes, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([asdict(outcome) for outcome in outcomes], indent=2) + "\n")
+
+
+def load_outcomes(path):
+    return [TestOutcome(**outcome) for outcome in json.loads(pathlib.Path(path).read_text())]
+
+
+def record_outcomes(outcomes):
+    """Fold ``outcomes`` into ``tmp/test_results.json`` and re-render ``tmp/raw_report.md``."""
+    records = results.merge([asdict(outcome) for outcome in outcomes], results.load_records())
+    results.save_records(records)
+    results.write_report(records)
+
+
+def worker_args(args):
+    """The flags a shard process inherits from this run."""
+    forwarded = ["-c", str(args.concurrency)]
+    if args.offline:
+        forwarded += ["--offline", "--latency", str(args.latency)]
+    if args.perf:
+        forwarded.append("--perf")
+    return forwarded
+
+
+async def run_shards(plan, args):
+    """Run every shard of ``plan`` in its own runner process; returns all outcomes."""
+    async def run_shard(index, names):
+        path = SHARDS_DIR / f"shard-{index}-of-{len(plan)}.json"
+        path.unlink(missing_ok=True)
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(HERE / "runner.py"), *worker_args(args), "--outcomes", str(path), *names,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        output, _ = await process.communicate()
+        if path.exists():
+            return load_outcomes(path)
+        # The worker died before writing its outcomes; count its tests as failed
+        last_line = (output.decode(errors="replace").strip().splitlines() or [""])[-1]
+        return [TestOutcome(name, "FAILED", 0.0, f"shard {index} exited with {process.returncode}: {last_line}")
+                for name in names]
+
+    shards = await asyncio.gather(*(run_shard(index, names) for index, (names, _) in enumerate(plan, 1) if names))
+    return sorted((outcome for shard in shards for outcome in shard), key=lambda outcome: outcome.name)
+
+
+def print_plan(plan):
+    for index, (names, load) in enumerate(plan, 1):
+        tests = " ".join(results.test_id(name) or name for name in names) or "(empty)"
+        print(f"shard {index}/{len(plan)}  ~{load:6.1f}s  {tests}")
+    print()
+
+
+def print_summary(outcomes, wall_time=None):
+    if not outcomes:
+        print("No tests ran.")
+        return
+    width = max(len(outcome.name) for outcome in outcomes)
+    for outcome in outcomes:
+        print(f"{outcome.name:<{width}}  {outcome.status:<6}  {outcome.duration:7.1f}s")
+        if outcome.error:
+            print(f"{'':<{width}}  {outcome.error.splitlines()[0]}")
+    passed = sum(outcome.status == "PASSED" for outcome in outcomes)
+    serial = sum(outcome.duration for outcome in outcomes)
+    if wall_time is None:
+        print(f"\n{passed}/{len(outcomes)} passed ({serial:.1f}s of test time)")
+    else:
+        print(f"\n{passed}/{len(outcomes)} passed in {wall_time:.1f}s wall ({serial:.1f}s of test time)")
+
+
+def print_comparison(before, after):
+    width = max(len(outcome.name) for outcome in before)
+    print(f"{'test':<{width}}  {'sleeps':>8}  {'events':>8}  {'saved':>8}")
+    for old, new in zip(before, after):
+        status = "" if old.status == new.status else f"  ({old.status} -> {new.status})"
+        print(f"{old.name:<{width}}  {old.duration:7.1f}s  {new.duration:7.1f}s  "
+              f"{old.duration - new.duration:7.1f}s{status}")
+    total_before = sum(outcome.duration for outcome in before)
+    total_after = sum(outcome.duration for outcome in after)
+    print(f"{'total':<{width}}  {total_before:7.1f}s  {total_after:7.1f}s  {total_before - total_after:7.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tests", nargs="*", help="test id prefixes to run, e.g. TC003 (default: all)")
+    parser.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"maximum tests running at once (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--compare", action="store_true",
+                        help="run twice, with the old fixed sleeps and with event-driven waits, and report both")
+    parser.add_argument("--offline", action="store_true",
+                        help="serve every backend from the seeded local stand-in (stand_in.py)")
+    parser.add_argument("--latency", type=int, default=DEFAULT_LATENCY_MS,
+                        help=f"stand-in response delay in ms with --offline (default: {DEFAULT_LATENCY_MS})")
+    parser.add_argument("--perf", action="store_true",
+                        help="record a performance timeline per test in tmp/perf (compare with perf.py compare)")
+    sharding = parser.add_mutually_exclusive_group()
+    sharding.add_argument("--shards", type=int, metavar="N",
+                          help="split the tests into N duration-balanced shards, run each in its own process "
+                               "and merge the results into tmp/test_results.json and tmp/raw_report.md")
+    sharding.add_argument("--shard", type=parse_shard, metavar="K/N",
+                          help="run only shard K of N; its outcomes go to tmp/shards/ for --merge")
+    sharding.add_argument("--merge", nargs="+", type=pathlib.Path, metavar="OUTCOMES",
+                          help="merge shard outcome files into tmp/test_results.json and tmp/raw_report.md")
+    parser.add_argument("--outcomes", type=pathlib.Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.merge:
+        outcomes = sorted((outcome for path in args.merge for outcome in load_outcomes(path)),
+                          key=lambda outcome: outcome.name)
+        record_outcomes(outcomes)
+        print_summary(outcomes)
+        return 0 if all(outcome.status == "PASSED" for outcome in outcomes) else 1
+
+    names = discover(args.tests)
+    latency_ms = args.latency if args.offline else None
+    if args.compare and (args.shards or args.shard):
+        parser.error("--compare cannot be combined with sharding")
+    if args.shards is not None and args.shards < 1:
+        parser.error("--shards must be at least 1")
+
+    if args.shards or args.shard:
+        count = args.shards or args.shard[1]
+        plan = plan_shards(names, results.durations(results.load_records()), count)
+        print_plan(plan)
+    if args.shards:
+        started = time.perf_counter()
+        outcomes = asyncio.run(run_shards(plan, args))
+        record_outcomes(outcomes)
+        print_summary(outcomes, time.perf_counter() - started)
+        return 0 if all(outcome.status == "PASSED" for outcome in outcomes) else 1
+    if args.shard:
+        index, count = args.shard
+        names = plan[index - 1][0]
+        args.outcomes = args.outcomes or SHARDS_DIR / f"shard-{index}-of-{count}.json"
+        if not names:
+            save_outcomes([], args.outcomes)
+            print("Nothing to run in this shard.")
+            return 0
+
+    if args.compare:
+        before, after = asyncio.run(compare_waits(names, args.concurrency, latency_ms))
+        print_comparison(before, after)
+        return 0 if all(outcome.status == "PASSED" for outcome in after) else 1
+
+    started = time.perf_counter()
+    outcomes = asyncio.run(run_suite(names, args.concurrency, latency_ms, args.perf))
+    if args.outcomes:
+        save_outcomes(outcomes, args.outcomes)
+    print_summary(outcomes, time.perf_counter() - started)
+    return 0 if all(outcome.status == "PASSED" for outcome in outcomes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
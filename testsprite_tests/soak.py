@@ -0,0 +1,350 @@
+"""Soak the Admin dashboard and look for a JS heap leak.
+
+A dashboard left open for a whole shift is where browsers slow down, so this
+keeps one signed-in ``/admin`` page open and repeats a cycle of what an
+operator does all day:
+
+* switch to Question Analysis and back to Candidate Results;
+* open the first answer sheet and close it again;
+* drop the analytics WebSocket, as a server restart would, and
+  wait for the app to reconnect.
+
+The dashboard itself has no analytics socket; the site footer does.  So a
+``/`` page stays open next to it in the same context, and its tab owns the
+``public-analytics`` socket that every cycle drops.  The run stops at once if
+that socket never opens, and fails if a cycle's drop is not reconnected.
+
+After every cycle it forces a garbage collection and samples both pages'
+heaps over CDP (``JSHeapUsedSize``, DOM nodes, event listeners).  The first
+``--warmup`` cycles fill caches and are not judged; over the rest, the run
+fails when the least-squares slope of the two heaps together exceeds
+``--max-growth-kb`` per cycle and they grew by more than ``--min-growth-mb``
+overall.  Heap snapshots are of the dashboard page.
+
+Unless ``--no-snapshots`` is given, a heap snapshot is taken at every cycle
+boundary and the cycle that grew the heap most is kept: its before/after
+``.heapsnapshot`` files (open them in DevTools, Memory tab, Comparison view)
+and ``heap_diff.json``, the per-constructor count and size change.  Samples
+go to ``tmp/soak/soak.json``.
+
+    python testsprite_tests/soak.py --offline --cycles 30
+    python testsprite_tests/soak.py --cycles 200 --max-growth-kb 128
+
+The signed-in account (``tmp/config.json``) must be an admin.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import pathlib
+import re
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+from playwright import async_api
+
+HERE = pathlib.Path(__file__).resolve().parent
+if str(HERE) not in sys.path:
+    sys.path.insert(0, str(HERE))
+
+import stand_in  # noqa: E402
+from browser import context_options, launch_browser, new_context  # noqa: E402
+from stand_in import DEFAULT_LATENCY_MS, serving  # noqa: E402
+from waits import click, open_page, settle  # noqa: E402
+
+SOAK_DIR = HERE / "tmp" / "soak"
+
+DEFAULT_CYCLES = 30
+DEFAULT_WARMUP = 3
+DEFAULT_MAX_GROWTH_KB = 256
+DEFAULT_MIN_GROWTH_MB = 2.0
+
+# How long the app gets to open the analytics socket, and to reconnect it after a forced drop
+RECONNECT_TIMEOUT_S = 15
+
+# A page that renders EnhancedFooter, and so holds the analytics socket
+FOOTER_PATH = "/"
+
+ANALYTICS_SOCKET = re.compile(r"/functions/v1/public-analytics")
+
+# Constructors listed in the printed heap diff
+DIFF_TOP = 15
+
+
+@dataclass
+class Sample:
+    cycle: int
+    seconds: float
+    heap_used_mb: float
+    dom_nodes: int
+    listeners: int
+    footer_heap_mb: float
+    reconnected: bool
+
+
+class AnalyticsSockets:
+    """Routes the analytics WebSocket so the soak can drop it at will.
+
+    Offline, the stand-in feeds the page; otherwise each socket is proxied to
+    the real server.
+    """
+
+    def __init__(self):
+        self.open = []
+        self.opened = 0
+        self.connected = asyncio.Event()
+
+    async def attach(self, context):
+        await context.route_web_socket(ANALYTICS_SOCKET, self._handle)
+
+    def _handle(self, ws):
+        backend = stand_in.active()
+        if backend is not None:
+            backend.bridge_websocket(ws)
+            self.open.append((ws, None))
+        else:
+            self.open.append((ws, ws.connect_to_server()))
+        self.opened += 1
+        self.connected.set()
+
+    async def wait_open(self, timeout=RECONNECT_TIMEOUT_S):
+        """True once the app has opened an analytics socket."""
+        try:
+            await asyncio.wait_for(self.connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def drop(self, timeout=RECONNECT_TIMEOUT_S):
+        """Close every analytics socket on both sides; True once the app has opened a new one."""
+        self.connected.clear()
+        sockets, self.open = self.open, []
+        for ws, server in sockets:
+            # Sockets the app already closed itself raise here
+            with contextlib.suppress(async_api.Error):
+                await ws.close(code=1012, reason="soak: forced disconnect")
+            if server is not None:
+                with contextlib.suppress(async_api.Error):
+                    await server.close()
+        return await self.wait_open(timeout)
+
+
+class Heap:
+    """CDP access to one page's heap."""
+
+    def __init__(self, session):
+        self.session = session
+
+    @classmethod
+    async def open(cls, page):
+        session = await page.context.new_cdp_session(page)
+        await session.send("Performance.enable")
+        await session.send("HeapProfiler.enable")
+        return cls(session)
+
+    async def sample(self):
+        """Collect garbage, then return (heap MB, DOM nodes, event listeners)."""
+        await self.session.send("HeapProfiler.collectGarbage")
+        result = await self.session.send("Performance.getMetrics")
+        values = {metric["name"]: metric["value"] for metric in result["metrics"]}
+        return (round(values.get("JSHeapUsedSize", 0) / 2 ** 20, 3), int(values.get("Nodes", 0)),
+                int(values.get("JSEventListeners", 0)))
+
+    async def snapshot(self):
+        """A full heap snapshot, as the JSON text DevTools saves."""
+        chunks = []
+
+        def collect(params):
+            chunks.append(params["chunk"])
+
+        self.session.on("HeapProfiler.addHeapSnapshotChunk", collect)
+        try:
+            await self.session.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+        finally:
+            self.session.remove_listener("HeapProfiler.addHeapSnapshotChunk", collect)
+        return "".join(chunks)
+
+
+def summarize(snapshot_text):
+    """Per-constructor (count, self size) of a heap snapshot, grouped as DevTools' Summary view does."""
+    snapshot = json.loads(snapshot_text)
+    meta = snapshot["snapshot"]["meta"]
+    fields = meta["node_fields"]
+    types = meta["node_types"][0]
+    strings = snapshot["strings"]
+    nodes = snapshot["nodes"]
+    width = len(fields)
+    type_at, name_at, size_at = fields.index("type"), fields.index("name"), fields.index("self_size")
+
+    summary = defaultdict(lambda: [0, 0])
+    for offset in range(0, len(nodes), width):
+        kind = types[nodes[offset + type_at]]
+        if kind in ("object", "native"):
+            key = strings[nodes[offset + name_at]]
+        else:
+            key = f"({kind})"
+        entry = summary[key]
+        entry[0] += 1
+        entry[1] += nodes[offset + size_at]
+    return dict(summary)
+
+
+def diff_summaries(before, after):
+    """Constructors whose retained count or size changed, largest size growth first."""
+    rows = []
+    for key in before.keys() | after.keys():
+        old_count, old_size = before.get(key, (0, 0))
+        new_count, new_size = after.get(key, (0, 0))
+        if (old_count, old_size) != (new_count, new_size):
+            rows.append({"constructor": key, "count_delta": new_count - old_count,
+                         "size_delta": new_size - old_size, "count": new_count, "size": new_size})
+    return sorted(rows, key=lambda row: row["size_delta"], reverse=True)
+
+
+def slope(values):
+    """Least-squares slope of ``values`` against their index."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x, mean_y = (n - 1) / 2, sum(values) / n
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(n))
+    return numerator / denominator
+
+
+async def cycle(page, sockets):
+    """One round of what an operator does on the dashboard; returns whether the socket came back."""
+    await click(page.get_by_role("button", name="Question Analysis"))
+    await settle(page)
+    await click(page.get_by_role("button", name="Candidate Results"))
+    await settle(page)
+
+    await click(page.locator('[aria-label^="View answer sheet"]').first)
+    report = page.get_by_text("Candidate Assessment Report")
+    await report.wait_for(state="visible")
+    await page.keyboard.press("Escape")
+    await report.wait_for(state="hidden")
+
+    return await sockets.drop()
+
+
+@dataclass
+class Worst:
+    cycle: int = 0
+    growth_mb: float = float("-inf")
+
+
+async def soak(args):
+    SOAK_DIR.mkdir(parents=True, exist_ok=True)
+    backend = serving(latency_ms=args.latency) if args.offline else contextlib.nullcontext()
+    samples = []
+    worst = Worst()
+
+    async with backend, async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, single_process=False)
+        try:
+            context = await new_context(browser, **await context_options(browser, authenticated=True))
+            sockets = AnalyticsSockets()
+            await sockets.attach(context)
+            footer = await context.new_page()
+            await open_page(footer, FOOTER_PATH)
+            if not await sockets.wait_open():
+                raise SystemExit(f"{FOOTER_PATH} never opened the public-analytics socket; nothing to soak")
+            page = await context.new_page()
+            await open_page(page, "/admin")
+            await page.locator('[aria-label^="View answer sheet"]').first.wait_for(state="visible", timeout=30000)
+
+            heap, footer_heap = await Heap.open(page), await Heap.open(footer)
+            started = time.perf_counter()
+            previous_mb = (await heap.sample())[0] + (await footer_heap.sample())[0]
+            previous_snapshot = None if args.no_snapshots else await heap.snapshot()
+
+            for number in range(1, args.cycles + 1):
+                reconnected = await cycle(page, sockets)
+                heap_mb, nodes, listeners = await heap.sample()
+                footer_mb = (await footer_heap.sample())[0]
+                sample = Sample(number, round(time.perf_counter() - started, 1), heap_mb, nodes, listeners,
+                                footer_mb, reconnected)
+                samples.append(sample)
+                growth = heap_mb + footer_mb - previous_mb
+                print(f"cycle {number:>4}  {heap_mb:8.2f} MB  footer {footer_mb:6.2f} MB  {growth:+7.2f}  "
+                      f"nodes {nodes:>6}  listeners {listeners:>5}"
+                      f"{'' if reconnected else '  socket did not reconnect'}")
+
+                if previous_snapshot is not None:
+                    current_snapshot = await heap.snapshot()
+                    if number > args.warmup and growth > worst.growth_mb:
+                        worst = Worst(number, growth)
+                        (SOAK_DIR / "worst-before.heapsnapshot").write_text(previous_snapshot)
+                        (SOAK_DIR / "worst-after.heapsnapshot").write_text(current_snapshot)
+                        diff = diff_summaries(summarize(previous_snapshot), summarize(current_snapshot))
+                        (SOAK_DIR / "heap_diff.json").write_text(json.dumps(
+                            {"cycle": number, "growth_mb": round(growth, 3), "constructors": diff}, indent=2) + "\n")
+                    previous_snapshot = current_snapshot
+                previous_mb = heap_mb + footer_mb
+        finally:
+            await browser.close()
+
+    return samples, worst
+
+
+def verdict(samples, args):
+    """(passed, message) for the post-warmup heap trend and the socket reconnects."""
+    lost = [sample.cycle for sample in samples if not sample.reconnected]
+    judged = [sample.heap_used_mb + sample.footer_heap_mb for sample in samples[args.warmup:]]
+    if len(judged) < 2:
+        message = "too few cycles after warm-up to judge"
+    else:
+        per_cycle_kb = slope(judged) * 1024
+        total_mb = judged[-1] - judged[0]
+        message = (f"heap {judged[0]:.2f} -> {judged[-1]:.2f} MB over {len(judged)} cycles "
+                   f"({total_mb:+.2f} MB, trend {per_cycle_kb:+.0f} KB/cycle)")
+        if per_cycle_kb > args.max_growth_kb and total_mb > args.min_growth_mb:
+            return False, message
+    if lost:
+        return False, f"{message}; the analytics socket did not reconnect after cycle(s) {lost}"
+    return True, message
+
+
+def print_worst(worst):
+    path = SOAK_DIR / "heap_diff.json"
+    if worst.cycle == 0 or not path.exists():
+        return
+    diff = json.loads(path.read_text())["constructors"][:DIFF_TOP]
+    print(f"\nLargest growth in cycle {worst.cycle} ({worst.growth_mb:+.2f} MB); top constructors:")
+    for row in diff:
+        print(f"  {row['size_delta'] / 1024:+9.1f} KB  {row['count_delta']:+7d}  {row['constructor'][:80]}")
+    print(f"Snapshots: {SOAK_DIR.relative_to(HERE)}/worst-before.heapsnapshot, worst-after.heapsnapshot")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--cycles", type=int, default=DEFAULT_CYCLES,
+                        help=f"cycles to run (default: {DEFAULT_CYCLES})")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help=f"leading cycles not judged (default: {DEFAULT_WARMUP})")
+    parser.add_argument("--max-growth-kb", type=float, default=DEFAULT_MAX_GROWTH_KB,
+                        help=f"allowed heap trend per cycle in KB (default: {DEFAULT_MAX_GROWTH_KB})")
+    parser.add_argument("--min-growth-mb", type=float, default=DEFAULT_MIN_GROWTH_MB,
+                        help=f"total growth below which the run passes anyway (default: {DEFAULT_MIN_GROWTH_MB})")
+    parser.add_argument("--no-snapshots", action="store_true",
+                        help="skip the per-cycle heap snapshots (faster, but no heap diff)")
+    parser.add_argument("--offline", action="store_true", help="run against a fresh local stand-in backend")
+    parser.add_argument("--latency", type=int, default=DEFAULT_LATENCY_MS,
+                        help=f"stand-in delay per HTTP response in ms (default: {DEFAULT_LATENCY_MS})")
+    args = parser.parse_args(argv)
+
+    samples, worst = asyncio.run(soak(args))
+    passed, message = verdict(samples, args)
+    (SOAK_DIR / "soak.json").write_text(json.dumps({
+        "passed": passed, "summary": message, "samples": [asdict(sample) for sample in samples],
+    }, indent=2) + "\n")
+    print(f"\n{'PASSED' if passed else 'FAILED'}: {message}")
+    print_worst(worst)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
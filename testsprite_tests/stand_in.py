@@ -0,0 +1,992 @@
+"""In-process stand-in for the app's backends, for hermetic offline runs.
+
+The app talks to three hosts: the Supabase project (PostgREST under
+``/rest/v1``, GoTrue under ``/auth/v1``, edge functions under
+``/functions/v1``), the hard-coded analytics functions in ``Analytics.tsx`` and
+``EnhaceFooter.tsx``, and the employee-id login API used by ``useAuth``
+(``/api/Auth``).  ``StandIn`` serves all of them from one asyncio HTTP +
+WebSocket server seeded from ``fixtures/supabase_seed.json``:
+
+* the PostgREST subset the app uses: select (with ``*``, column lists and
+  one-level embeds such as ``profiles(email, full_name)``), insert, upsert,
+  update and delete, filtered with ``eq``/``neq``/``gt``/``gte``/``lt``/
+  ``lte``/``in``/``is``/``ilike`` and shaped with ``order``/``limit``/
+  ``offset``, ``Prefer: return=representation`` and the single-object
+  ``Accept`` header;
+* password sign-in for both GoTrue and ``/api/Auth``, issuing JWT-shaped
+  tokens with an ``exp`` claim so ``auth_state.py`` can cache them;
+* ``track-pageview`` (single or batched views), ``fetch-admin-data``,
+  ``export-attempts`` and the ``public-analytics`` WebSocket, which pushes an
+  ``initial`` snapshot and then delta ``metrics_update`` messages.
+
+Every HTTP response is delayed by a fixed ``latency_ms`` so timings are
+repeatable.  ``runner.py --offline`` (or ``TESTSPRITE_OFFLINE=1`` for a single
+script) starts the stand-in and routes each context's matching requests to it,
+whatever host the build points at.  It can also be served on its own:
+
+    python testsprite_tests/stand_in.py --port 54321
+"""
+import argparse
+import asyncio
+import base64
+import contextlib
+import copy
+import hashlib
+import json
+import os
+import pathlib
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+HERE = pathlib.Path(__file__).resolve().parent
+SEED_PATH = HERE / "fixtures" / "supabase_seed.json"
+
+# Set to "1" to run a standalone script against the stand-in
+OFFLINE_ENV = "TESTSPRITE_OFFLINE"
+
+# Fixed delay added to every HTTP response
+DEFAULT_LATENCY_MS = 25
+
+# Lifetime of the tokens the stand-in issues
+TOKEN_TTL_SECONDS = 60 * 60
+
+# Request paths served by the stand-in; everything else goes to the dev server
+ROUTED_PATHS = ("/rest/v1/", "/auth/v1/", "/functions/v1/", "/api/Auth/")
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Query parameters that shape a PostgREST request rather than filter it
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+REASONS = {
+    200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 401: "Unauthorized",
+    404: "Not Found", 405: "Method Not Allowed", 406: "Not Acceptable", 409: "Conflict",
+    422: "Unprocessable Entity",
+}
+
+KOLKATA = timezone(timedelta(hours=5, minutes=30), "Asia/Kolkata")
+
+# Column headings of the Admin "Download Excel" CSV
+EXPORT_COLUMNS = (
+    "Name", "Employee ID", "Email", "First Name", "Last Name", "Phone Number", "Gender", "State", "City",
+    "Process Allocated", "Designation", "Father Name", "Address", "Qualification", "Date of Birth", "Score",
+    "Percentage", "Status", "Date",
+)
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PATCH, PUT, DELETE, OPTIONS",
+    "Access-Control-Expose-Headers": "Content-Range, Content-Disposition, X-Total-Count",
+}
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    params: list
+    headers: dict
+    body: bytes = b""
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+    def prefer(self):
+        return {item.strip() for item in self.headers.get("prefer", "").split(",") if item.strip()}
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: object = None
+    headers: dict = field(default_factory=dict)
+
+    def encode(self):
+        if isinstance(self.body, bytes):
+            payload = self.body
+        else:
+            payload = b"" if self.body is None else json.dumps(self.body).encode()
+        headers = {**CORS_HEADERS, **self.headers, "Content-Length": str(len(payload))}
+        if payload:
+            headers.setdefault("Content-Type", "application/json; charset=utf-8")
+        lines = [f"HTTP/1.1 {self.status} {REASONS.get(self.status, 'OK')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+def error(status, message, code=None):
+    return Response(status, {"code": code, "message": message, "details": None, "hint": None})
+
+
+class PostgrestError(Exception):
+    def __init__(self, status, message, code=None):
+        super().__init__(message)
+        self.response = error(status, message, code)
+
+
+# --------------------------------------------------------------------------- tokens
+
+def _b64(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def issue_token(user, ttl=TOKEN_TTL_SECONDS):
+    """Return a JWT-shaped token for ``user`` with an ``exp`` claim (the signature is not checked)."""
+    issued = int(time.time())
+    claims = {"sub": user["id"], "email": user["email"], "role": "authenticated",
+              "iat": issued, "exp": issued + ttl}
+    return f"{_b64({'alg': 'HS256', 'typ': 'JWT'})}.{_b64(claims)}.stand-in"
+
+
+def token_claims(token):
+    parts = (token or "").split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+    except ValueError:
+        return None
+    return claims if claims.get("exp", 0) > time.time() else None
+
+
+# --------------------------------------------------------------------------- PostgREST
+
+def _split_top_level(text):
+    """Split ``text`` on commas that are not inside parentheses."""
+    items, depth, current = [], 0, ""
+    for char in text:
+        if char == "," and depth == 0:
+            items.append(current)
+            current = ""
+            continue
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        current += char
+    items.append(current)
+    return [item.strip() for item in items if item.strip()]
+
+
+def parse_select(select):
+    """Return ``(columns, embeds)`` for a PostgREST ``select`` expression."""
+    columns, embeds = [], {}
+    for item in _split_top_level(select or "*"):
+        match = re.fullmatch(r"(?:(\w+):)?([\w]+)(?:![\w]+)?\((.*)\)", item, re.S)
+        if match:
+            alias, table, inner = match.groups()
+            embeds[alias or table] = (table, inner)
+        else:
+            columns.append(item)
+    return columns, embeds
+
+
+def _text(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _ordered(left, right):
+    try:
+        return float(left), float(right)
+    except (TypeError, ValueError):
+        return _text(left), right
+
+
+def _list_values(operand):
+    return [value.strip().strip('"') for value in operand.strip("()").split(",") if value.strip()]
+
+
+def matches(row, column, expression):
+    """True when ``row[column]`` satisfies a PostgREST filter such as ``eq.5`` or ``in.(a,b)``."""
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+    operator, _, operand = expression.partition(".")
+    value = row.get(column)
+    if operator == "eq":
+        result = _text(value) == operand
+    elif operator == "neq":
+        result = _text(value) != operand
+    elif operator == "in":
+        result = _text(value) in _list_values(operand)
+    elif operator == "is":
+        result = _text(value) == operand.lower()
+    elif operator in ("like", "ilike"):
+        pattern = re.escape(operand).replace(r"\*", ".*").replace("%", ".*")
+        flags = re.I if operator == "ilike" else 0
+        result = value is not None and re.fullmatch(pattern, _text(value), flags) is not None
+    elif operator in ("gt", "gte", "lt", "lte"):
+        if value is None:
+            return False
+        left, right = _ordered(value, operand)
+        result = {"gt": left > right, "gte": left >= right, "lt": left < right, "lte": left <= right}[operator]
+    else:
+        raise PostgrestError(400, f"unsupported operator: {operator}", "PGRST100")
+    return result != negate
+
+
+def _sort(rows, order):
+    for term in reversed(order.split(",")):
+        column, *modifiers = term.split(".")
+        descending = "desc" in modifiers
+        nulls_first = "nullsfirst" in modifiers or ("nullslast" not in modifiers and descending)
+        present = [row for row in rows if row.get(column) is not None]
+        missing = [row for row in rows if row.get(column) is None]
+        present.sort(key=lambda row: _ordered(row[column], row[column])[0], reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+class Store:
+    """The seeded tables and the users that can sign in."""
+
+    # Embeds resolve through the column both tables share (``user_id`` unless listed)
+    EMBED_KEYS = {}
+
+    # Read-only tables the real database maintains with triggers, computed on read
+    DERIVED = {"attempt_rollup_daily": "_attempt_rollup", "admin_attempt_rows": "_admin_attempt_rows"}
+
+    # Columns filled in on insert when the client omits them
+    DEFAULTS = {
+        "test_attempts": {"started_at": now_iso, "completed_at": now_iso},
+        "profiles": {"created_at": now_iso, "updated_at": now_iso},
+        "user_details": {"created_at": now_iso, "updated_at": now_iso},
+    }
+
+    # RPCs that act as auth.uid(): called with the bearer token's user id as well
+    CALLER_FUNCTIONS = {"begin_assessment"}
+
+    # The limits begin_assessment() and the attempt trigger enforce
+    MAX_OPEN_SESSIONS = 3
+    DEFAULT_DURATION_MINUTES = 20
+    DEADLINE_GRACE = timedelta(minutes=2)
+    OUTBOX_WINDOW = timedelta(hours=24)
+
+    def __init__(self, seed):
+        seed = copy.deepcopy(seed)
+        self.users = seed.pop("users", [])
+        self.analytics = seed.pop("analytics", {})
+        self.tables = {name: rows for name, rows in seed.items() if isinstance(rows, list)}
+        self.functions = {
+            "has_role": self._has_role,
+            "admin_list_attempts": self._admin_list_attempts,
+            "admin_count_attempts": self._admin_count_attempts,
+            "admin_attempt_rollup": self._admin_attempt_rollup,
+            "search_candidates": self._search_candidates,
+            "begin_assessment": self._begin_assessment,
+        }
+
+    @classmethod
+    def from_file(cls, path=SEED_PATH):
+        return cls(json.loads(pathlib.Path(path).read_text()))
+
+    def table(self, name):
+        if name in self.DERIVED:
+            return getattr(self, self.DERIVED[name])()
+        if name not in self.tables:
+            raise PostgrestError(404, f'relation "public.{name}" does not exist', "42P01")
+        return self.tables[name]
+
+    def find_user(self, login):
+        login = (login or "").strip().lower()
+        for user in self.users:
+            if login in (user["email"].lower(), user["emp_id"].lower()):
+                return user
+        return None
+
+    def user_by_id(self, user_id):
+        return next((user for user in self.users if user["id"] == user_id), None)
+
+    def add_user(self, email, password, full_name, emp_id, role="User"):
+        user = {"id": str(uuid.uuid4()), "email": email, "emp_id": emp_id, "full_name": full_name,
+                "password": password, "role": role}
+        self.users.append(user)
+        self.insert("profiles", [{"user_id": user["id"], "email": email, "full_name": full_name,
+                                  "emp_id": emp_id}])
+        return user
+
+    def add_session(self, user_id, attempt_id, started, minutes=DEFAULT_DURATION_MINUTES):
+        """Record a paper's session as ``begin_assessment()`` would; tests use it to backdate one."""
+        session = {"user_id": user_id, "client_attempt_id": attempt_id, "started_at": started.isoformat(),
+                   "deadline": (started + timedelta(minutes=minutes)).isoformat()}
+        self.tables.setdefault("assessment_sessions", []).append(session)
+        return session
+
+    def _has_role(self, args):
+        user = self.user_by_id(args.get("_user_id"))
+        return bool(user) and user.get("role", "").lower() == str(args.get("_role", "")).lower()
+
+    def _admin_attempt_rows(self):
+        """The ``admin_attempt_rows`` view: attempts with profile and details columns."""
+        profiles = {row["user_id"]: row for row in self.tables.get("profiles", [])}
+        details = {row["user_id"]: row for row in self.tables.get("user_details", [])}
+        rows = []
+        for attempt in self.tables.get("test_attempts", []):
+            profile = profiles.get(attempt["user_id"], {})
+            detail = details.get(attempt["user_id"], {})
+            rows.append({
+                **{key: attempt.get(key) for key in (
+                    "id", "user_id", "score", "total_questions", "percentage", "qualified", "answers",
+                    "completed_at")},
+                **{key: profile.get(key) for key in ("email", "full_name", "emp_id")},
+                "details_id": detail.get("id"),
+                **{key: detail.get(key) for key in (
+                    "first_name", "last_name", "phone_number", "gender", "state", "city", "designation",
+                    "father_name", "address", "qualification", "date_of_birth")},
+                "process_allocated": detail.get("product_process"),
+            })
+        return rows
+
+    def _attempt_rollup(self):
+        """``attempt_rollup_daily`` as its triggers would leave it (days in Asia/Kolkata)."""
+        details = {row["user_id"]: row for row in self.tables.get("user_details", [])}
+        buckets = {}
+        for attempt in self.tables.get("test_attempts", []):
+            detail = details.get(attempt["user_id"], {})
+            completed = datetime.fromisoformat(attempt["completed_at"].replace("Z", "+00:00"))
+            key = ((completed.astimezone(KOLKATA)).date().isoformat(),
+                   *((detail.get(column) or "").strip() or "Unknown"
+                     for column in ("state", "city", "product_process")))
+            bucket = buckets.setdefault(key, {"attempts": 0, "qualified": 0, "percentage_sum": 0})
+            bucket["attempts"] += 1
+            bucket["qualified"] += bool(attempt["qualified"])
+            bucket["percentage_sum"] += attempt["percentage"]
+        return [{"day": day, "state": state, "city": city, "process_allocated": process, **bucket}
+                for (day, state, city, process), bucket in sorted(buckets.items())]
+
+    def _admin_attempt_rollup(self, args):
+        """``admin_attempt_rollup()``: the rollup summed per value of one dimension, largest first."""
+        dimension = args.get("_dimension")
+        if dimension not in ("state", "city", "process_allocated"):
+            raise PostgrestError(400, f"unknown rollup dimension: {dimension}", "22023")
+        totals = {}
+        for bucket in self._attempt_rollup():
+            total = totals.setdefault(bucket[dimension], {"attempts": 0, "qualified": 0, "percentage_sum": 0})
+            for key in total:
+                total[key] += bucket[key]
+        rows = sorted(({"name": name, **total} for name, total in totals.items()),
+                      key=lambda row: (-row["attempts"], row["name"]))
+        return rows[:min(max(int(args.get("_limit") or 15), 1), 100)]
+
+    def _candidate_user_ids(self, search):
+        search = (search or "").strip().lower()
+        matched = {row["user_id"] for row in self.tables.get("profiles", [])
+                   if any(search in (row.get(key) or "").lower() for key in ("full_name", "email", "emp_id"))}
+        matched |= {row["user_id"] for row in self.tables.get("user_details", [])
+                    if search in (row.get("phone_number") or "")}
+        return matched
+
+    def _search_candidates(self, args):
+        if not (args.get("_search") or "").strip():
+            return []
+        matched = self._candidate_user_ids(args["_search"])
+        phones = {row["user_id"]: row.get("phone_number") for row in self.tables.get("user_details", [])}
+        rows = [{"user_id": row["user_id"], "full_name": row.get("full_name"), "email": row.get("email"),
+                 "emp_id": row.get("emp_id"), "phone_number": phones.get(row["user_id"])}
+                for row in self.tables.get("profiles", []) if row["user_id"] in matched]
+        rows.sort(key=lambda row: (row["full_name"] or "", row["user_id"]))
+        return rows[:min(max(int(args.get("_limit") or 20), 1), 100)]
+
+    def _admin_attempts(self, status, search):
+        """Attempts shaped like ``admin_list_attempts`` rows, filtered like the SQL version."""
+        profiles = {row["user_id"]: row for row in self.tables.get("profiles", [])}
+        details = {row["user_id"]: row for row in self.tables.get("user_details", [])}
+        matched = self._candidate_user_ids(search) if (search or "").strip() else None
+        for attempt in self.table("test_attempts"):
+            if status == "qualified" and not attempt["qualified"]:
+                continue
+            if status == "not_qualified" and attempt["qualified"]:
+                continue
+            if matched is not None and attempt["user_id"] not in matched:
+                continue
+            profile = profiles.get(attempt["user_id"], {})
+            detail = details.get(attempt["user_id"])
+            yield {**attempt,
+                   "profiles": {key: profile.get(key) for key in ("email", "full_name", "emp_id")},
+                   "userDetails": detail and {**detail, "process_allocated": detail.get("product_process")}}
+
+    def _admin_list_attempts(self, args):
+        rows = sorted(self._admin_attempts(args.get("_status", "all"), args.get("_search")),
+                      key=lambda row: (row["completed_at"], row["id"]), reverse=True)
+        limit = min(max(int(args.get("_limit") or 10), 1), 100)
+        cursor = (args.get("_cursor_completed_at"), args.get("_cursor_id"))
+        if args.get("_direction") == "prev":
+            if cursor[0]:
+                rows = [row for row in rows if (row["completed_at"], row["id"]) > cursor]
+            return rows[-limit:]
+        if cursor[0]:
+            rows = [row for row in rows if (row["completed_at"], row["id"]) < cursor]
+        return rows[:limit]
+
+    def _admin_count_attempts(self, args):
+        return sum(1 for _ in self._admin_attempts(args.get("_status", "all"), args.get("_search")))
+
+    def _begin_assessment(self, args, caller):
+        """The paper's start time and deadline, fixed by the caller's first call for its ``client_attempt_id``."""
+        if caller is None:
+            raise PostgrestError(401, "not signed in", "42501")
+        attempt_id, minutes = args.get("_client_attempt_id"), args.get("_duration_minutes")
+        if not isinstance(minutes, int) or not 1 <= minutes <= 180:
+            raise PostgrestError(400, "duration must be between 1 and 180 minutes", "P0001")
+        sessions = self.tables.setdefault("assessment_sessions", [])
+        session = self._assessment_session(caller, attempt_id)
+        if session is None:
+            started = datetime.now(timezone.utc)
+            open_sessions = sum(1 for row in sessions
+                                if row["user_id"] == caller and datetime.fromisoformat(row["deadline"]) > started)
+            if open_sessions >= self.MAX_OPEN_SESSIONS:
+                raise PostgrestError(400, "too many assessments in progress", "54000")
+            session = self.add_session(caller, attempt_id, started, minutes)
+        return {"started_at": session["started_at"], "deadline": session["deadline"], "server_now": now_iso()}
+
+    def _assessment_session(self, user_id, attempt_id):
+        return next((row for row in self.tables.get("assessment_sessions", [])
+                     if attempt_id is not None and row["user_id"] == user_id
+                     and row["client_attempt_id"] == attempt_id), None)
+
+    def _session_started_at(self, attempt):
+        """The ``test_attempts_session_started_at`` trigger: started_at comes from the paper's session,
+        and an attempt completed after its deadline (plus the grace period) is rejected."""
+        if attempt.get("client_attempt_id") is None:
+            return attempt
+        now = datetime.now(timezone.utc)
+        stamp = attempt.get("completed_at")
+        completed = min(datetime.fromisoformat(stamp.replace("Z", "+00:00")), now) if stamp else now
+        attempt = {**attempt, "completed_at": completed.isoformat()}
+        session = self._assessment_session(attempt.get("user_id"), attempt["client_attempt_id"])
+        if session is not None:
+            attempt["started_at"] = session["started_at"]
+            deadline = datetime.fromisoformat(session["deadline"])
+        else:
+            stamp = attempt.get("started_at")
+            started = datetime.fromisoformat(stamp.replace("Z", "+00:00")) if stamp else now
+            deadline = started + timedelta(minutes=self.DEFAULT_DURATION_MINUTES)
+        if completed > deadline + self.DEADLINE_GRACE or now > deadline + self.OUTBOX_WINDOW:
+            raise PostgrestError(400, f"assessment submitted after its deadline ({deadline.isoformat()})", "22023")
+        return attempt
+
+    # ---- reads
+
+    def _filtered(self, name, params):
+        rows = self.table(name)
+        for column, expression in params:
+            if column not in RESERVED_PARAMS:
+                rows = [row for row in rows if matches(row, column, expression)]
+        return rows
+
+    def _shape(self, name, row, columns, embeds):
+        shaped = dict(row) if "*" in columns or not columns else {}
+        for column in columns:
+            if column != "*":
+                alias, _, source = column.rpartition(":")
+                shaped[alias or source] = row.get(source)
+        for alias, (table, inner) in embeds.items():
+            key = self.EMBED_KEYS.get(table, "user_id")
+            related = [other for other in self.table(table) if other.get(key) == row.get(key)]
+            inner_columns, inner_embeds = parse_select(inner)
+            shaped_related = [self._shape(table, other, inner_columns, inner_embeds) for other in related]
+            shaped[alias] = shaped_related[0] if shaped_related else None
+        return shaped
+
+    def select(self, name, params):
+        query = dict(params)
+        rows = self._filtered(name, params)
+        total = len(rows)
+        if "order" in query:
+            rows = _sort(list(rows), query["order"])
+        offset = int(query.get("offset", 0))
+        limit = int(query["limit"]) if "limit" in query else None
+        rows = rows[offset:offset + limit if limit is not None else None]
+        columns, embeds = parse_select(query.get("select"))
+        return [self._shape(name, row, columns, embeds) for row in rows], offset, total
+
+    # ---- writes
+
+    def insert(self, name, rows, on_conflict=None, ignore_duplicates=False):
+        table = self.table(name)
+        stored = []
+        for row in rows:
+            existing = None
+            if on_conflict:
+                existing = next((other for other in table
+                                 if all(row.get(key) is not None and other.get(key) == row.get(key)
+                                        for key in on_conflict)), None)
+            if existing is not None:
+                # ON CONFLICT DO NOTHING: the row is neither changed nor returned
+                if ignore_duplicates:
+                    continue
+                existing.update(row)
+                stored.append(existing)
+                continue
+            row = {"id": str(uuid.uuid4()), **row}
+            if name == "test_attempts":
+                row = self._session_started_at(row)
+            for column, default in self.DEFAULTS.get(name, {}).items():
+                row.setdefault(column, default())
+            table.append(row)
+            stored.append(row)
+        return stored
+
+    def update(self, name, params, values):
+        rows = self._filtered(name, params)
+        for row in rows:
+            row.update(values)
+        return rows
+
+    def delete(self, name, params):
+        doomed = self._filtered(name, params)
+        ids = {id(row) for row in doomed}
+        self.tables[name] = [row for row in self.table(name) if id(row) not in ids]
+        return doomed
+
+
+# --------------------------------------------------------------------------- analytics
+
+class MetricsHub:
+    """Page-view counters plus the queues of every connected analytics socket."""
+
+    def __init__(self, metrics):
+        self.metrics = {"total_page_views": 0, "total_visitors": 0, "active_page_views": 0, **metrics}
+        self.visitors = set()
+        self.event_ids = set()
+        self._queues = set()
+
+    def message(self, kind, changed=None):
+        """An ``initial`` snapshot, or a ``metrics_update`` with only the ``changed`` counters."""
+        generated_at = now_iso()
+        metrics = self.metrics if changed is None else {name: self.metrics[name] for name in changed}
+        return json.dumps({"type": kind, "data": {"metrics": {**metrics, "generated_at": generated_at},
+                                                  "generated_at": generated_at}})
+
+    def subscribe(self):
+        queue = asyncio.Queue()
+        queue.put_nowait(self.message("initial"))
+        self._queues.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._queues.discard(queue)
+
+    def record(self, events):
+        """Counts a batch of page views; an ``eventId`` seen before is a re-sent view."""
+        changed = set()
+        for event in events:
+            event_id = event.get("eventId")
+            if event_id:
+                if event_id in self.event_ids:
+                    continue
+                self.event_ids.add(event_id)
+            self.metrics["total_page_views"] += 1
+            changed.add("total_page_views")
+            visitor = event.get("visitorId")
+            if visitor and visitor not in self.visitors:
+                self.visitors.add(visitor)
+                self.metrics["total_visitors"] += 1
+                changed.add("total_visitors")
+        if not changed:
+            return
+        message = self.message("metrics_update", sorted(changed))
+        for queue in self._queues:
+            queue.put_nowait(message)
+
+
+def _frame(opcode, payload=b""):
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 1 << 16:
+        header += bytes([126]) + length.to_bytes(2, "big")
+    else:
+        header += bytes([127]) + length.to_bytes(8, "big")
+    return header + payload
+
+
+async def _read_frame(reader):
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), "big")
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), "big")
+    mask = await reader.readexactly(4) if second & 0x80 else b"\0\0\0\0"
+    payload = await reader.readexactly(length)
+    return first & 0x0F, bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+
+
+# --------------------------------------------------------------------------- server
+
+async def _read_request(reader):
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    method, target, _ = line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    body = await reader.readexactly(length) if length else b""
+    parts = urlsplit(target)
+    return Request(method.upper(), unquote(parts.path), parse_qsl(parts.query, keep_blank_values=True),
+                   headers, body)
+
+
+class StandIn:
+    """The HTTP + WebSocket server.  Use ``async with StandIn() as stand_in`` or ``serving()``."""
+
+    def __init__(self, seed_path=SEED_PATH, latency_ms=DEFAULT_LATENCY_MS, host="127.0.0.1", port=0):
+        self.store = Store.from_file(seed_path)
+        self.hub = MetricsHub(self.store.analytics)
+        self.latency = latency_ms / 1000
+        self.host = host
+        self.port = port
+        self._server = None
+        self._bridges = set()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        for task in self._bridges:
+            task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _serve(self, reader, writer):
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                if request.headers.get("upgrade", "").lower() == "websocket":
+                    await self._serve_websocket(request, reader, writer)
+                    break
+                await asyncio.sleep(self.latency)
+                writer.write(self.dispatch(request).encode())
+                await writer.drain()
+                if request.headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_websocket(self, request, reader, writer):
+        if not request.path.startswith("/functions/v1/public-analytics"):
+            writer.write(Response(404).encode())
+            return
+        key = request.headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        queue = self.hub.subscribe()
+
+        async def push():
+            while True:
+                writer.write(_frame(0x1, (await queue.get()).encode()))
+                await writer.drain()
+
+        pusher = asyncio.ensure_future(push())
+        try:
+            while True:
+                opcode, payload = await _read_frame(reader)
+                if opcode == 0x8:
+                    writer.write(_frame(0x8, payload[:2]))
+                    break
+                if opcode == 0x9:
+                    writer.write(_frame(0xA, payload))
+        finally:
+            pusher.cancel()
+            self.hub.unsubscribe(queue)
+
+    # ---- routing
+
+    def dispatch(self, request):
+        if request.method == "OPTIONS":
+            return Response(204)
+        try:
+            if request.path.startswith("/rest/v1/rpc/"):
+                return self._rpc(request, request.path[len("/rest/v1/rpc/"):])
+            if request.path.startswith("/rest/v1/"):
+                return self._postgrest(request, request.path[len("/rest/v1/"):])
+            if request.path.startswith("/auth/v1/"):
+                return self._gotrue(request, request.path[len("/auth/v1/"):])
+            if request.path.startswith("/api/Auth/"):
+                return self._employee_auth(request, request.path[len("/api/Auth/"):])
+            if request.path.startswith("/functions/v1/"):
+                return self._function(request, request.path[len("/functions/v1/"):])
+        except PostgrestError as exc:
+            return exc.response
+        except ValueError as exc:
+            return error(400, str(exc), "PGRST102")
+        return error(404, f"no route for {request.method} {request.path}")
+
+    def _bearer_user(self, request):
+        token = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        claims = token_claims(token)
+        return self.store.user_by_id(claims["sub"]) if claims else None
+
+    def _postgrest(self, request, name):
+        store = self.store
+        query = dict(request.params)
+        prefer = request.prefer()
+        if request.method in ("GET", "HEAD"):
+            rows, offset, total = store.select(name, request.params)
+        elif request.method == "POST":
+            body = request.json()
+            rows = body if isinstance(body, list) else [body]
+            on_conflict = None
+            ignore_duplicates = "resolution=ignore-duplicates" in prefer
+            if ignore_duplicates or "resolution=merge-duplicates" in prefer:
+                on_conflict = query.get("on_conflict", "id").split(",")
+            rows = store.insert(name, rows, on_conflict, ignore_duplicates)
+            offset, total = 0, len(rows)
+        elif request.method == "PATCH":
+            rows = store.update(name, request.params, request.json() or {})
+            offset, total = 0, len(rows)
+        elif request.method == "DELETE":
+            rows = store.delete(name, request.params)
+            offset, total = 0, len(rows)
+        else:
+            return error(405, f"method {request.method} not allowed")
+
+        if request.method != "GET":
+            if "return=representation" not in prefer:
+                return Response(201 if request.method == "POST" else 204)
+            columns, embeds = parse_select(query.get("select"))
+            rows = [store._shape(name, row, columns, embeds) for row in rows]
+
+        count = total if any(item.startswith("count=") for item in prefer) else "*"
+        headers = {"Content-Range": f"{offset}-{offset + len(rows) - 1}/{count}" if rows else f"*/{count}"}
+        if "vnd.pgrst.object" in request.headers.get("accept", ""):
+            if len(rows) != 1:
+                return error(406, "JSON object requested, multiple (or no) rows returned", "PGRST116")
+            return Response(200, rows[0], headers)
+        return Response(201 if request.method == "POST" else 200, rows, headers)
+
+    def _rpc(self, request, name):
+        function = self.store.functions.get(name)
+        if function is None:
+            return error(404, f"Could not find the function public.{name}", "PGRST202")
+        args = request.json() if request.method == "POST" else dict(request.params)
+        if name in self.store.CALLER_FUNCTIONS:
+            user = self._bearer_user(request)
+            return Response(200, function(args or {}, user["id"] if user else None))
+        return Response(200, function(args or {}))
+
+    def _session(self, user):
+        token = issue_token(user)
+        return {
+            "access_token": token, "token_type": "bearer", "expires_in": TOKEN_TTL_SECONDS,
+            "expires_at": int(time.time()) + TOKEN_TTL_SECONDS, "refresh_token": uuid.uuid4().hex,
+            "user": self._gotrue_user(user),
+        }
+
+    @staticmethod
+    def _gotrue_user(user):
+        return {"id": user["id"], "aud": "authenticated", "role": "authenticated", "email": user["email"],
+                "user_metadata": {"full_name": user["full_name"], "emp_id": user["emp_id"]},
+                "app_metadata": {"provider": "email"}}
+
+    def _gotrue(self, request, route):
+        body = request.json() or {}
+        if route == "token" and request.method == "POST":
+            user = self.store.find_user(body.get("email"))
+            if not user or user["password"] != body.get("password"):
+                return Response(400, {"error": "invalid_grant", "error_description": "Invalid login credentials"})
+            return Response(200, self._session(user))
+        if route == "signup" and request.method == "POST":
+            metadata = body.get("data") or {}
+            if self.store.find_user(body.get("email")):
+                return Response(422, {"msg": "User already registered"})
+            user = self.store.add_user(body["email"], body.get("password"), metadata.get("full_name", ""),
+                                       metadata.get("emp_id", ""))
+            return Response(200, self._session(user))
+        if route == "user":
+            user = self._bearer_user(request)
+            return Response(200, self._gotrue_user(user)) if user else Response(401, {"msg": "invalid JWT"})
+        if route == "logout":
+            return Response(204)
+        return error(404, f"no auth route {route}")
+
+    def _employee_auth(self, request, route):
+        body = request.json() or {}
+        if route == "login" and request.method == "POST":
+            user = self.store.find_user(body.get("email"))
+            if not user or user["password"] != body.get("password"):
+                return Response(401, {"message": "Invalid credentials"})
+            return Response(200, {"token": issue_token(user), "user": {
+                "id": user["id"], "email": user["email"], "fullName": user["full_name"],
+                "empId": user["emp_id"], "role": user["role"]}})
+        if route == "register" and request.method == "POST":
+            if self.store.find_user(body.get("email")) or self.store.find_user(body.get("empId")):
+                return Response(409, {"message": "User already exists"})
+            self.store.add_user(body.get("email", ""), body.get("password"), body.get("fullName", ""),
+                                body.get("empId", ""))
+            return Response(200, {"message": "Registration successful"})
+        return Response(404, {"message": f"no route {route}"})
+
+    def _function(self, request, name):
+        if name == "track-pageview" and request.method == "POST":
+            # One view, or {"events": [...]} from the batching client
+            body = request.json() or {}
+            events = body["events"] if isinstance(body.get("events"), list) else [body]
+            self.hub.record(events)
+            return Response(200, {"success": True, "received": len(events)})
+        if name == "fetch-admin-data":
+            attempts, _, _ = self.store.select("test_attempts", [
+                ("select", "*,profiles(email,full_name)"), ("order", "completed_at.desc")])
+            details = {row["user_id"]: row for row in self.store.table("user_details")}
+            return Response(200, {"data": [{**attempt, "userDetails": details.get(attempt["user_id"])}
+                                           for attempt in attempts]})
+        if name == "export-attempts":
+            return self._export_attempts()
+        return error(404, f"Function not found: {name}")
+
+    def _export_attempts(self):
+        """The CSV ``export-attempts`` streams, in one body; dates as en-US in UTC."""
+        def quoted(value):
+            return '"' + str(value or "N/A").replace('"', '""') + '"'
+
+        def when(value):
+            stamp = datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+            hour = stamp.hour % 12 or 12
+            return (f"{stamp.month}/{stamp.day}/{stamp.year}, {hour}:{stamp.minute:02}:{stamp.second:02} "
+                    f"{'AM' if stamp.hour < 12 else 'PM'}")
+
+        profiles = {row["user_id"]: row for row in self.store.table("profiles")}
+        details = {row["user_id"]: row for row in self.store.table("user_details")}
+        attempts = sorted(self.store.table("test_attempts"), key=lambda row: (row["completed_at"], row["id"]),
+                          reverse=True)
+        lines = [",".join(EXPORT_COLUMNS)]
+        for attempt in attempts:
+            profile = profiles.get(attempt["user_id"], {})
+            detail = details.get(attempt["user_id"], {})
+            lines.append(",".join([
+                *(quoted(profile.get(key)) for key in ("full_name", "emp_id", "email")),
+                *(quoted(detail.get(key)) for key in (
+                    "first_name", "last_name", "phone_number", "gender", "state", "city", "product_process",
+                    "designation", "father_name", "address", "qualification", "date_of_birth")),
+                str(attempt["score"]), str(attempt["percentage"]),
+                "Qualified" if attempt["qualified"] else "Not Qualified",
+                quoted(when(attempt["completed_at"])),
+            ]))
+        return Response(200, ("\n".join(lines) + "\n").encode(), {
+            "Content-Type": "text/csv; charset=utf-8",
+            "Content-Disposition": 'attachment; filename="test_attempts.csv"',
+            "X-Total-Count": str(len(attempts)),
+        })
+
+    # ---- Playwright bridge
+
+    def bridge_websocket(self, ws):
+        """``route_web_socket`` handler that feeds the analytics socket from the hub."""
+        queue = self.hub.subscribe()
+
+        async def push():
+            try:
+                while True:
+                    ws.send(await queue.get())
+            finally:
+                self.hub.unsubscribe(queue)
+
+        task = asyncio.ensure_future(push())
+        self._bridges.add(task)
+        task.add_done_callback(self._bridges.discard)
+        ws.on_close(lambda *_: task.cancel())
+
+
+# --------------------------------------------------------------------------- wiring
+
+_active = None
+
+
+def active():
+    """The stand-in new contexts are routed to, or None when running against the real backends."""
+    return _active
+
+
+def offline_requested():
+    return os.environ.get(OFFLINE_ENV) == "1"
+
+
+def routed(url):
+    path = urlsplit(url).path
+    return any(path.startswith(prefix) for prefix in ROUTED_PATHS)
+
+
+async def attach(context):
+    """Route ``context``'s backend traffic to the active stand-in; a no-op when there is none."""
+    stand_in = _active
+    if stand_in is None:
+        return
+
+    async def forward(route):
+        parts = urlsplit(route.request.url)
+        target = f"{stand_in.url}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+        await route.fulfill(response=await route.fetch(url=target))
+
+    await context.route(routed, forward)
+    await context.route_web_socket(re.compile(r"/functions/v1/public-analytics"), stand_in.bridge_websocket)
+
+
+@contextlib.asynccontextmanager
+async def serving(**kwargs):
+    """Start a stand-in and route every context created meanwhile to it."""
+    global _active
+    async with StandIn(**kwargs) as stand_in:
+        _active = stand_in
+        try:
+            yield stand_in
+        finally:
+            _active = None
+
+
+async def serve_forever(host, port, latency_ms):
+    async with StandIn(latency_ms=latency_ms, host=host, port=port) as stand_in:
+        print(f"stand-in listening on {stand_in.url}")
+        await asyncio.Event().wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency", type=int, default=DEFAULT_LATENCY_MS,
+                        help=f"fixed delay per HTTP response in ms (default: {DEFAULT_LATENCY_MS})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve_forever(args.host, args.port, args.latency))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
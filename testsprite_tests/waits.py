@@ -0,0 +1,95 @@
+"""Event-driven waits for the TC0xx scripts.
+
+The generated scripts slept ``page.wait_for_timeout(3000)`` before every click
+and fill, which costs about 3 s per step whether or not the page was ready.
+These helpers wait on the condition that actually matters instead:
+
+* ``click`` / ``fill`` wait for the locator to be actionable (attached,
+  visible, stable, enabled) and act as soon as it is;
+* ``submit`` clicks and then waits for the network to go idle, for buttons
+  that post a form;
+* ``expect_supabase`` waits for a specific PostgREST response.
+
+Set ``TESTSPRITE_LEGACY_WAITS=1`` to restore the old fixed sleep before each
+action; ``runner.py --compare`` uses it to report before/after timings.
+"""
+import os
+import re
+
+from playwright import async_api
+
+import perf
+from browser import BASE_URL
+
+# Upper bound for an element to become actionable after a page transition
+ACTION_TIMEOUT_MS = 10000
+
+# Upper bound for the network to settle after a submit; not reaching idle is not an error
+SETTLE_TIMEOUT_MS = 5000
+
+# The fixed pause the generated scripts used before every step
+LEGACY_DELAY_MS = 3000
+
+
+def legacy_waits():
+    """True when the scripts should reproduce the old fixed 3 s sleeps."""
+    return os.environ.get("TESTSPRITE_LEGACY_WAITS") == "1"
+
+
+async def _before_action(locator):
+    if legacy_waits():
+        await locator.page.wait_for_timeout(LEGACY_DELAY_MS)
+    else:
+        await locator.wait_for(state="visible", timeout=ACTION_TIMEOUT_MS)
+
+
+async def settle(page, timeout=SETTLE_TIMEOUT_MS):
+    """Wait until the page has had no network requests in flight for 500 ms."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except async_api.Error:
+        pass
+
+
+async def open_page(page, path="/"):
+    """Navigate to ``path`` on the app and wait for the document and its frames to load."""
+    await page.goto(f"{BASE_URL}{path}", wait_until="commit", timeout=10000)
+    for frame in page.frames:
+        try:
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+    await perf.mark(page, f"open {path}")
+
+
+async def click(locator):
+    """Click ``locator`` as soon as it is actionable."""
+    await _before_action(locator)
+    await locator.click(timeout=ACTION_TIMEOUT_MS)
+
+
+async def fill(locator, value):
+    """Fill ``locator`` with ``value`` as soon as it is actionable."""
+    await _before_action(locator)
+    await locator.fill(value, timeout=ACTION_TIMEOUT_MS)
+
+
+async def submit(locator):
+    """Click a submit button and wait for the requests it triggers to finish."""
+    await click(locator)
+    if not legacy_waits():
+        await settle(locator.page)
+
+
+def expect_supabase(page, table, method="GET", timeout=ACTION_TIMEOUT_MS):
+    """Context manager that waits for a PostgREST ``method`` request on ``table`` to respond.
+
+        async with expect_supabase(page, "test_attempts"):
+            await submit(login_button)
+    """
+    pattern = re.compile(rf"/rest/v1/{re.escape(table)}(\?|$)")
+
+    def matches(response):
+        return response.request.method == method and bool(pattern.search(response.url))
+
+    return page.expect_response(matches, timeout=timeout)
@@ -1,18 +1,200 @@
-import { defineConfig } from "vite";
+import { createServer, defineConfig, type Plugin, type Rollup, type ViteDevServer } from "vite";
 import react from "@vitejs/plugin-react-swc";
 import path from "path";
+import { createHash } from "crypto";
+import { gzipSync } from "zlib";
 import { componentTagger } from "lovable-tagger";
 
+// Gzipped size allowed for the JS the landing page needs before it can
+// render: the entry chunk plus every chunk it imports statically.
+// Override with BUNDLE_BUDGET_KB=<kb> npm run build
+const INITIAL_BUDGET_KB = Number(process.env.BUNDLE_BUDGET_KB ?? 250);
+
+// Third-party code that changes rarely gets its own long-cached chunks;
+// recharts only ever loads with the admin dashboard
+const vendorChunk = (id: string) => {
+  if (!id.includes("node_modules")) return undefined;
+  if (/[\\/]node_modules[\\/](react|react-dom|react-router|react-router-dom|@remix-run[\\/]router|scheduler)[\\/]/.test(id)) {
+    return "react";
+  }
+  if (/[\\/]node_modules[\\/]@supabase[\\/]/.test(id)) return "supabase";
+  if (/[\\/]node_modules[\\/](recharts|recharts-scale|d3-[^\\/]+|victory-vendor)[\\/]/.test(id)) return "charts";
+  return undefined;
+};
+
+const kb = (bytes: number) => (bytes / 1024).toFixed(1).padStart(8);
+
+// Prints every JS chunk's size after a build and fails it when the initial
+// chunks are over INITIAL_BUDGET_KB gzipped
+const bundleBudget = (budgetKb: number): Plugin => ({
+  name: "bundle-budget",
+  apply: "build",
+  generateBundle(_options, bundle) {
+    const chunks = Object.values(bundle).filter((item): item is Rollup.OutputChunk => item.type === "chunk");
+    const entry = chunks.find(chunk => chunk.isEntry);
+    if (!entry) return;
+
+    const initial = new Set<string>();
+    const visit = (fileName: string) => {
+      if (initial.has(fileName)) return;
+      initial.add(fileName);
+      (bundle[fileName] as Rollup.OutputChunk).imports.forEach(visit);
+    };
+    visit(entry.fileName);
+
+    const rows = chunks
+      .map(chunk => ({ fileName: chunk.fileName, raw: chunk.code.length, gzip: gzipSync(chunk.code).length }))
+      .sort((a, b) => b.gzip - a.gzip);
+    const initialGzip = rows.filter(row => initial.has(row.fileName)).reduce((sum, row) => sum + row.gzip, 0);
+
+    console.log(`\n${"chunk".padEnd(48)}${"raw kB".padStart(8)}${"gzip kB".padStart(9)}`);
+    rows.forEach(row => {
+      const marker = initial.has(row.fileName) ? " *" : "";
+      console.log(`${row.fileName.padEnd(48)}${kb(row.raw)} ${kb(row.gzip)}${marker}`);
+    });
+    console.log(`* initial: ${kb(initialGzip).trim()} kB gzip of a ${budgetKb} kB budget\n`);
+
+    if (initialGzip > budgetKb * 1024) {
+      this.error(`Initial JS is ${kb(initialGzip).trim()} kB gzipped, over the ${budgetKb} kB budget`);
+    }
+  },
+});
+
+const QUESTION_BANK = path.resolve(__dirname, "./src/data/questions-updated.ts");
+const QUESTION_SHARDS_ID = "virtual:question-shards";
+const RESOLVED_QUESTION_SHARDS_ID = "\0" + QUESTION_SHARDS_ID;
+// Where the dev server serves shards; a build emits them as hashed assets
+const DEV_SHARD_PREFIX = "/@question-shards/";
+
+interface QuestionShard {
+  key: string;
+  fileName: string;
+  source: string;
+  hash: string;
+}
+
+type Bank = { questions: { id: number; module: string; role: string }[]; modules: unknown[] };
+
+// One JSON shard per module and per role; a BOTH question is in both roles
+const toShards = ({ questions }: Bank): QuestionShard[] => {
+  const groups = new Map<string, Bank["questions"]>();
+  const add = (key: string, question: Bank["questions"][number]) => {
+    const group = groups.get(key);
+    if (group) group.push(question);
+    else groups.set(key, [question]);
+  };
+  questions.forEach(question => {
+    add(`module:${question.module}`, question);
+    (question.role === "BOTH" ? ["CO", "FRO"] : [question.role]).forEach(role => add(`role:${role}`, question));
+  });
+  return [...groups].map(([key, group]) => {
+    const source = JSON.stringify(group);
+    return {
+      key,
+      fileName: `questions-${key.replace(":", "-")}.json`,
+      source,
+      hash: createHash("sha256").update(source).digest("hex").slice(0, 16),
+    };
+  });
+};
+
+// Serves src/data/questions-updated.ts to the app as the per-module and
+// per-role JSON shards that src/data/questionShards.ts loads on demand, so
+// the bank is not compiled into any JS chunk the candidate flow loads.
+// The bank module itself stays the source of truth (the admin dashboard
+// still imports it).
+const questionShards = (): Plugin => {
+  let command: "build" | "serve" = "serve";
+  let devServer: ViteDevServer | undefined;
+
+  const loadBank = async (): Promise<Bank> => {
+    if (devServer) return (await devServer.ssrLoadModule(QUESTION_BANK)) as Bank;
+    const server = await createServer({
+      configFile: false,
+      logLevel: "error",
+      server: { middlewareMode: true, hmr: false },
+      appType: "custom",
+      optimizeDeps: { noDiscovery: true, include: [] },
+      resolve: { alias: { "@": path.resolve(__dirname, "./src") } },
+    });
+    try {
+      return (await server.ssrLoadModule(QUESTION_BANK)) as Bank;
+    } finally {
+      await server.close();
+    }
+  };
+
+  return {
+    name: "question-shards",
+    configResolved(config) {
+      command = config.command;
+    },
+    configureServer(server) {
+      devServer = server;
+      server.middlewares.use(async (req, res, next) => {
+        if (!req.url?.startsWith(DEV_SHARD_PREFIX)) return next();
+        const fileName = req.url.slice(DEV_SHARD_PREFIX.length).split("?")[0];
+        const shard = toShards(await loadBank()).find(item => item.fileName === fileName);
+        if (!shard) {
+          res.statusCode = 404;
+          res.end();
+          return;
+        }
+        res.setHeader("Content-Type", "application/json");
+        res.end(shard.source);
+      });
+    },
+    resolveId(id) {
+      return id === QUESTION_SHARDS_ID ? RESOLVED_QUESTION_SHARDS_ID : undefined;
+    },
+    async load(id) {
+      if (id !== RESOLVED_QUESTION_SHARDS_ID) return undefined;
+      this.addWatchFile(QUESTION_BANK);
+      const bank = await loadBank();
+      const entries = toShards(bank).map(shard => {
+        const url = command === "build"
+          ? `import.meta.ROLLUP_FILE_URL_${this.emitFile({ type: "asset", name: shard.fileName, source: shard.source })}`
+          : JSON.stringify(DEV_SHARD_PREFIX + shard.fileName);
+        return `  ${JSON.stringify(shard.key)}: { url: ${url}, hash: ${JSON.stringify(shard.hash)} },`;
+      });
+      return [
+        "export default {",
+        `shards: {\n${entries.join("\n")}\n},`,
+        `modules: ${JSON.stringify(bank.modules)},`,
+        `order: ${JSON.stringify(bank.questions.map(question => question.id))},`,
+        "};",
+      ].join("\n");
+    },
+    handleHotUpdate({ file, server }) {
+      if (file !== QUESTION_BANK) return;
+      const manifest = server.moduleGraph.getModuleById(RESOLVED_QUESTION_SHARDS_ID);
+      if (manifest) server.moduleGraph.invalidateModule(manifest);
+    },
+  };
+};
+
 // https://vitejs.dev/config/
 export default defineConfig(({ mode }) => ({
   server: {
     host: "::",
     port: 8080,
   },
-  plugins: [react(), mode === "development" && componentTagger()].filter(Boolean),
+  plugins: [
+    react(),
+    mode === "development" && componentTagger(),
+    questionShards(),
+    bundleBudget(INITIAL_BUDGET_KB),
+  ].filter(Boolean),
   resolve: {
     alias: {
       "@": path.resolve(__dirname, "./src"),
     },
   },
+  build: {
+    rollupOptions: {
+      output: {
+        manualChunks: vendorChunk,
+      },
+    },
+  },
 }));